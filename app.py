@@ -3,28 +3,29 @@ import json
 from pathlib import Path
 from typing import Optional, Tuple
 
-from PySide2 import QtCore, QtWidgets
+from PySide2 import QtCore
 
 from EntityLibPy import EntityLib, Property, Prop_PrefabInfo
 from PySide2.QtCore import QModelIndex, Qt, QSettings, QDir
-from PySide2.QtGui import QFontInfo, QFont, QColor, QPixmap
+from PySide2.QtGui import QPixmap
 from PySide2.QtWidgets import QFileDialog
 
 from PropertyEditor.model.model import Model
+from PropertyEditor.model.resources import RoleResources
 from PropertyEditor.properties._meta import (
     PropertyItem,
     ContainerPropertyItem,
     BaseItem,
 )
-from PropertyEditor.utils import timer
+from PropertyEditor.utils import stat_cache, timer
 from PropertyEditor.widgets.tab import Tab
 from PropertyEditor.widgets.tabs import Tabs
 from PropertyEditor.widgets.treeview import TreeView
 from PropertyEditor.widgets.widgets import FileTypeChooser
 from PropertyEditor.widgets.window import EditorWindow
 from PropertyEditor.config import Config
-from PropertyEditor.editors.add_back import AddBackItem
-from PropertyEditor.properties.other import InstanceOfItem
+from PropertyEditor.properties.other import DeletedItem, InstanceOfItem
+from PropertyEditor.properties.plan import clear_child_plans
 
 try:
     from PropertyEditor import user_callbacks
@@ -41,6 +42,11 @@ class PropertyEditorApp:
 
     def __init__(self, entity_lib: EntityLib):
         self.config = Config()
+        self.resources = RoleResources()
+
+        # Plans are shared by schema name, which another EntityLib can load differently
+        clear_child_plans()
+        stat_cache.ttl = self.config.stat_cache_ttl
 
         self.rawdata_path: Path = Path(str(entity_lib.rawdata_path))
         self.default_path: Path = Path(str(entity_lib.rawdata_path))
@@ -165,11 +171,7 @@ class PropertyEditorApp:
         return self._get_decoration_pixmap(rgb)
 
     def _get_decoration_pixmap(self, rgb: Tuple[int, int, int]) -> QPixmap:
-        color = QColor()
-        color.setRgb(*rgb)
-        pixmap = QPixmap(5, 20)
-        pixmap.fill(color)
-        return pixmap
+        return self.resources.get_pixmap(rgb)
 
     def _get_save_path(self, prop: PropertyItem) -> Optional[Path]:
         base_filter = "All (*.*)"
@@ -264,9 +266,17 @@ class PropertyEditorApp:
 
     def save_to_prefab(self, prop: PropertyItem, path: str):
         prefab, file_path = prop.save_to_prefab(path)
+        prop.refresh_status(recursive=True)
         if prefab and file_path:
             with self.save_context(file_path.as_posix()):
                 prefab.node.root_node.save(file_path.as_posix())
+            self.invalidate_prefab_histories()
+
+    def invalidate_prefab_histories(self) -> None:
+        """Forget prefab histories of all the opened files."""
+        for index in range(self._get_tabs().count()):
+            widget = self._get_tabs().widget(index)
+            widget.tree_view.source_model.loaded_item.invalidate_prefab_histories()
 
     def save_as(self) -> None:
         model = self.get_tree_view().source_model
@@ -297,6 +307,7 @@ class PropertyEditorApp:
 
         with self.save_context(new_path.as_posix()):
             model.loaded_item.lib_property.save(new_path.as_posix())
+        stat_cache.invalidate(new_path)
 
         model.loaded_file = new_path
         self._get_tab().set_file_name(new_path)
@@ -331,6 +342,7 @@ class PropertyEditorApp:
         if file_path:
             with self.save_context(file_path.as_posix()):
                 loaded_property.lib_property.save(file_path.as_posix())
+            stat_cache.invalidate(file_path)
 
             current_model.loaded_file = file_path
             current_tab.set_file_name(file_path)
@@ -344,28 +356,18 @@ class PropertyEditorApp:
                 return prop.get_value()
 
         elif role == Qt.FontRole:
-            font_size = 8
-            font = QtWidgets.QApplication.font()
-            font_family = QFontInfo(font).family()
-
             if prop.is_set:
-                return QFont(font_family, font_size, QFont.Bold)
+                return self.resources.get_font(bold=True)
             elif not prop.has_prefab:
-                font = QFont(font_family, font_size)
-                font.setItalic(True)
-                return font
+                return self.resources.get_font(italic=True)
 
-            return QFont(font_family, font_size)
+            return self.resources.get_font()
 
         elif role == Qt.ForegroundRole:
-            color = QColor()
-            color.setRgb(*prop.get_config_color(self.config))
-
             # Set alpha 0 to column 1 data
             # Avoid seeing text under custom widgets
-            if column == 1:
-                color.setAlpha(0)
-            return color
+            alpha = 0 if column == 1 else 255
+            return self.resources.get_color(prop.get_config_color(self.config), alpha)
 
         elif role == Qt.DecorationRole:
             if column != 0:
@@ -389,30 +391,14 @@ class PropertyEditorApp:
 
     @contextlib.contextmanager
     def keep_instance_of(self, prop: BaseItem, instance_of: Optional[str]):
-        prop.instance_of = None
         yield
         if instance_of:
             prop.lib_property.instance_of = instance_of
-            prop.add_instance_of()
-
-    def revert_and_remove_child_rows(
-        self, model: Model, prop: BaseItem, source_index: QModelIndex
-    ):
-        model.beginRemoveRows(source_index, 0, prop.child_count())
-        prop.revert_to_prefab()
-        prop.child_items = []
-        model.endRemoveRows()
-
-    def get_child_rows(self, model: Model, prop: BaseItem, source_index: QModelIndex):
-        new_size = prop.lib_property.size - 1
-        if prop.lib_property.instance_of:
-            new_size += 1
-
-        model.beginInsertRows(source_index, 0, new_size)
-        prop.get_child_items()
-        model.endInsertRows()
+            prop.structure_changed()
+            prop.invalidate_prefab_histories()
 
     def after_revert(self, prop: BaseItem, source_index: QModelIndex):
+        prop.refresh_status(recursive=True)
         prop.reset_editors()
         if hasattr(prop.editor, "updated"):
             prop.editor.updated()
@@ -425,8 +411,11 @@ class PropertyEditorApp:
         # but this is due to PySide2 strange Model-Control system
         # that force us to launch control commands before and after updating the model
         # to make it work
-        if prop.editor and isinstance(prop.editor, AddBackItem):
-            prop.editor.add_back_item()
+        if isinstance(prop, DeletedItem):
+            # The row may have no editor, see Config.editor_mode
+            model.add_back_item(source_index.parent(), prop)
+            if hasattr(prop.parent.editor, "updated"):
+                prop.parent.editor.updated()
         elif isinstance(prop, InstanceOfItem):
             prop = prop.parent
             source_index = source_index.parent()
@@ -434,9 +423,10 @@ class PropertyEditorApp:
         with self.keep_instance_of(
             prop, prop.lib_property.instance_of if prop.lib_property else None
         ):
-            self.revert_and_remove_child_rows(model, prop, source_index)
+            prop.revert_to_prefab()
 
-        self.get_child_rows(model, prop, source_index)
+        # Only rows of children added or removed by the revert are updated
+        model.sync_child_rows(source_index)
         self.after_revert(prop, source_index)
 
     def show_all_editors(self):
@@ -448,6 +438,7 @@ class PropertyEditorApp:
 
         with self.window.keep_expanded_between_tabs():
             prop.lib_property.instance_of = value
+            prop.structure_changed()
             prop.value = value
             self.reopen_file()
             self.set_current_tab_edited()
@@ -463,5 +454,6 @@ class PropertyEditorApp:
 
     def paste(self, prop: BaseItem, only_overrides=False) -> None:
         self.window.copy_data.paste_onto_property(prop, only_overrides=only_overrides)
+        prop.refresh_status(recursive=True)
         prop.reset_editors()
         self.set_current_tab_edited()
@@ -0,0 +1,212 @@
+"""Measure the PropertyEditor caches on a real file.
+
+Example:
+    python -m PropertyEditor.benchmarks path/to/rawdata path/to/schemas -f file.entity
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Tuple
+
+from EntityLibPy import EntityLib
+from PySide2 import QtCore, QtWidgets
+
+from PropertyEditor.app import PropertyEditorApp
+from PropertyEditor.editors.pool import EditorPool, editor_pool
+from PropertyEditor.model.model import Model
+from PropertyEditor.model.resources import RoleResources, resources_cache
+from PropertyEditor.properties._meta import BaseItem, ContainerPropertyItem
+from PropertyEditor.properties.status import StatusSnapshot, status_cache
+from PropertyEditor.widgets.treeview import TreeView
+
+REPAINT_ROLES = [
+    QtCore.Qt.DisplayRole,
+    QtCore.Qt.FontRole,
+    QtCore.Qt.ForegroundRole,
+    QtCore.Qt.DecorationRole,
+    QtCore.Qt.ToolTipRole,
+]
+
+
+def repaint(model: Model) -> int:
+    """Get all the data a view needs to paint every row, as a full repaint would."""
+    rows = 0
+    for index in model.iter_indexes():
+        rows += 1
+        for column in range(model.columnCount(index)):
+            column_index = model.index(index.row(), column, index.parent())
+            for role in REPAINT_ROLES:
+                model.data(column_index, role)
+    return rows
+
+
+def time_repaints(model: Model, repaints: int) -> Tuple[int, float]:
+    """Get the rows count and the mean duration of a repaint."""
+    start = time.perf_counter()
+    for _ in range(repaints):
+        rows = repaint(model)
+    return rows, (time.perf_counter() - start) / repaints
+
+
+def benchmark_status(model: Model, repaints: int) -> None:
+    """Time repaints with each status flag read from EntityLib, then from snapshots.
+
+    Snapshots are disabled for the first run, see StatusSnapshot.enabled.
+    EntityLib reads are counted per flag in the first run, per row in the second.
+    """
+    try:
+        StatusSnapshot.enabled = False
+        status_cache.reset()
+        rows, before = time_repaints(model, repaints)
+        flags_read = status_cache.misses / repaints
+
+        StatusSnapshot.enabled = True
+        status_cache.reset()
+        rows, after = time_repaints(model, repaints)
+        rows_read = status_cache.misses / repaints
+    finally:
+        StatusSnapshot.enabled = True
+
+    print(f"Repaint of {rows} rows:")
+    print(
+        f"  Flags read from EntityLib: {before:.4f}s"
+        f" ({flags_read:.0f} flags read from EntityLib)"
+    )
+    print(
+        f"  Flags read from snapshots: {after:.4f}s"
+        f" ({rows_read:.0f} rows read from EntityLib)"
+    )
+
+
+def benchmark_resources(model: Model, repaints: int) -> None:
+    """Time repaints and count Qt objects allocated, without then with resources.
+
+    Resources are disabled for the first run, see RoleResources.enabled.
+    """
+    resources = model.app.resources
+    try:
+        RoleResources.enabled = False
+        resources.invalidate()
+        resources_cache.reset()
+        _, before = time_repaints(model, repaints)
+        allocated_before = resources_cache.misses / repaints
+
+        RoleResources.enabled = True
+        resources_cache.reset()
+        _, after = time_repaints(model, repaints)
+        allocated_after = resources_cache.misses / repaints
+    finally:
+        RoleResources.enabled = True
+
+    print("Role resources per repaint:")
+    print(f"  Without resources: {before:.4f}s, {allocated_before:.0f} Qt objects")
+    print(f"  With resources: {after:.4f}s, {allocated_after:.2f} Qt objects")
+
+
+def time_editors(
+    tree_view: TreeView, indexes: List[QtCore.QModelIndex], repeats: int
+) -> Tuple[float, float]:
+    """Get the mean duration of opening and closing all editors, and editors built."""
+    editor_pool.counter.reset()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for index in indexes:
+            tree_view.openPersistentEditor(index)
+        for index in indexes:
+            tree_view.closePersistentEditor(index)
+        QtWidgets.QApplication.processEvents()
+    duration = (time.perf_counter() - start) / repeats
+    return duration, editor_pool.counter.misses / repeats
+
+
+def benchmark_editors(tree_view: TreeView, repeats: int) -> None:
+    """Time editors of all rows opened and closed, without then with the pool.
+
+    The pool is disabled for the first run, see EditorPool.enabled.
+    """
+    indexes = [
+        tree_view.proxy_model.mapFromSource(index)
+        for index in tree_view.source_model.iter_indexes()
+    ]
+
+    try:
+        EditorPool.enabled = False
+        editor_pool.clear()
+        before, built_before = time_editors(tree_view, indexes, repeats)
+
+        EditorPool.enabled = True
+        after, built_after = time_editors(tree_view, indexes, repeats)
+    finally:
+        EditorPool.enabled = True
+
+    print(f"Editors of {len(indexes)} rows opened:")
+    print(f"  Without pool: {before:.4f}s, {built_before:.0f} editors built")
+    print(f"  With pool: {after:.4f}s, {built_after:.2f} editors built")
+    print(f"  Live widgets: {editor_pool.live}")
+
+
+def build_all_items(root_item: BaseItem) -> int:
+    """Build the whole hierarchy of items, and get the items count."""
+    count = 0
+    items = [root_item]
+    while items:
+        item = items.pop()
+        count += 1
+        if item.is_container:
+            items.extend(item._get_child_items(child_level=0))
+    return count
+
+
+def benchmark_memory(entity_lib: EntityLib, file_to_open: str) -> None:
+    """Measure memory used by items when the whole file is built."""
+    lib_prop = entity_lib.load_property(Path(file_to_open).as_posix())
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    root_item = ContainerPropertyItem(None, lib_prop, "Property", "Value")
+    count = build_all_items(root_item)
+
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    print(f"Memory of {count} items: {used / 1024 / 1024:.2f} MB")
+    print(f"  Bytes per item: {used / count:.0f}")
+
+
+def main(entity_lib: EntityLib, file_to_open: str, repaints: int = 10) -> int:
+    q_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+    editor = PropertyEditorApp(entity_lib)
+    editor.load_file(Path(file_to_open))
+    model = editor.get_tree_view().source_model
+
+    benchmark_status(model, repaints)
+    benchmark_resources(model, repaints)
+    benchmark_editors(editor.get_tree_view(), repaints)
+    benchmark_memory(entity_lib, file_to_open)
+
+    q_app.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("rawdata_path", help="Entity library rawdata_path")
+    parser.add_argument("schema_path", help="Entity library schema path")
+    parser.add_argument(
+        "-f", "--file", help="Specify file to open", type=str, required=True
+    )
+    parser.add_argument(
+        "-r", "--repaints", help="Number of repaints to measure", type=int, default=10
+    )
+    args = parser.parse_args()
+
+    main(
+        EntityLib(args.rawdata_path, args.schema_path),
+        file_to_open=args.file,
+        repaints=args.repaints,
+    )
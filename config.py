@@ -25,5 +25,31 @@ class Config:
         DataKind.object,
     ]
     default_dir_key: str = "default_dir"
+    # QSettings group of the expanded rows saved per file
+    expanded_key: str = "expanded"
+    # Max number of files whose expanded rows are saved, the oldest are removed
+    expanded_max_files: int = 100
+    # Max number of child rows built at once when a row is expanded or scrolled
+    fetch_page_size: int = 500
+    # Seconds before files existence is checked again on disk
+    stat_cache_ttl: float = 10.0
+    # Milliseconds without typing before the filter box text is searched
+    search_delay: int = 300
+    # Search results indexed at once on the UI thread, between two events
+    search_chunk_size: int = 2000
+    # Search matches whose rows are built at once on the UI thread, between two events
+    search_fetch_chunk_size: int = 50
+    # Max number of matches whose rows are built by a search, the rows of the others
+    # are built and filtered when their parents are expanded
+    search_fetch_limit: int = 1000
+    # "model" hides filtered rows with the model's FilterEngine, "proxy" uses Proxy
+    filter_engine: str = "model"
+    # "paint" lets the Delegate paint editors and only creates the hovered or current
+    # ones, "persistent" opens an editor on the rows around the viewport
+    editor_mode: str = "paint"
+    # Max number of editors created at once in "paint" editor mode
+    max_live_editors: int = 20
+    # Rows above and below the viewport with an editor in "persistent" editor mode
+    editor_window_margin: int = 10
     file_types = []
     color: ColorConfig = ColorConfig()
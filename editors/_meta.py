@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+import contextlib
+from typing import Any, Hashable, TYPE_CHECKING
 
 from PySide2 import QtCore, QtWidgets
 
@@ -32,6 +33,13 @@ def update_model(func):
 class BaseEditor(QtWidgets.QWidget):
     """This class is meant to be used with a QWidget."""
 
+    # Editors of the class can be reused for other items by the EditorPool,
+    # their widgets must only depend on the item through get_pool_key() and rebind()
+    poolable = False
+
+    # Key of the EditorPool the editor was built for, None when not pooled
+    pool_key = None
+
     def __init__(
         self,
         item: BaseItem,
@@ -42,6 +50,8 @@ class BaseEditor(QtWidgets.QWidget):
         self.item = item
         self.source_index = source_index
         self.related = []
+        # Editors of child items shown inside this one, see create_related_connection()
+        self.child_editors = []
 
         # As set_editor_value() is automatically triggered by the Model() to
         # set the editor's data, but as we don't want to update the property's value
@@ -60,6 +70,20 @@ class BaseEditor(QtWidgets.QWidget):
         #     return self.source_index.model
         return self.source_index.model()
 
+    @staticmethod
+    def get_pool_key(item: BaseItem, *args: Any) -> Hashable:
+        """Get what the widgets depend on besides the class, to pool the editor."""
+        return None
+
+    def rebind(self, item: BaseItem, source_index: QtCore.QModelIndex) -> None:
+        """Bind the editor to another item, when reused by the EditorPool.
+
+        The value is set afterwards by the Delegate, see Delegate.setEditorData().
+        """
+        self.item = item
+        self.source_index = source_index
+        self.related = []
+
     @lock_model_update
     def set_editor_value(self, data: Any):
         self._set_editor_value(data)
@@ -83,22 +107,49 @@ class BaseEditor(QtWidgets.QWidget):
     def _set_editor_value(self, value):
         raise NotImplementedError
 
+    def link_related(self, editor: BaseEditor) -> None:
+        """Show values set in one of the editors of an item in the other one."""
+        self.related.append(editor)
+        editor.related.append(self)
+
+    def unlink_related(self) -> None:
+        """Remove the links of the editor and its child editors, once it's closed."""
+        for editor in [self, *self.child_editors]:
+            for related in editor.related:
+                with contextlib.suppress(RuntimeError, ValueError):
+                    related.related.remove(editor)
+            editor.related = []
+
+    def link_parent_editors(self) -> None:
+        """Link with the editors of the item shown inside the editors of its parents.
+
+        The row's editor may be created after or without them, see Config.editor_mode.
+        """
+        parent = self.item.parent
+        while parent is not None:
+            for editor in getattr(parent.editor, "child_editors", ()):
+                if editor.item is self.item and editor not in self.related:
+                    self.link_related(editor)
+            parent = parent.parent
+
     def create_related_connection(
         self, child_property: BaseItem, child_index: QtCore.QModelIndex
     ):
-
-        # Ensure child has his own editor before creating the MultiChild one
-        if not child_property.editor:
-            child_property.create_editor(child_index)
-
         editor = child_property.get_editor(child_index)
         editor.set_editor_value(child_property.value)
+        self.child_editors.append(editor)
 
-        child_property.editor.related.append(editor)
-        editor.related.append(child_property.editor)
+        # The child row may only be painted by the Delegate, see Config.editor_mode
+        if child_property.editor:
+            editor.link_related(child_property.editor)
         return editor
 
     def update_parent_editor_size(self):
-        self.item.parent.editor.prop_size.update()
-        if hasattr(self.item.parent.editor, "set_remove_button_visibility"):
-            self.item.parent.editor.set_remove_button_visibility()
+        # The parent row may only be painted by the Delegate, see Config.editor_mode
+        parent_editor = self.item.parent.editor
+        if not parent_editor:
+            return
+
+        parent_editor.prop_size.update()
+        if hasattr(parent_editor, "set_remove_button_visibility"):
+            parent_editor.set_remove_button_visibility()
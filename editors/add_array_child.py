@@ -12,6 +12,7 @@ class EditorAddArrayChild(EditorChildrenManager):
             self.updated()
 
     def remove_row(self) -> None:
+        self.model.fetch_all(self.source_index)
         row = self.item.child_count() - 1
         if row is not None and self.model.remove_child(self.source_index, row):
             self.updated()
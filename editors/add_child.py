@@ -14,6 +14,8 @@ from PropertyEditor.widgets.widgets import (
 class EditorChildrenManager(BaseEditor):
     """Editor allowing user to add a new child property."""
 
+    poolable = True
+
     def __init__(self, item, source_index, parent: QtWidgets.QWidget = None):
         """Set widgets and item."""
         super().__init__(item, source_index, parent=parent)
@@ -22,6 +24,10 @@ class EditorChildrenManager(BaseEditor):
         self._set_options()
         self.updated()
 
+    def rebind(self, item, source_index) -> None:
+        super().rebind(item, source_index)
+        self.updated()
+
     def _create_ui(self):
         layout = EditorHBoxLayout(parent=self)
         layout.setAlignment(QtCore.Qt.AlignRight)
@@ -74,14 +80,13 @@ class EditorChildrenManager(BaseEditor):
                 self.updated()
 
     def get_row_to_remove(self) -> Optional[int]:
+        self.model.fetch_all(self.source_index)
         if not self.item.child_items:
             return None
 
         result = self.open_choice_popup(add_mode=False)
         if result:
-            for i, prop in enumerate(self.item.child_items):
-                if prop.name == result:
-                    return i
+            return self.item.get_child_row(result)
 
         return None
 
@@ -5,6 +5,8 @@ from PropertyEditor.properties._meta import ContainerPropertyItem
 
 
 class EditorCheckbox(QtWidgets.QCheckBox, BaseEditor):
+    poolable = True
+
     def __init__(
         self,
         prop: ContainerPropertyItem,
@@ -16,6 +18,7 @@ class EditorCheckbox(QtWidgets.QCheckBox, BaseEditor):
         self.source_index = source_index
         self.item = prop
         self.related = []
+        self.child_editors = []
 
         self._set_options()
 
@@ -24,6 +24,7 @@ class EditorColor(BaseEditor):
         """Initialize."""
         super().__init__(prop, source_index, parent=parent)
 
+        self.item.fetch_child_items(source_index)
         self.rows = self.item.child_count()
         self.spins = []
         self.color = QtGui.QColor(*[0.0 for _ in range(self.rows)])
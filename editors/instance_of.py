@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from PropertyEditor.editors.path import EditorPath
+from PropertyEditor.utils import stat_cache
 
 
 class EditorInstanceOf(EditorPath):
@@ -11,7 +12,8 @@ class EditorInstanceOf(EditorPath):
         if (not value and not self.item.value) or value == self.item.value:
             return
 
-        if not Path(self.source_index.model().app.rawdata_path, value).is_file():
+        rawdata_path = self.source_index.model().app.rawdata_path
+        if not stat_cache.is_file(Path(rawdata_path, value)):
             return
 
         self.model.app.update_instance_of(self.source_index, self.item, value)
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 
 class EditorLineEdit(BaseEditor):
+    poolable = True
+
     def __init__(
         self,
         prop: Union[ContainerPropertyItem, PropertyItem],
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, TYPE_CHECKING, Union
+from typing import Hashable, List, TYPE_CHECKING, Union
 
 from PySide2 import QtCore, QtWidgets
 
@@ -8,10 +8,16 @@ from PropertyEditor.editors._meta import BaseEditor
 from PropertyEditor.widgets.widgets import EditorHBoxLayout, BetterScrollComboBox
 
 if TYPE_CHECKING:
-    from PropertyEditor.properties._meta import PropertyItem, ContainerPropertyItem
+    from PropertyEditor.properties._meta import (
+        BaseItem,
+        ContainerPropertyItem,
+        PropertyItem,
+    )
 
 
 class EditorList(BaseEditor):
+    poolable = True
+
     def __init__(
         self,
         prop: Union[ContainerPropertyItem, PropertyItem],
@@ -25,6 +31,10 @@ class EditorList(BaseEditor):
         self._create_ui(values)
         self._set_options()
 
+    @staticmethod
+    def get_pool_key(item: BaseItem, values: list) -> Hashable:
+        return tuple(values)
+
     def _create_ui(self, values: List[str]):
         self.combobox = BetterScrollComboBox(self)
         for val in values:
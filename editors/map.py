@@ -57,11 +57,7 @@ class EditorAddMapChild(BaseEditor):
         )
 
         if enum_values:
-            missing = [
-                e
-                for e in enum_values
-                if e not in [c.name for c in self.item.child_items]
-            ]
+            missing = [e for e in enum_values if not self.item.has_child(e)]
             if missing:
                 # Deactivate in case the only missing item contains "count"
                 if len(missing) == 1 and "count" in missing[0].lower():
@@ -80,9 +76,7 @@ class EditorAddMapChild(BaseEditor):
             .linear_items[0]
             .sub_schema.enum_values
         )
-        missing = [
-            e for e in enum_values if e not in [c.name for c in self.item.child_items]
-        ]
+        missing = [e for e in enum_values if not self.item.has_child(e)]
 
         dialog = QtWidgets.QInputDialog()
         dialog.setComboBoxItems(missing)
@@ -158,6 +152,7 @@ class EditorMapItem(BaseEditor):
 
         self.value_widget = None
         self.union_type_widget = None
+        self.item.fetch_child_items(source_index)
 
         self._create_ui()
         self._set_options()
@@ -173,9 +168,6 @@ class EditorMapItem(BaseEditor):
                 )
                 self.get_value_widget(child, child_index)
 
-                if not child.editor:
-                    child.create_editor(child_index)
-
                 self.union_type_widget = self.create_related_connection(
                     child, child_index
                 )
@@ -209,9 +201,12 @@ class EditorMapItem(BaseEditor):
     ) -> None:
 
         if self.value_widget:
+            self.value_widget.unlink_related()
+            self.child_editors.remove(self.value_widget)
             self.value_widget.deleteLater()
             self.value_widget = None
 
+        self.model.ensure_fetched(parent_index)
         for j, child in enumerate(parent.child_items):
             if child.lib_property.schema.data_kind in [
                 DataKind.string,
@@ -230,12 +225,7 @@ class EditorMapItem(BaseEditor):
     def remove_row(self) -> None:
         # Update source index as it may have changed if
         # previous row has already been removed
-        row = 0
-        for i in range(self.item.parent.child_count()):
-            index = self.model.index(i, 1, self.source_index.parent())
-            if self.item.name == self.model.get_item(index).name:
-                row = i
-                break
+        row = self.item.index_in_parent()
 
         if self.model.remove_child(self.source_index.parent(), row):
             self.model.add_deleted_items(self.source_index.parent())
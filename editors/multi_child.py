@@ -26,7 +26,7 @@ class EditorMultiChild(BaseEditor):
         super().__init__(prop, source_index, parent=parent)
 
         self.labels = []
-        self.child_editors = []
+        self.item.fetch_child_items(source_index)
 
         self._create_ui()
         self._set_options()
@@ -53,7 +53,6 @@ class EditorMultiChild(BaseEditor):
             )
             editor.setFixedHeight(self.EDITOR_HEIGHT)
             main_layout.addWidget(editor)
-            self.child_editors.append(editor)
 
     def _set_options(self) -> None:
         self.setStyleSheet("QtWidgets.QLabel {text-align: center};")
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import contextlib
+import time
+from typing import Any, Dict, Hashable, List, Tuple, Type, TYPE_CHECKING
+
+from PySide2 import QtCore, QtWidgets
+
+from PropertyEditor.utils import CacheCounter
+
+if TYPE_CHECKING:
+    from PropertyEditor.editors._meta import BaseEditor
+    from PropertyEditor.properties._meta import BaseItem
+
+
+class EditorPool:
+    """Idle editors by class and pool key, rebound to new items instead of built again.
+
+    Editors released by the Delegate are kept hidden and without parent,
+    only for the classes with BaseEditor.poolable, and only max_idle per key.
+    A pooled editor is bound to its new item through BaseEditor.rebind().
+    """
+
+    # When disabled, no editor is kept and each one is built as it was before,
+    # only used to benchmark the pool
+    enabled = True
+
+    def __init__(self, max_idle: int = 50):
+        """Initialize."""
+        self.max_idle = max_idle
+        self.counter = CacheCounter("Editor pool")
+
+        # Editors built and not deleted yet, and seconds spent to build them
+        self.live = 0
+        self.construction_time = 0.0
+
+        self._idle: Dict[Tuple[Type[BaseEditor], Hashable], List[BaseEditor]] = {}
+
+    def acquire(
+        self,
+        editor_class: Type[BaseEditor],
+        item: BaseItem,
+        source_index: QtCore.QModelIndex,
+        *args: Any,
+        parent: QtWidgets.QWidget = None,
+    ) -> BaseEditor:
+        """Get an idle editor rebound to the item, or build a new one.
+
+        Extra args are passed to the editor's constructor and get_pool_key().
+        """
+        if not editor_class.poolable:
+            return self._build(editor_class, item, source_index, *args, parent=parent)
+
+        key = (editor_class, editor_class.get_pool_key(item, *args))
+        idle = self._idle.get(key)
+        while idle:
+            editor = idle.pop()
+            try:
+                editor.setParent(parent)
+            except RuntimeError:
+                # The C++ editor was deleted while idle
+                continue
+
+            self.counter.hit()
+            editor.rebind(item, source_index)
+            return editor
+
+        editor = self._build(editor_class, item, source_index, *args, parent=parent)
+        editor.pool_key = key
+        return editor
+
+    def _build(
+        self,
+        editor_class: Type[BaseEditor],
+        item: BaseItem,
+        source_index: QtCore.QModelIndex,
+        *args: Any,
+        parent: QtWidgets.QWidget = None,
+    ) -> BaseEditor:
+        self.counter.miss()
+        start = time.perf_counter()
+        editor = editor_class(item, source_index, *args, parent=parent)
+        self.construction_time += time.perf_counter() - start
+
+        self.live += 1
+        editor.destroyed.connect(self._editor_destroyed)
+        return editor
+
+    def _editor_destroyed(self, *args) -> None:
+        self.live -= 1
+
+    def release(self, editor: BaseEditor) -> bool:
+        """Keep an editor closed by the view to reuse it, or get False to delete it."""
+        if not self.enabled or editor.pool_key is None:
+            return False
+
+        idle = self._idle.setdefault(editor.pool_key, [])
+        if len(idle) >= self.max_idle:
+            return False
+
+        editor.hide()
+        editor.setParent(None)
+        idle.append(editor)
+        return True
+
+    def clear(self) -> None:
+        """Delete all idle editors."""
+        for editors in self._idle.values():
+            for editor in editors:
+                with contextlib.suppress(RuntimeError):
+                    editor.deleteLater()
+        self._idle.clear()
+
+    def __repr__(self) -> str:
+        idle = sum(len(editors) for editors in self._idle.values())
+        return (
+            f"{self.counter} | {self.live} live widgets ({idle} idle)"
+            f" | built in {self.construction_time:.3f}s"
+        )
+
+
+editor_pool = EditorPool()
@@ -56,13 +56,7 @@ class EditorPrimitiveSetString(BaseEditor):
         self.line_edit.setText(str(value))
 
     def remove_row(self):
-        row = 0
-        for i in range(self.item.parent.child_count()):
-            index = self.model.index(i, 1, self.source_index.parent())
-            if self.item.name == self.model.get_item(index).name:
-                row = i
-                break
-
+        row = self.item.index_in_parent()
         if self.model.remove_child(self.source_index.parent(), row):
             self.update_parent_editor_size()
 
@@ -83,6 +77,7 @@ class EditorAddPrimitiveSetChild(EditorAddArrayChild):
                 self.updated()
 
     def remove_row(self):
+        self.model.fetch_all(self.source_index)
         row = self.item.child_count() - 1
         if row is not None and self.model.remove_child(self.source_index, row):
             self.updated()
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class EditorRemoveItem(BaseEditor):
     """Editor allowing user to remove an item."""
 
+    poolable = True
+
     def __init__(
         self,
         prop: Union[ContainerPropertyItem, PropertyItem],
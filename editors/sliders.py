@@ -59,7 +59,7 @@ class EditorDoubleSlider(BaseEditor):
     def _set_editor_value(self, value: Union[int, float]):
         self.slider.setValue(value)
         self.line_edit.setText(str(value))
-        if self.item.parent.is_color:
+        if self.item.parent.is_color and self.item.parent.editor:
             self.item.parent.editor.set_editor_value(None)
 
     def on_update(self, value: float):
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 class EditorSpinboxContainer(BaseEditor):
 
     spinbox_type = EditorSpinbox
+    poolable = True
 
     def __init__(
         self,
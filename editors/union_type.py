@@ -1,22 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Hashable, TYPE_CHECKING
 
 from PySide2 import QtCore, QtWidgets
 
-from PropertyEditor.editors._meta import BaseEditor
+from PropertyEditor.editors._meta import BaseEditor, lock_model_update
 from PropertyEditor.widgets.widgets import (
     EditorHBoxLayout,
     BetterScrollComboBox,
 )
 
 if TYPE_CHECKING:
-    from PropertyEditor.properties._meta import PropertyItem
+    from PropertyEditor.properties._meta import BaseItem, PropertyItem
 
 
 class EditorUnionType(BaseEditor):
     """Editor allowing user to set union object's type."""
 
+    poolable = True
+
     def __init__(
         self,
         prop: PropertyItem,
@@ -38,6 +40,15 @@ class EditorUnionType(BaseEditor):
         self.combobox.currentTextChanged.connect(self.set_model_value)
         layout.addWidget(self.combobox)
 
+    @staticmethod
+    def get_pool_key(item: BaseItem, union_types: dict) -> Hashable:
+        return tuple(union_types)
+
+    @lock_model_update
+    def rebind(self, item: BaseItem, source_index: QtCore.QModelIndex) -> None:
+        super().rebind(item, source_index)
+        self.combobox.setCurrentText(self.item.lib_property.union_type)
+
     def _get_editor_value(self):
         return self.combobox.currentText()
 
@@ -47,13 +58,17 @@ class EditorUnionType(BaseEditor):
     def _set_model_value(self):
         value = self.get_editor_value()
         self.item.lib_property.set_union_type(value)
+        self.item.structure_changed()
 
         self.model.remove_child(self.source_index, 0)
         self.model.reset_last_child(self.source_index)
+        self.item.refresh_status(recursive=True)
         self.updated()
 
         for related in self.related:
             related.set_editor_value(value)
 
     def updated(self):
-        self.item.editor.set_editor_value(self.get_editor_value())
+        # The row may only be painted by the Delegate, see Config.editor_mode
+        if self.item.editor:
+            self.item.editor.set_editor_value(self.get_editor_value())
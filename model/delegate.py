@@ -1,6 +1,14 @@
 from typing import Any, Union, Optional
 
-from PySide2 import QtCore, QtWidgets
+from PySide2 import QtCore, QtGui, QtWidgets
+
+from PropertyEditor.editors.pool import editor_pool
+
+# Widths of the widgets of the size editors, see EditorChildrenManager
+SIZE_LABEL_WIDTH = 20
+SIZE_FIELD_WIDTH = 40
+SIZE_BUTTON_WIDTH = 30
+SPACING = 2
 
 
 class Delegate(QtWidgets.QStyledItemDelegate):
@@ -10,18 +18,124 @@ class Delegate(QtWidgets.QStyledItemDelegate):
         self.scroll_area = None
         self.option = None
 
-    def displayText(self, value: Any, locale: QtCore.QLocale) -> str:
-        """Get display text.
+        # Paint the editors of rows without one, see Config.editor_mode
+        self.paint_only = False
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> None:
+        super().paint(painter, option, index)
+        if not self.paint_only or index.column() != 1:
+            return
+
+        view = option.widget
+        if view is not None and view.isPersistentEditorOpen(index):
+            return
 
-        This function was enhanced to not display
-        the result for the checkboxes (true, false)
+        source_index = index.model().mapToSource(index)
+        item = source_index.model().get_item(source_index)
+        preview = item.get_preview() if item else None
+        if preview:
+            painter.save()
+            self.paint_preview(painter, option, *preview)
+            painter.restore()
+
+    def paint_preview(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        kind: str,
+        data: Any,
+    ) -> None:
+        """Paint the static look of an editor, see BaseItem.get_preview().
+
+        Kinds are "text", "check", "combo", "button", "color" and "size".
         """
-        result = super().displayText(value, locale)
+        widget = option.widget
+        style = widget.style() if widget else QtWidgets.QApplication.style()
+        rect = option.rect.adjusted(SPACING, 1, -SPACING, -1)
+        painter.setFont(option.font)
+        painter.setPen(option.palette.color(QtGui.QPalette.Text))
+
+        if kind == "check":
+            button = QtWidgets.QStyleOptionButton()
+            button.state = QtWidgets.QStyle.State_Enabled
+            button.state |= (
+                QtWidgets.QStyle.State_On if data else QtWidgets.QStyle.State_Off
+            )
+            button.rect = rect
+            button.rect = style.subElementRect(
+                QtWidgets.QStyle.SE_CheckBoxIndicator, button, widget
+            )
+            style.drawControl(QtWidgets.QStyle.CE_CheckBox, button, painter, widget)
+
+        elif kind == "combo":
+            combo = QtWidgets.QStyleOptionComboBox()
+            combo.rect = rect
+            combo.state = QtWidgets.QStyle.State_Enabled
+            combo.currentText = str(data or "")
+            combo.palette = option.palette
+            style.drawComplexControl(
+                QtWidgets.QStyle.CC_ComboBox, combo, painter, widget
+            )
+            style.drawControl(QtWidgets.QStyle.CE_ComboBoxLabel, combo, painter, widget)
+
+        elif kind == "button":
+            width = option.fontMetrics.horizontalAdvance(data) + 16
+            button_rect = QtCore.QRect(rect)
+            button_rect.setLeft(rect.right() + 1 - width)
+            self.paint_button(painter, option, style, data, button_rect)
+
+        elif kind == "color":
+            values = [min(max(float(v or 0.0), 0.0), 1.0) for v in data]
+            painter.fillRect(rect, QtGui.QColor.fromRgbF(*values[:4]))
+            painter.setPen(QtGui.QColor(34, 34, 34))
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+        elif kind == "size":
+            # Same layout as the editor, from the right: buttons, size and label
+            x = rect.right() + 1
+            for text in ("-", "+") if data else ("+",):
+                x -= SIZE_BUTTON_WIDTH
+                button_rect = QtCore.QRect(
+                    x, rect.top(), SIZE_BUTTON_WIDTH, rect.height()
+                )
+                self.paint_button(painter, option, style, text, button_rect)
+                x -= SPACING
+
+            x -= SIZE_FIELD_WIDTH
+            field = QtCore.QRect(x + 3, rect.top(), SIZE_FIELD_WIDTH, rect.height())
+            painter.drawText(field, QtCore.Qt.AlignVCenter, str(data))
+
+            x -= SPACING + SIZE_LABEL_WIDTH
+            label = QtCore.QRect(x, rect.top(), SIZE_LABEL_WIDTH, rect.height())
+            painter.drawText(label, QtCore.Qt.AlignVCenter, "Size")
 
-        if result in ["true", "false"]:
-            return ""
+        else:
+            text = option.fontMetrics.elidedText(
+                str(data), QtCore.Qt.ElideRight, rect.width()
+            )
+            painter.drawText(rect, QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft, text)
 
-        return result
+    @staticmethod
+    def paint_button(
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        style: QtWidgets.QStyle,
+        text: str,
+        rect: QtCore.QRect,
+    ) -> None:
+        button = QtWidgets.QStyleOptionButton()
+        button.state = QtWidgets.QStyle.State_Enabled | QtWidgets.QStyle.State_Raised
+        button.text = text
+        button.palette = option.palette
+        button.rect = rect
+        style.drawControl(
+            QtWidgets.QStyle.CE_PushButton, button, painter, option.widget
+        )
 
     def createEditor(
         self,
@@ -47,6 +161,21 @@ class Delegate(QtWidgets.QStyledItemDelegate):
                 .create_editor(source_index, parent=parent)
             )
 
+    def destroyEditor(
+        self, editor: QtWidgets.QWidget, index: QtCore.QModelIndex
+    ) -> None:
+        """Forget the editor of its item, and keep it in the pool or delete it."""
+        item = getattr(editor, "item", None)
+        if item is not None and item.editor is editor:
+            item.editor = None
+
+        # Editors showing the same values must not update this one anymore
+        if item is not None:
+            editor.unlink_related()
+
+        if not editor_pool.release(editor):
+            super().destroyEditor(editor, index)
+
     def setEditorData(
         self, editor: QtWidgets.QWidget, index: QtCore.QModelIndex
     ) -> None:
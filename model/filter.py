@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from PropertyEditor.utils import PathTrie
+
+if TYPE_CHECKING:
+    from PropertyEditor.properties._meta import BaseItem
+
+# Parent item, row and if the row is now hidden
+VisibilityChange = Tuple["BaseItem", int, bool]
+
+
+def get_item_node_ref(item: BaseItem) -> Optional[str]:
+    """Get node ref of an item, to match it with search results."""
+    if item.node_ref:
+        return item.node_ref
+    elif item.lib_property:
+        return item.lib_property.absolute_noderef
+    return None
+
+
+def match_overrides(override_filter: Optional[str], item: BaseItem) -> bool:
+    """Accept items matching the overrides filter, or having matching items under."""
+    if override_filter == "Overrides":
+        return item.has_prefab_overrides or item.get_override_counts()[1] > 0
+    elif override_filter == "LocalOverrides":
+        return item.is_set or item.get_override_counts()[0] > 0
+    return True
+
+
+class FilterEngine:
+    """Filter rows of a Model without the proxy, see Config.filter_engine.
+
+    Each filtered container keeps a visibility bitmap of its child rows.
+    A filter change computes them again and only reports the rows whose visibility
+    changed, and rows inserted or removed in the model only update their parent's.
+    Filtered rows stay in the model, the view hides them (see TreeView.setRowHidden).
+    """
+
+    def __init__(self):
+        """Initialize."""
+        self.override_filter: Optional[str] = None
+        self.searching = False
+        self.matches = PathTrie()
+
+        # Items matching the search, or ancestors of a match, to expand them
+        self.filtered: Set[BaseItem] = set()
+
+        # Rows of the view start visible, so a missing bitmap means all visible
+        self._visible: Dict[BaseItem, bytearray] = {}
+
+    @property
+    def active(self) -> bool:
+        return self.searching or self.override_filter not in (None, "All")
+
+    def accepts(self, item: BaseItem) -> bool:
+        if self.searching:
+            node_ref = get_item_node_ref(item)
+            if not node_ref:
+                return False
+            elif self.matches.contains_descendant(node_ref):
+                self.filtered.add(item)
+            elif not self.matches.contains_ancestor(node_ref):
+                return False
+
+        return match_overrides(self.override_filter, item)
+
+    def set_search(
+        self, root: BaseItem, search_pattern: str, matches: PathTrie
+    ) -> List[VisibilityChange]:
+        self.searching = bool(search_pattern)
+        self.matches = matches
+        self.filtered = set()
+        return self.filter_changed(root)
+
+    def set_override_filter(
+        self, root: BaseItem, override_filter: str
+    ) -> List[VisibilityChange]:
+        self.override_filter = override_filter
+        return self.filter_changed(root)
+
+    def filter_changed(self, root: BaseItem) -> List[VisibilityChange]:
+        changes = self.update(root)
+
+        # Everything is visible again, new rows don't need to be filtered
+        if not self.active:
+            self._visible.clear()
+        return changes
+
+    def update(self, item: BaseItem) -> List[VisibilityChange]:
+        """Filter built rows under an item, and get the ones whose visibility changed.
+
+        Rows under hidden rows are skipped, their bitmaps still match the view.
+        """
+        changes = []
+        parents = [item]
+        while parents:
+            parent = parents.pop()
+            old = self._visible.get(parent)
+            new = self._visible[parent] = bytearray(
+                self.accepts(child) for child in parent.child_items
+            )
+
+            for row, child in enumerate(parent.child_items):
+                was_visible = old is None or row >= len(old) or old[row]
+                if new[row] != was_visible:
+                    changes.append((parent, row, not new[row]))
+                if new[row] and child.child_items:
+                    parents.append(child)
+
+        return changes
+
+    def rows_inserted(
+        self, parent: BaseItem, first: int, last: int
+    ) -> List[VisibilityChange]:
+        visible = self._visible.get(parent)
+        if visible is None:
+            if not self.active:
+                return []
+            visible = self._visible[parent] = bytearray(b"\x01") * (
+                parent.child_count() - (last - first + 1)
+            )
+
+        new = bytearray(
+            self.accepts(parent.child_items[row]) for row in range(first, last + 1)
+        )
+        visible[first:first] = new
+        if len(visible) != parent.child_count():
+            return self.update(parent)
+
+        return [(parent, first + i, True) for i, flag in enumerate(new) if not flag]
+
+    def rows_about_to_be_removed(
+        self, parent: BaseItem, first: int, last: int
+    ) -> None:
+        """Forget bitmaps of the removed items and of the items under them."""
+        items = list(parent.child_items[first : last + 1])
+        while items:
+            item = items.pop()
+            self._visible.pop(item, None)
+            items.extend(item.child_items)
+
+    def rows_removed(
+        self, parent: BaseItem, first: int, last: int
+    ) -> List[VisibilityChange]:
+        visible = self._visible.get(parent)
+        if visible is None:
+            return []
+
+        del visible[first : last + 1]
+        if len(visible) != parent.child_count():
+            return self.update(parent)
+        return []
+
+    def reset(self) -> None:
+        self._visible.clear()
+        self.filtered = set()
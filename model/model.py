@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import contextlib
+import difflib
 from pathlib import Path
-from typing import Any, Union, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Hashable, Union, Optional, Tuple, TYPE_CHECKING
 
 from PySide2 import QtCore
 
+from PropertyEditor.model.filter import FilterEngine
+
 if TYPE_CHECKING:
     from PropertyEditor.app import PropertyEditorApp
     from PropertyEditor.properties._meta import (
@@ -29,6 +32,7 @@ class Model(QtCore.QAbstractItemModel):
         self.app = app
         self.loaded_item: ContainerPropertyItem = root_item
         self.loaded_file: Path = loaded_file
+        self.filter_engine = FilterEngine()
 
     @property
     def relative_path(self) -> Optional[Path]:
@@ -79,12 +83,11 @@ class Model(QtCore.QAbstractItemModel):
         return index
 
     def ensure_right_index(self, parent_index: QtCore.QModelIndex, prop: BaseItem):
-        prop_row = self.rowCount(parent_index) - 1
-        for row in range(prop_row + 1):
-            test_index = self.index(row, 1, parent_index)
-            if prop.name == self.get_item(test_index).name:
-                prop_row = row
-                break
+        parent_item = self.get_item(parent_index) or self.loaded_item
+
+        prop_row = parent_item.get_child_row(prop.name)
+        if prop_row is None:
+            prop_row = self.rowCount(parent_index) - 1
 
         return self.index(prop_row, 1, parent_index)
 
@@ -96,6 +99,135 @@ class Model(QtCore.QAbstractItemModel):
     def columnCount(self, index: QtCore.QModelIndex = None, *args, **kwargs) -> int:
         return 2
 
+    def hasChildren(self, index: QtCore.QModelIndex = None) -> bool:
+        if not index or not index.isValid():
+            return self.loaded_item.has_children()
+        elif index.column() > 0:
+            return False
+        return self.get_item(index).has_children()
+
+    def canFetchMore(self, index: QtCore.QModelIndex) -> bool:
+        item = self.get_item(index) or self.loaded_item
+        return item.can_fetch_more()
+
+    def fetchMore(self, index: QtCore.QModelIndex) -> None:
+        """Build child items of an index, usually when it's expanded."""
+        index = self.ensure_column_0(index)
+        item = self.get_item(index) or self.loaded_item
+        if not item.can_fetch_more():
+            return
+
+        items = item.create_child_items(limit=self.app.config.fetch_page_size)
+        if not items:
+            item.add_fetched_child_items(items)
+            return
+
+        first_row = item.child_count()
+        self.beginInsertRows(index, first_row, first_row + len(items) - 1)
+        item.add_fetched_child_items(items)
+        self.endInsertRows()
+
+    def fetch_all(self, index: QtCore.QModelIndex) -> None:
+        """Build all child items of an index, whatever the page size."""
+        while self.canFetchMore(index):
+            self.fetchMore(index)
+
+    @staticmethod
+    def _sync_key(item: BaseItem) -> Hashable:
+        # Items without a node (InstanceOf, deleted items, Euler values...) only hold
+        # values read when created, so they are always replaced
+        if item.node_ref:
+            return item.name, type(item)
+        return item
+
+    def sync_child_rows(self, index: QtCore.QModelIndex) -> None:
+        """Update child rows of an index after its node changed, as after an unset().
+
+        Children whose node still exists keep their item, row and editor, and only
+        get dataChanged(). Only rows of children which appeared or disappeared are
+        inserted or removed. Children built under the kept ones are synced the same.
+        Keys are compared first, so only items of inserted rows are created.
+        """
+        index = self.ensure_column_0(index)
+        item = self.get_item(index) or self.loaded_item
+        if not item.is_container:
+            return
+
+        old_items = item.child_items
+        entries = item.plan_child_items()
+        opcodes = difflib.SequenceMatcher(
+            None,
+            [self._sync_key(i) for i in old_items],
+            [key for key, _ in entries],
+            autojunk=False,
+        ).get_opcodes()
+
+        # From the last rows, so rows of the previous changes are still the same
+        for tag, old_first, old_end, new_first, new_end in reversed(opcodes):
+            if tag in ("delete", "replace"):
+                self.beginRemoveRows(index, old_first, old_end - 1)
+                item.pop_child_items(old_first, old_end - 1)
+                self.endRemoveRows()
+
+            if tag in ("insert", "replace"):
+                new_items = [create() for _, create in entries[new_first:new_end]]
+                last = old_first + len(new_items) - 1
+                self.beginInsertRows(index, old_first, last)
+                item.insert_child_items(old_first, new_items)
+                self.endInsertRows()
+
+        # Kept rows are now at their new rows
+        for tag, _, _, new_first, new_end in opcodes:
+            if tag != "equal":
+                continue
+
+            self.dataChanged.emit(
+                self.index(new_first, 0, index), self.index(new_end - 1, 1, index)
+            )
+            for row in range(new_first, new_end):
+                item.child_items[row].reset_editors()
+                self.sync_child_rows(self.index(row, 0, index))
+
+    def fetch_child_row(
+        self, index: QtCore.QModelIndex, name: str, by_key: bool = False
+    ) -> Optional[int]:
+        """Get row of a child using its name, building child items until it's found.
+
+        With by_key, the child is found by its EntityLib key instead of its name,
+        as children can be renamed (see ContainerPropertyItem.get_child_name()).
+        """
+        item = self.get_item(index) or self.loaded_item
+        get_child_row = item.get_child_row_by_key if by_key else item.get_child_row
+        row = get_child_row(name)
+        while row is None and self.canFetchMore(index):
+            self.fetchMore(index)
+            row = get_child_row(name)
+        return row
+
+    def ensure_fetched(self, index: QtCore.QModelIndex, depth: int = 1) -> None:
+        """Build first child items of an index now, and of its children up to depth."""
+        if self.canFetchMore(index):
+            self.fetchMore(index)
+
+        if depth > 1:
+            index = self.ensure_column_0(index)
+            for row in range(self.rowCount(index)):
+                self.ensure_fetched(self.index(row, 0, index), depth=depth - 1)
+
+    def fetch_path(self, path: str) -> QtCore.QModelIndex:
+        """Build items along a node ref, and get the index of the deepest one."""
+        index = self.root_index()
+        for key in path.split("/"):
+            if not key:
+                continue
+
+            row = self.fetch_child_row(index, key, by_key=True)
+            if row is None:
+                break
+            index = self.index(row, 0, index)
+
+        return index
+
     def data(
         self,
         index: QtCore.QModelIndex,
@@ -163,6 +295,12 @@ class Model(QtCore.QAbstractItemModel):
             parent_item.index_in_parent(), index.column(), parent_item
         )
 
+    def index_from_item(self, item: BaseItem) -> QtCore.QModelIndex:
+        """Get the column 0 index of an item of the model."""
+        if not item.parent or item == self.loaded_item:
+            return QtCore.QModelIndex()
+        return self.createIndex(item.index_in_parent(), 0, item)
+
     def get_item(
         self, index: QtCore.QModelIndex
     ) -> Optional[Union[ContainerPropertyItem, PropertyItem, BaseItem]]:
@@ -173,13 +311,16 @@ class Model(QtCore.QAbstractItemModel):
     def set_item_value(self, prop: BaseItem, value: Any):
         if prop.value != value:
             prop.value = value
+            prop.refresh_status()
             self.app.set_current_tab_edited()
 
     def add_child(
         self, index: QtCore.QModelIndex, value: Any
     ) -> Optional[PropertyItem]:
+        self.fetch_all(index)
         with self._add_row(index) as (item, row):
             child = item.add_child(value)
+            item.refresh_status()
         if child:
             self.app.update_row(index, row)
             return child
@@ -188,6 +329,7 @@ class Model(QtCore.QAbstractItemModel):
     def add_deleted_items(self, index: QtCore.QModelIndex) -> None:
         index = self.ensure_column_0(index)
 
+        self.fetch_all(index)
         item: ContainerPropertyItem = self.get_item(index)
         if not item.missing_deleted_items():
             return
@@ -211,9 +353,13 @@ class Model(QtCore.QAbstractItemModel):
         self.app.update_row(parent_index, row)
 
     def remove_child(self, parent_index: QtCore.QModelIndex, row: int) -> bool:
+        # Removals like pop_back() expect the last rows to be built
+        self.fetch_all(self.ensure_column_0(parent_index))
         with self._remove_row(parent_index, row) as (item, source_index):
+            parent_item = item.parent
             result = item.remove_from_parent()
             if result:
+                parent_item.refresh_status()
                 self.app.set_current_tab_edited()
         return result
 
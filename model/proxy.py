@@ -1,15 +1,57 @@
 from __future__ import annotations
 
 import contextlib
-from typing import List, TYPE_CHECKING
+from typing import List, Set, TYPE_CHECKING
 
 from PySide2 import QtCore, QtWidgets
 
+from PropertyEditor.model.filter import get_item_node_ref, match_overrides
+from PropertyEditor.utils import PathTrie
+
 if TYPE_CHECKING:
-    from PropertyEditor.properties._meta import PropertyItem
+    from PropertyEditor.properties._meta import BaseItem, PropertyItem
+
+
+class SortProxy(QtCore.QSortFilterProxyModel):
+    """Proxy model sorting rows by their items' sort keys, without filtering.
+
+    Used alone when the model's FilterEngine hides filtered rows, so Qt never
+    calls back into Python to accept a row.
+    """
+
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool:
+        """Compare natural sort keys of the items, see BaseItem.sort_key."""
+        left_item = self.sourceModel().get_item(left)
+        right_item = self.sourceModel().get_item(right)
+
+        if left_item is None or right_item is None:
+            return False
+        return left_item.sort_key < right_item.sort_key
+
+    def iter_indexes(self):
+        def recurse(parent_index: QtCore.QModelIndex):
+            for row in range(self.rowCount(parent_index)):
+                child_index = self.index(row, 0, parent_index)
+                yield child_index
+                if self.rowCount(child_index):
+                    yield from recurse(child_index)
+
+        yield from recurse(self.mapFromSource(self.sourceModel().root_index()))
+
+    def ensure_proxy_index(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if index.model() and index.model() != self:
+            return self.mapFromSource(index)
+        return index
+
+    def ensure_column_1(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        # Don't check different from 1 as for -1 column (root item) we don't want
+        # to update the index's column
+        if index.column() == 0:
+            return self.index(index.row(), 1, index.parent())
+        return index
 
 
-class Proxy(QtCore.QSortFilterProxyModel):
+class Proxy(SortProxy):
     """Custom proxy model to manage both wildcard and filters."""
 
     def __init__(self, parent: QtWidgets.QWidget):
@@ -23,7 +65,9 @@ class Proxy(QtCore.QSortFilterProxyModel):
         self.override_filter = None
         self.force_all = True
         self.matching_node_references = []
-        self.filtered = []
+        self.matches = PathTrie()
+        # Items matching the search, or ancestors of a match, to expand them
+        self.filtered: Set[BaseItem] = set()
 
     def filterAcceptsRow(
         self, source_row: int, source_parent: QtCore.QModelIndex
@@ -57,23 +101,16 @@ class Proxy(QtCore.QSortFilterProxyModel):
         if not prop:
             return False
 
-        if any(
-            [
-                prop.lib_property.absolute_noderef in i
-                for i in self.matching_node_references
-            ]
-        ):
-            self.filtered.append(source_index)
-            return True
+        node_ref = get_item_node_ref(prop)
+        if not node_ref:
+            return False
 
-        elif any(
-            [
-                i in prop.lib_property.absolute_noderef
-                for i in self.matching_node_references
-            ]
-        ):
+        if self.matches.contains_descendant(node_ref):
+            self.filtered.add(prop)
             return True
 
+        return self.matches.contains_ancestor(node_ref)
+
     def filter_overrides(
         self, source_row: int, source_parent: QtCore.QModelIndex
     ) -> bool:
@@ -81,18 +118,22 @@ class Proxy(QtCore.QSortFilterProxyModel):
         if not self.override_filter or self.override_filter == "All":
             return True
 
-        item = self.get_item(source_row, source_parent)
-        if (self.override_filter == "Overrides" and not item.has_prefab_overrides) or (
-            self.override_filter == "LocalOverrides" and not item.is_set
-        ):
-            return False
-
-        return True
+        # Rows with overrides under them are kept through the counts,
+        # without Qt filtering the whole hierarchy recursively
+        return match_overrides(
+            self.override_filter, self.get_item(source_row, source_parent)
+        )
 
     @contextlib.contextmanager
     def filter_update_context(self):
 
         yield
+
+        # Override counts already keep parents of overrides, only a search needs
+        # parents of rows matching both filters
+        recursive = not self.force_all
+        if self.isRecursiveFilteringEnabled() != recursive:
+            self.setRecursiveFilteringEnabled(recursive)
         self.setFilterWildcard("*")
 
     def select_overrides_updated(self, override_filter: str) -> None:
@@ -100,59 +141,16 @@ class Proxy(QtCore.QSortFilterProxyModel):
         with self.filter_update_context():
             self.override_filter = override_filter
 
-    def get_search_matching_properties(self, search_value: str) -> List[str]:
-        return [
-            node.absolute_noderef
-            for node in self.sourceModel().loaded_item.lib_property.search_child(
-                search_value
-            )
-        ]
-
-    def search_filter_updated(self, search_pattern: str) -> None:
+    def set_search_results(
+        self, search_pattern: str, node_refs: List[str], matches: PathTrie
+    ) -> None:
+        """Filter rows with the results of a search, see model.search.Search."""
         with self.filter_update_context():
-            if search_pattern:
-                self.matching_node_references = self.get_search_matching_properties(
-                    search_pattern
-                )
-                self.force_all = False
-            else:
-                self.matching_node_references = []
-                self.filtered = []
-                self.force_all = True
+            self.filtered = set()
+            self.matching_node_references = node_refs
+            self.matches = matches
+            self.force_all = not search_pattern
 
     def get_item(self, source_row, source_parent) -> PropertyItem:
         index = self.sourceModel().index(source_row, 0, source_parent)
         return self.sourceModel().get_item(index)
-
-    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool:
-        left_data: str = self.sourceModel().data(left, role=QtCore.Qt.UserRole)
-        right_data: str = self.sourceModel().data(right, role=QtCore.Qt.UserRole)
-
-        if left_data is None or right_data is None:
-            return False
-
-        if left_data.isnumeric():
-            return int(left_data) < int(right_data)
-        return left_data < right_data
-
-    def iter_indexes(self):
-        def recurse(parent_index: QtCore.QModelIndex):
-            for row in range(self.rowCount(parent_index)):
-                child_index = self.index(row, 0, parent_index)
-                yield child_index
-                if self.rowCount(child_index):
-                    yield from recurse(child_index)
-
-        yield from recurse(self.mapFromSource(self.sourceModel().root_index()))
-
-    def ensure_proxy_index(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex:
-        if index.model() and index.model() != self:
-            return self.mapFromSource(index)
-        return index
-
-    def ensure_column_1(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex:
-        # Don't check different from 1 as for -1 column (root item) we don't want
-        # to update the index's column
-        if index.column() == 0:
-            return self.index(index.row(), 1, index.parent())
-        return index
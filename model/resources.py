@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+from PySide2 import QtWidgets
+from PySide2.QtGui import QColor, QFont, QFontInfo, QPixmap
+
+from PropertyEditor.utils import CacheCounter
+
+FONT_SIZE = 8
+DECORATION_SIZE = (5, 20)
+
+# Hits and misses of the role data resources, a miss is one Qt object allocated
+resources_cache = CacheCounter("Role resources")
+
+
+class RoleResources:
+    """Fonts, colors and pixmaps returned by Model.data().
+
+    Only a few distinct ones are implied by ColorConfig, so they are built once
+    and shared by every cell instead of being allocated on each repaint.
+    Colors and pixmaps are keyed by rgb, fonts use the application font family.
+    """
+
+    # When disabled, nothing is kept and each request allocates as it did before,
+    # only used to benchmark the resources
+    enabled = True
+
+    def __init__(self):
+        """Initialize."""
+        self._font_family: Optional[str] = None
+        self._fonts: Dict[Tuple[bool, bool], QFont] = {}
+        self._colors: Dict[Tuple[int, int, int, int], QColor] = {}
+        self._pixmaps: Dict[Tuple[int, int, int], QPixmap] = {}
+
+    def invalidate(self) -> None:
+        """Forget all resources, so the next requests build them again."""
+        self._font_family = None
+        self._fonts.clear()
+        self._colors.clear()
+        self._pixmaps.clear()
+
+    def get_font(self, bold: bool = False, italic: bool = False) -> QFont:
+        font = self._fonts.get((bold, italic))
+        if font is not None:
+            resources_cache.hit()
+            return font
+
+        resources_cache.miss()
+        if self._font_family is None:
+            self._font_family = QFontInfo(QtWidgets.QApplication.font()).family()
+
+        font = QFont(self._font_family, FONT_SIZE, QFont.Bold if bold else -1)
+        font.setItalic(italic)
+        if self.enabled:
+            self._fonts[(bold, italic)] = font
+        return font
+
+    def get_color(self, rgb: Tuple[int, int, int], alpha: int = 255) -> QColor:
+        key = (*rgb, alpha)
+        color = self._colors.get(key)
+        if color is not None:
+            resources_cache.hit()
+            return color
+
+        resources_cache.miss()
+        color = QColor(*rgb, alpha)
+        if self.enabled:
+            self._colors[key] = color
+        return color
+
+    def get_pixmap(self, rgb: Tuple[int, int, int]) -> QPixmap:
+        pixmap = self._pixmaps.get(rgb)
+        if pixmap is not None:
+            resources_cache.hit()
+            return pixmap
+
+        resources_cache.miss()
+        pixmap = QPixmap(*DECORATION_SIZE)
+        pixmap.fill(self.get_color(rgb))
+        if self.enabled:
+            self._pixmaps[rgb] = pixmap
+        return pixmap
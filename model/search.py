@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Iterator, Optional, TYPE_CHECKING
+
+from PySide2 import QtCore
+
+from PropertyEditor.utils import PathTrie
+
+if TYPE_CHECKING:
+    from PropertyEditor.widgets.treeview import TreeView
+
+
+class Search(QtCore.QObject):
+    """Search as you type in a tree view.
+
+    Text changes are debounced, then EntityLib is searched in one call.
+    Its nodes are only read from the UI thread, so the matching nodes are
+    indexed by chunks of chunk_size, run by a 0 ms timer between two events.
+    Rows of the first fetch_limit matches are then built by chunks of
+    fetch_chunk_size, the others when their parents are expanded.
+    Each new query cancels the previous one before its next chunk,
+    and the results of the last one are applied to the view at once.
+    """
+
+    def __init__(
+        self,
+        tree_view: TreeView,
+        delay: int,
+        chunk_size: int,
+        fetch_chunk_size: int,
+        fetch_limit: int,
+    ):
+        """Initialize."""
+        super().__init__(tree_view)
+        self.tree_view = tree_view
+        self.pattern = ""
+        self.query_id = 0
+        self.chunk_size = chunk_size
+        self.fetch_chunk_size = fetch_chunk_size
+        self.fetch_limit = fetch_limit
+        self._chunks: Optional[Iterator[None]] = None
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.search_now)
+
+        self.chunk_timer = QtCore.QTimer(self)
+        self.chunk_timer.setInterval(0)
+        self.chunk_timer.timeout.connect(self.run_chunk)
+
+    def is_canceled(self, query_id: int) -> bool:
+        return query_id != self.query_id
+
+    def cancel(self) -> None:
+        """Drop the running query, e.g. when its tab is closed."""
+        self.query_id += 1
+        self.timer.stop()
+        self.chunk_timer.stop()
+        self._chunks = None
+
+    def text_changed(self, pattern: str) -> None:
+        """Search the pattern once no key was pressed for the timer delay."""
+        self.cancel()
+        self.pattern = pattern
+        self.timer.start()
+
+    def search_now(self) -> None:
+        self.cancel()
+
+        # Clearing the search doesn't need EntityLib
+        if not self.pattern:
+            self.tree_view.set_search_results("", [], PathTrie())
+            return
+
+        self._chunks = self._search(self.query_id, self.pattern)
+        self.chunk_timer.start()
+
+    def run_chunk(self) -> None:
+        if self._chunks is None:
+            self.chunk_timer.stop()
+            return
+
+        try:
+            next(self._chunks)
+        except StopIteration:
+            self.chunk_timer.stop()
+            self._chunks = None
+
+    def _search(self, query_id: int, pattern: str) -> Iterator[None]:
+        model = self.tree_view.source_model
+        node = model.loaded_item.lib_property
+        nodes = list(node.search_child(pattern))
+        yield
+
+        node_refs = []
+        matches = PathTrie()
+        for start in range(0, len(nodes), self.chunk_size):
+            if self.is_canceled(query_id):
+                return
+
+            for child in nodes[start : start + self.chunk_size]:
+                node_ref = child.absolute_noderef
+                node_refs.append(node_ref)
+                matches.add(node_ref)
+            yield
+
+        # Build items of the matching properties, to be able to show them
+        fetched = node_refs[: self.fetch_limit]
+        for start in range(0, len(fetched), self.fetch_chunk_size):
+            if self.is_canceled(query_id):
+                return
+
+            for node_ref in fetched[start : start + self.fetch_chunk_size]:
+                model.fetch_path(node_ref)
+            yield
+
+        if not self.is_canceled(query_id):
+            self.tree_view.set_search_results(pattern, node_refs, matches)
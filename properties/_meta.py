@@ -1,8 +1,19 @@
 from __future__ import annotations
 
-import itertools
+from functools import partial
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 from EntityLibPy import (
     CopyMode,
@@ -14,14 +25,79 @@ from EntityLibPy import (
 )
 
 from PropertyEditor.config import Config
+from PropertyEditor.utils import CacheCounter, natural_sort_key, stat_cache
+from PropertyEditor.properties.plan import (
+    ChildPlan,
+    FieldPlan,
+    get_child_plan,
+    get_item_class,
+    get_schema_maximum,
+    get_schema_minimum,
+)
+from PropertyEditor.properties.status import (
+    HAS_PREFAB,
+    IS_DEFAULT,
+    IS_LOCAL,
+    IS_SET,
+    StatusSnapshot,
+    status_cache,
+)
 
 if TYPE_CHECKING:
     from PropertyEditor.editors._meta import BaseEditor
     from PySide2 import QtCore, QtWidgets
 
 
+# Hits and misses of the resolved Property handles, see BaseItem.lib_property
+lib_property_cache = CacheCounter("Lib property cache")
+
+# Hits and misses of the prefab histories, see BaseItem.get_prefab_history
+prefab_history_cache = CacheCounter("Prefab history cache")
+
+# Kind of the editor look and its data, painted until the editor is created,
+# see BaseItem.get_preview() and Delegate.paint_preview()
+Preview = Tuple[str, Any]
+
+# Key of a child, compared by Model.sync_child_rows(), and a factory of its item,
+# see ContainerPropertyItem.plan_child_items()
+ChildEntry = Tuple[Optional[Hashable], Callable[[], "BaseItem"]]
+
+
 class BaseItem:
-    """Base class to use Property as QTreeView item."""
+    """Base class to use Property as QTreeView item.
+
+    Items use __slots__ to keep big trees small in memory. Data only needed by some
+    items are class attributes here, and slots in the subclasses using them.
+    """
+
+    __slots__ = (
+        "_name",
+        "_parent",
+        "_lib_property",
+        "_sort_value",
+        "sort_key",
+        "editor",
+        "instance_of",
+    )
+
+    # Leaf items share this empty tuple instead of allocating a list each
+    child_items = ()
+
+    _value = None
+    _root = None
+    _node_ref = None
+    _lib_generation = 0
+    field_plan: Optional[FieldPlan] = None
+    _override_counts = None
+
+    # Items without a node of their own (InstanceOf, deleted items...) use their
+    # parent's, resolved again after structural changes like the parent's
+    uses_parent_node = False
+
+    # Only set on root items, see ContainerPropertyItem
+    _generation = 0
+    _config = None
+    _prefab_histories = None
 
     def __init__(self, parent: Optional[BaseItem, PropertyItem] = None):
         """Initialize."""
@@ -29,16 +105,10 @@ class BaseItem:
         self._parent = parent
 
         self._lib_property = None
-
-        self._default_value = None
-        self._value = None
         self._sort_value = None
-
-        self._root_node = None
-        self._node_ref = None
+        self.sort_key = ()
 
         self.editor = None
-        self.child_items = []
         self.instance_of = None
 
     @property
@@ -48,7 +118,12 @@ class BaseItem:
 
     @name.setter
     def name(self, property_name: str) -> None:
+        old_name = self._name
         self._name = property_name
+        if self._sort_value is None:
+            self.sort_key = natural_sort_key(property_name)
+        if self._parent and old_name != property_name:
+            self._parent._update_child_name(self, old_name)
 
     @property
     def parent(self) -> ContainerPropertyItem:
@@ -66,8 +141,19 @@ class BaseItem:
             self._value = value
 
     @property
-    def root_node(self) -> Property:
-        return self._root_node
+    def root(self) -> BaseItem:
+        """Get the root item of the tree."""
+        if self._root:
+            return self._root
+        elif self.parent:
+            return self.parent.root
+        return self
+
+    @property
+    def root_node(self) -> Optional[Property]:
+        if self._root:
+            return self._root._lib_property
+        return None
 
     @property
     def node_ref(self) -> Property:
@@ -75,12 +161,35 @@ class BaseItem:
 
     @property
     def lib_property(self) -> Optional[Property]:
-        """Get node."""
-        if self._lib_property:
+        """Get node.
+
+        The node is resolved from its node reference only when the tree structure
+        has changed since the last resolution (see structure_changed()).
+        A node which doesn't exist anymore is kept as None until the next change.
+        """
+        if self.uses_parent_node:
+            return self._parent.lib_property
+
+        root = self._root
+        if not root or root is self or not self.root_node or not self.node_ref:
             return self._lib_property
-        elif self.root_node and self.node_ref:
-            return self.root_node.resolve_noderef(self.node_ref)
-        return None
+
+        if self._lib_generation == root._generation:
+            lib_property_cache.hit()
+            return self._lib_property
+
+        lib_property_cache.miss()
+        self._lib_property = self.root_node.resolve_noderef(self.node_ref)
+        self._lib_generation = root._generation
+        return self._lib_property
+
+    def structure_changed(self) -> None:
+        """Invalidate the resolved nodes of the whole tree.
+
+        Needs to be called after any EntityLib call adding, removing or replacing nodes
+        (push_back, pop_back, insert, erase, set_union_type, unset, copy_into...).
+        """
+        self.root._generation += 1
 
     @property
     def entity_lib(self) -> Optional[EntityLib]:
@@ -116,7 +225,7 @@ class BaseItem:
 
     @property
     def is_default(self) -> bool:
-        return self.lib_property.is_default
+        return self._get_status(IS_DEFAULT)
 
     @property
     def is_removable(self) -> bool:
@@ -143,46 +252,123 @@ class BaseItem:
 
     @property
     def is_local(self) -> bool:
-        if self.parent and self.parent.parent:
-            if self.parent and self.parent.is_local:
-                return True
-            elif self.has_prefab and self.prefab.parent:
-                return not bool(self.prefab.parent.parent)
-
-        return False
+        return self._get_status(IS_LOCAL)
 
     @property
     def is_set(self) -> bool:
         """Get is_set."""
-        return self.lib_property.is_set
+        return self._get_status(IS_SET)
 
     @property
     def has_prefab(self) -> bool:
         """Get if node has prefab."""
-        return self.lib_property.has_prefab
+        return self._get_status(HAS_PREFAB)
 
     @property
     def has_prefab_overrides(self) -> bool:
         """Get if node has prefab overrides."""
         return self.has_prefab and not self.is_default
 
+    def read_status(self) -> Tuple[bool, bool, bool, bool]:
+        """Read is_set, is_default, has_prefab and is_local from EntityLib.
+
+        Only used to fill the parent's StatusSnapshot, use the properties instead.
+        """
+        node = self.lib_property
+        has_prefab = node.has_prefab
+
+        is_local = False
+        if self.parent and self.parent.parent:
+            if self.parent.is_local:
+                is_local = True
+            elif has_prefab and node.prefab.parent:
+                is_local = not bool(node.prefab.parent.parent)
+
+        return node.is_set, node.is_default, has_prefab, is_local
+
+    def read_status_flag(self, flag: int) -> bool:
+        """Read one flag from EntityLib, see StatusSnapshot.enabled."""
+        status_cache.miss()
+        if flag != IS_LOCAL:
+            name = ("is_set", "is_default", "has_prefab")[flag]
+            return getattr(self.lib_property, name)
+
+        if self.parent and self.parent.parent:
+            if self.parent.is_local:
+                return True
+            elif self.has_prefab and self.prefab.parent:
+                return not bool(self.prefab.parent.parent)
+        return False
+
+    def _get_status(self, flag: int) -> bool:
+        if not StatusSnapshot.enabled:
+            return self.read_status_flag(flag)
+
+        if self._parent is not None:
+            status = self._parent.get_child_status(self, flag)
+            if status is not None:
+                return status
+        return self.read_status()[flag]
+
+    def get_child_status(self, child: BaseItem, flag: int) -> Optional[bool]:
+        return None
+
+    def refresh_child_status(self, child: BaseItem) -> None:
+        return
+
+    def refresh_status(self, recursive: bool = False) -> None:
+        """Read again status of the item and of its parents.
+
+        Needs to be called after any change of the item's value, overrides or prefab.
+        Use recursive to also refresh the whole hierarchy under the item.
+        """
+        self.invalidate_tooltip()
+        self.overrides_changed()
+        item = self
+        while item.parent:
+            item.parent.refresh_child_status(item)
+            item.parent.invalidate_tooltip()
+            item = item.parent
+
+        if recursive:
+            self.invalidate_children_status()
+
+    def invalidate_children_status(self) -> None:
+        return
+
+    def get_override_counts(self) -> Tuple[int, int]:
+        """Get counts of set and of prefab overridden items under this one."""
+        return 0, 0
+
+    def overrides_changed(self) -> None:
+        """Mark override counts of the parents as stale, to count them when needed."""
+        # Containers not fully fetched count from EntityLib without their children,
+        # so up to date counts can be above stale ones, all parents are marked
+        parent = self.parent
+        while parent is not None:
+            parent._override_counts = None
+            parent = parent.parent
+
     @property
     def maximum(self) -> Optional[int, float]:
         """Get maximum from schema or schema.user_meta."""
-        if hasattr(self.lib_property.schema, "maximum"):
-            return self.lib_property.schema.maximum
-        elif "max" in self.user_meta.get("range", {}):
-            return self.lib_property.user_meta["range"]["max"]
-        return None
+        if self.field_plan:
+            return self.field_plan.maximum
+        return get_schema_maximum(self.schema, self.user_meta)
 
     @property
     def minimum(self) -> Optional[int, float]:
         """Get minimum from schema or schema.user_meta."""
-        if hasattr(self.lib_property.schema, "minimum"):
-            return self.lib_property.schema.minimum
-        elif "min" in self.lib_property.schema.user_meta.get("range", {}):
-            return self.lib_property.schema.user_meta["range"]["min"]
-        return None
+        if self.field_plan:
+            return self.field_plan.minimum
+        return get_schema_minimum(self.schema, self.user_meta)
+
+    @property
+    def enum_values(self) -> Optional[List[str]]:
+        """Get enum values from schema."""
+        if self.field_plan:
+            return self.field_plan.enum_values
+        return self.schema.enum_values
 
     @property
     def sort_value(self) -> str:
@@ -193,6 +379,7 @@ class BaseItem:
     @sort_value.setter
     def sort_value(self, value: str) -> None:
         self._sort_value = value
+        self.sort_key = natural_sort_key(self.sort_value)
 
     @staticmethod
     def get_config_color(config: "Config") -> Tuple[int, int, int]:
@@ -209,17 +396,39 @@ class BaseItem:
     def get_tooltip(self) -> Optional[str]:
         return None
 
+    def invalidate_tooltip(self) -> None:
+        return
+
     def get_name(self) -> Optional[str]:
         return self.name
 
     def get_value(self) -> Optional[Any]:
         return self.value
 
+    def get_preview(self) -> Optional[Preview]:
+        """Get the static look of the editor, painted while no editor is created."""
+        value = self.get_value()
+        if value is None:
+            return None
+        return "text", str(value)
+
     def index_in_parent(self) -> int:
         if self.parent:
-            return self.parent.child_items.index(self)
+            return self.parent.get_child_index(self)
         return 0
 
+    def append_child(self, item: BaseItem) -> None:
+        raise TypeError(f"{self.__class__.__name__} can't have child items")
+
+    def clear_child_items(self) -> None:
+        return
+
+    def invalidate_deleted_items(self) -> None:
+        return
+
+    def _update_child_name(self, child: BaseItem, old_name: Optional[str]) -> None:
+        return
+
     def revert_to_prefab(self) -> bool:
         return True
 
@@ -229,13 +438,43 @@ class BaseItem:
     def get_possible_child_items(self) -> list:
         return []
 
-    def get_prefab_history(self) -> list:
-        return [i for i in self.lib_property.get_prefab_history] if self.prefab else []
+    def _get_prefab_history(self) -> Tuple[tuple, Tuple[str, ...]]:
+        """Get prefab history and its paths, cached by the root item per node ref."""
+        root = self._root
+        if not root or not self.node_ref:
+            history = tuple(self.lib_property.get_prefab_history) if self.prefab else ()
+            return history, tuple(i.prefab_path for i in history)
+
+        if root._prefab_histories is None:
+            root._prefab_histories = {}
+
+        cached = root._prefab_histories.get(self.node_ref)
+        if cached is not None:
+            prefab_history_cache.hit()
+            return cached
+
+        prefab_history_cache.miss()
+        history = tuple(self.lib_property.get_prefab_history) if self.prefab else ()
+        cached = history, tuple(i.prefab_path for i in history)
+        root._prefab_histories[self.node_ref] = cached
+        return cached
+
+    def get_prefab_history(self) -> tuple:
+        return self._get_prefab_history()[0]
+
+    def get_prefab_history_paths(self) -> Tuple[str, ...]:
+        return self._get_prefab_history()[1]
 
-    def get_prefab_history_paths(self) -> list:
-        return [i.prefab_path for i in self.get_prefab_history()]
+    def invalidate_prefab_histories(self) -> None:
+        """Forget prefab histories of the whole tree.
+
+        Needs to be called when an instance_of changes or a prefab file is written.
+        """
+        self.root._prefab_histories = None
 
     def debug_data(self) -> str:
+        from PropertyEditor.editors.pool import editor_pool
+
         return f"""
 {self.name} | {self.__class__.__name__}
 _______________________
@@ -253,14 +492,33 @@ Is local: {self.is_local}
 Parent: {self.parent}
 Instance Of: {self.lib_property.instance_of}
 Editor: {self.editor} | Related {self.editor.related if self.editor else None}
+{editor_pool}
+{lib_property_cache}
+{prefab_history_cache}
+{status_cache}
+{stat_cache.counter}
         """
 
-    def _get_child_items(self, child_level: int = 3) -> List[PropertyItem]:
+    def _get_child_items(self, child_level: int = 0) -> List[PropertyItem]:
         return []
 
-    def get_child_items(self, child_level: int = 3):
+    def get_child_items(self, child_level: int = 0):
         return self._get_child_items(child_level=child_level)
 
+    def has_children(self) -> bool:
+        return bool(self.child_items)
+
+    def can_fetch_more(self) -> bool:
+        return False
+
+    def fetch_child_items(self, source_index: Optional[QtCore.QModelIndex]) -> None:
+        """Ensure child items are built, through the model when there is one."""
+        model = source_index.model() if source_index is not None else None
+        if model and source_index.isValid():
+            model.ensure_fetched(source_index)
+        else:
+            self._get_child_items()
+
     def create_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ) -> Optional[BaseEditor]:
@@ -277,13 +535,13 @@ Editor: {self.editor} | Related {self.editor.related if self.editor else None}
         editor = self.get_editor(source_index, parent=parent)
         if editor:
             self.editor = editor
+            editor.link_parent_editors()
             return editor
 
     def get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ) -> Optional[BaseEditor]:
-        # Get child items first as they are needed for some editors
-        self._get_child_items()
+        # Editors needing child items fetch them, see fetch_child_items
         return self._get_editor(source_index, parent=parent)
 
     def remove_from_parent(self) -> bool:
@@ -324,6 +582,8 @@ Editor: {self.editor} | Related {self.editor.related if self.editor else None}
 class PropertyItem(BaseItem):
     """Manage the use of Property with a QAbstractItemModel."""
 
+    __slots__ = ("_root", "_node_ref", "_lib_generation", "field_plan", "_tooltip")
+
     def __init__(
         self,
         root: Optional[PropertyItem],
@@ -339,12 +599,13 @@ class PropertyItem(BaseItem):
 
         self._lib_property = lib_property
 
-        self._default_value = default_value or self.schema.get_default_value()
-
         self._root = root if root else self
-        self._root_node = root.lib_property if root else lib_property
         self._node_ref = lib_property.absolute_noderef if lib_property else None
-        self._config = None
+        self._lib_generation = self._root._generation
+        self.field_plan = None
+
+        # (prefab history paths, tooltip), built when Qt first asks for the tooltip
+        self._tooltip: Optional[Tuple[Tuple[str, ...], str]] = None
 
         self.add_instance_of()
 
@@ -398,9 +659,7 @@ class PropertyItem(BaseItem):
 
         elif kind == DataKind.object:
             if not inline:
-                field_name = next(
-                    itertools.islice(node.schema.properties.keys(), index, None)
-                )
+                field_name = get_child_plan(node).field_names[index]
                 new_node = node.get_object_field(field_name)
 
         elif kind == DataKind.objectSet:
@@ -449,8 +708,84 @@ class PropertyItem(BaseItem):
 
         return field_name, new_node, value, default_value
 
+    @staticmethod
+    def get_property_child_by_key(
+        node: Property,
+        key: str,
+    ) -> (str | None, Property | None, Any | None, Any | None):
+        """Get keyed element of a map, objectSet or unionSet property."""
+        kind = node.schema.data_kind
+        new_node = None
+
+        if kind == DataKind.map:
+            new_node = node.get_map_item(key)
+        elif kind == DataKind.objectSet:
+            new_node = node.get_objectset_item(key)
+        elif kind == DataKind.unionSet:
+            new_node = node.get_unionset_item(key)
+
+        return key, new_node, None, None
+
+    @classmethod
+    def iter_property_children(
+        cls,
+        node: Property,
+    ) -> Iterator[Tuple[str | None, Property | None, Any | None, Any | None]]:
+        """Iterate over all elements of a property in a single pass.
+
+        Same values as get_property_child_by_index() for each index,
+        but keys and default values are only fetched once from the property.
+        """
+        kind = node.schema.data_kind
+
+        if kind == DataKind.array:
+            default_values = node.schema.get_default_value()
+            for index in range(node.size):
+                yield (
+                    str(index),
+                    node.get_array_item(index),
+                    None,
+                    default_values[index] if default_values else [],
+                )
+
+        elif kind in [DataKind.map, DataKind.objectSet, DataKind.unionSet]:
+            if kind == DataKind.map:
+                keys = list(node.map_keys)
+            elif kind == DataKind.objectSet:
+                keys = list(node.objectset_keys)
+            else:
+                keys = list(node.unionset_keys)
+
+            for key in keys:
+                yield cls.get_property_child_by_key(node, key)
+
+        elif kind == DataKind.object:
+            for field_name in get_child_plan(node).field_names:
+                yield field_name, node.get_object_field(field_name), None, None
+
+        elif kind == DataKind.primitiveSet:
+            for index, key in enumerate(list(node.primset_keys)):
+                yield str(index), None, None, key
+
+        else:
+            for index in range(node.size):
+                yield cls.get_property_child_by_index(node, index, False)
+
     def get_tooltip(self) -> str:
-        """Get data to display in the view."""
+        """Get data to display in the view.
+
+        Memoized until the status changes (see refresh_status()), or the prefab
+        history changes (see invalidate_prefab_histories()).
+        """
+        prefab_history = self.get_prefab_history_paths()
+        if self._tooltip is None or self._tooltip[0] is not prefab_history:
+            self._tooltip = prefab_history, self._build_tooltip(prefab_history)
+        return self._tooltip[1]
+
+    def invalidate_tooltip(self) -> None:
+        self._tooltip = None
+
+    def _build_tooltip(self, prefab_history: Tuple[str, ...]) -> str:
         description = self.schema.description or "No description"
 
         status = "Status: "
@@ -465,10 +800,8 @@ class PropertyItem(BaseItem):
                 status += "comes from prefab"
 
         history = ""
-        prefab_history = self.get_prefab_history_paths()
         if prefab_history:
-            prefab_history.reverse()
-            history += "\nPrefab history:\n - " + "\n - ".join(prefab_history[1:])
+            history += "\nPrefab history:\n - " + "\n - ".join(prefab_history[-2::-1])
         else:
             history += "\nNo prefab history"
 
@@ -480,6 +813,10 @@ class PropertyItem(BaseItem):
 
         size_before_unset = self.lib_property.size
         self.lib_property.unset()
+        self.structure_changed()
+        self.invalidate_deleted_items()
+        self.invalidate_prefab_histories()
+        self.refresh_status(recursive=True)
 
         size_changed = False
         # Reset all child properties editors
@@ -519,117 +856,211 @@ class PropertyItem(BaseItem):
                     CopyMode.CopyOverride,
                     OverrideValueSource.Override,
                 )
+                self.structure_changed()
+                self.invalidate_deleted_items()
+                self.invalidate_prefab_histories()
                 self.revert_to_prefab()
                 self.reset_editors()
                 return prefab, file_path
         return None, None
 
     def add_instance_of(self) -> None:
-        if self.instance_of:
+        if self.instance_of or not self.is_container:
             return
 
         if self.lib_property and self.lib_property.instance_of:
             from PropertyEditor.properties.other import InstanceOfItem
 
             self.instance_of = InstanceOfItem(self)
-            self.child_items.append(self.instance_of)
+            self.append_child(self.instance_of)
+
+
+# Data kinds of the nodes walked by count_node_overrides()
+WALKED_KINDS = (
+    DataKind.object,
+    DataKind.array,
+    DataKind.map,
+    DataKind.objectSet,
+    DataKind.unionSet,
+)
+# Max number of nodes read by count_node_overrides() for one container
+MAX_WALKED_NODES = 10000
+
+
+def count_node_overrides(node: Property) -> Tuple[int, int]:
+    """Get counts of set and of prefab overridden nodes under a node, up to one.
+
+    Walks EntityLib instead of the items, for containers not fully fetched.
+    The overrides filters only need to know if there are any, so the walk stops
+    once both counts are found, or after MAX_WALKED_NODES nodes. Counts not found
+    then count as one, to keep the row until its children are built.
+    Only nodes with child nodes are walked, union data counts as their child.
+    """
+    set_count = override_count = walked = 0
+    nodes = [node]
+    while nodes:
+        node = nodes.pop()
+        kind = node.schema.data_kind
+        if kind == DataKind.union:
+            children = [node.get_union_data()]
+        elif kind in WALKED_KINDS:
+            children = [n for _, n, _, _ in PropertyItem.iter_property_children(node)]
+        else:
+            continue
+
+        for child in children:
+            if child is None:
+                continue
+            set_count = set_count or int(child.is_set)
+            override_count = override_count or int(
+                child.has_prefab and not child.is_default
+            )
+            if set_count and override_count:
+                return set_count, override_count
+
+            walked += 1
+            if walked >= MAX_WALKED_NODES:
+                return 1, 1
+            nodes.append(child)
+
+    return set_count, override_count
 
 
 class ContainerPropertyItem(PropertyItem):
 
+    __slots__ = (
+        "_child_items",
+        "_child_rows",
+        "_child_names",
+        "_status",
+        "_child_plan",
+        "_fetched",
+        "_pending",
+        "_prefab_keys",
+        "_deleted_keys",
+        "_override_counts",
+        "_can_add",
+        "_generation",
+        "_config",
+        "_prefab_histories",
+    )
+
     container = True
 
-    @staticmethod
-    def _create_child(index, root, lib_property, field_name, value, parent=None):
-        data_kind = lib_property.schema.data_kind
+    def __init__(
+        self,
+        root: Optional[PropertyItem],
+        lib_property: Property,
+        property_name: str,
+        default_value: Any,
+        parent=None,
+    ):
+        """Initialize."""
+        # Set and prefab overridden items under this one, None when not counted yet
+        self._override_counts: Optional[Tuple[int, int]] = None
 
-        if data_kind == DataKind.array:
-            from .array import ColorItem, QuatItem, ArrayItem
+        self.child_items = []
+        self._child_plan: Optional[ChildPlan] = None
 
-            if lib_property.schema.user_meta.get("widget", False) == "color":
-                prop_type = ColorItem
-            elif lib_property.schema.name == "Quat":
-                prop_type = QuatItem
-            else:
-                prop_type = ArrayItem
+        # Children are built on demand, see Model.fetchMore()
+        # _pending iterates over the children not built yet
+        self._fetched = False
+        self._pending = None
 
-        elif data_kind == DataKind.number:
-            from .number import NumberItem
+        # Keys of the prefab, and the ones removed from the property
+        # Computed when needed, then updated on each insert and erase
+        self._prefab_keys: Optional[Set[str]] = None
+        self._deleted_keys: Optional[Dict[str, None]] = None
 
-            prop_type = NumberItem
+        # Structural generation and if children could be added then, see can_add()
+        self._can_add: Optional[Tuple[int, bool]] = None
 
-        elif data_kind == DataKind.integer:
-            from .integer import IntegerItem
+        # Structural generation of the tree, config and prefab histories by node ref,
+        # only used on root items
+        self._generation = 0
+        self._config = None
+        self._prefab_histories: Optional[Dict[str, tuple]] = None
 
-            prop_type = IntegerItem
+        super().__init__(root, lib_property, property_name, default_value, parent=parent)
 
-        elif data_kind == DataKind.boolean:
-            from .boolean import BooleanItem
+    @property
+    def child_plan(self) -> Optional[ChildPlan]:
+        """Get the shared child plan of an object property."""
+        # False means the property has no plan, as it isn't an object
+        if self._child_plan is None:
+            self._child_plan = get_child_plan(self.lib_property) or False
+        return self._child_plan or None
 
-            prop_type = BooleanItem
+    @staticmethod
+    def _get_child_class(
+        lib_property: Property, field_name: str, parent: Optional[PropertyItem]
+    ) -> Tuple[type, Optional[FieldPlan]]:
+        """Get the item class of a child node, and its field plan if it has one."""
+        field_plan = None
+        if parent and parent.child_plan:
+            field_plan = parent.child_plan.get(field_name)
+
+        if field_plan:
+            prop_type = field_plan.item_class
+        else:
+            prop_type = get_item_class(lib_property.schema, field_name)
 
-        elif data_kind == DataKind.string:
+        # Strings without path metadata are paths only if they point to a file
+        if not prop_type:
             from .string import PathItem, StringItem
 
-            if lib_property.schema.user_meta.get("path", False):
-                prop_type = PathItem
-            elif "path" in field_name.lower() or (
-                lib_property.value
-                and Path(
-                    str(lib_property.entitylib.rawdata_path), str(lib_property.value)
-                ).is_file()
+            if lib_property.value and stat_cache.is_file(
+                Path(str(lib_property.entitylib.rawdata_path), str(lib_property.value))
             ):
                 prop_type = PathItem
             else:
                 prop_type = StringItem
 
-        elif data_kind == DataKind.entityRef:
-            from .entity_ref import EntityRefItem
+        return prop_type, field_plan
 
-            prop_type = EntityRefItem
-
-        elif data_kind == DataKind.objectSet:
-            from .object_set import ObjectSetItem
-
-            prop_type = ObjectSetItem
-
-        elif data_kind == DataKind.unionSet:
-            from .union_set import UnionSetItem
-
-            prop_type = UnionSetItem
-
-        elif data_kind == DataKind.map:
-            from .map import MapItem
-
-            prop_type = MapItem
-
-        elif data_kind == DataKind.primitiveSet:
-            from .primitive_set import PrimitiveSetItem
-
-            prop_type = PrimitiveSetItem
-
-        elif data_kind == DataKind.union:
-            from .union import UnionItem
-
-            prop_type = UnionItem
-
-        elif data_kind == DataKind.object:
-            from .object import ObjectItem
-
-            prop_type = ObjectItem
-
-        else:
-            raise NotImplementedError(f"Can't created child with {data_kind}")
-
-        return prop_type(root, lib_property, field_name, value, parent=parent)
+    @staticmethod
+    def _create_child(index, root, lib_property, field_name, value, parent=None):
+        prop_type, field_plan = ContainerPropertyItem._get_child_class(
+            lib_property, field_name, parent
+        )
+        child = prop_type(root, lib_property, field_name, value, parent=parent)
+        child.field_plan = field_plan
+        return child
+
+    def get_child_name(self, field_name: str) -> str:
+        """Get the name shown for a child, its field name unless overridden."""
+        return field_name
+
+    def _create_named_child(
+        self,
+        prop_type: type,
+        field_plan: Optional[FieldPlan],
+        lib_property: Property,
+        field_name: str,
+        value: Any,
+    ) -> BaseItem:
+        child = prop_type(self._root, lib_property, field_name, value, parent=self)
+        child.field_plan = field_plan
+        self._name_child(child, field_name)
+        return child
+
+    def _name_child(self, child: BaseItem, field_name: str) -> None:
+        # Renamed children are still sorted by their field name
+        name = self.get_child_name(field_name)
+        if name != field_name:
+            child.sort_value = field_name
+            child.name = name
 
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        if self.get_possible_child_items():
+        from PropertyEditor.editors.pool import editor_pool
+
+        if self.can_add():
             from PropertyEditor.editors.add_child import EditorChildrenManager
 
-            return EditorChildrenManager(
+            return editor_pool.acquire(
+                EditorChildrenManager,
                 self,
                 source_index,
                 parent=parent,
@@ -637,12 +1068,20 @@ class ContainerPropertyItem(PropertyItem):
         elif self.is_removable:
             from PropertyEditor.editors.remove_item import EditorRemoveItem
 
-            return EditorRemoveItem(
+            return editor_pool.acquire(
+                EditorRemoveItem,
                 self,
                 source_index,
                 parent=parent,
             )
 
+    def get_preview(self) -> Optional[Preview]:
+        if self.can_add():
+            return "size", self.lib_property.size
+        elif self.is_removable:
+            return "button", "Remove"
+        return None
+
     def _remove_child_item(self, child: BaseItem = None) -> bool:
         raise NotImplementedError
 
@@ -654,40 +1093,202 @@ class ContainerPropertyItem(PropertyItem):
     ) -> Tuple[Optional[Property], Optional[str], Optional[Any]]:
         raise NotImplementedError
 
-    def _get_deleted_items(self) -> List[str]:
+    @staticmethod
+    def _get_keys(node: Property) -> List[str]:
+        """Get keys of a keyed container's node, used to find deleted items."""
         return []
 
     def allow_copy(self) -> bool:
         return False
 
+    @property
+    def child_items(self) -> List[BaseItem]:
+        """Get child items.
+
+        The list must only be updated through append_child(), remove_child_item()
+        or by setting a new list, to keep child rows and names indexes in sync.
+        """
+        return self._child_items
+
+    @child_items.setter
+    def child_items(self, items: List[BaseItem]) -> None:
+        self._child_items = []
+        self._child_rows = {}
+        self._child_names = {}
+        self._status = StatusSnapshot()
+        self._override_counts = None
+        for item in items:
+            self._append_child(item)
+        if items:
+            self.overrides_changed()
+
     def child_count(self) -> int:
-        return len(self.child_items)
+        return len(self._child_items)
 
     def append_child(self, item: BaseItem) -> None:
         """Append a new child."""
-        self.child_items.append(item)
+        self._append_child(item)
+        self.overrides_changed()
+
+    def _append_child(self, item: BaseItem) -> None:
+        # Override counts are marked as stale by the caller, once per batch
+        self._child_rows[item] = len(self._child_items)
+        self._child_names.setdefault(item.name, item)
+        self._child_items.append(item)
+        self._status.append()
+
+    def _pop_child(self, child: BaseItem) -> None:
+        """Remove a child from child items and update indexes."""
+        row = self._child_rows.pop(child)
+        del self._child_items[row]
+        self._status.pop(row)
+        for i in range(row, len(self._child_items)):
+            self._child_rows[self._child_items[i]] = i
+        self.overrides_changed()
+
+        self._remove_child_name(child, child.name)
+
+    def insert_child_items(self, row: int, items: List[BaseItem]) -> None:
+        """Insert children at a row, see Model.sync_child_rows()."""
+        from PropertyEditor.properties.other import InstanceOfItem
+
+        self._child_items[row:row] = items
+        self._status.insert(row, len(items))
+        for i in range(row, len(self._child_items)):
+            self._child_rows[self._child_items[i]] = i
+
+        for item in items:
+            self._update_child_name(item, None)
+            if isinstance(item, InstanceOfItem):
+                self.instance_of = item
+        self.overrides_changed()
+
+    def pop_child_items(self, first: int, last: int) -> List[BaseItem]:
+        """Remove children from first to last rows, see Model.sync_child_rows()."""
+        items = self._child_items[first : last + 1]
+        del self._child_items[first : last + 1]
+        self._status.pop(first, len(items))
+
+        for item in items:
+            del self._child_rows[item]
+        for i in range(first, len(self._child_items)):
+            self._child_rows[self._child_items[i]] = i
+
+        for item in items:
+            self._remove_child_name(item, item.name)
+            if item is self.instance_of:
+                self.instance_of = None
+        self.overrides_changed()
+        return items
+
+    def _remove_child_name(self, child: BaseItem, name: Optional[str]) -> None:
+        if self._child_names.get(name) is not child:
+            return
+
+        del self._child_names[name]
+
+        # Another child may use the same name
+        for other in self._child_items:
+            if other is not child and other.name == name:
+                self._child_names[name] = other
+                break
+
+    def _update_child_name(self, child: BaseItem, old_name: Optional[str]) -> None:
+        if child not in self._child_rows:
+            return
+
+        self._remove_child_name(child, old_name)
+        # Keep the first child using a name, as a linear search would do
+        other = self._child_names.get(child.name)
+        if not other or self._child_rows[child] < self._child_rows[other]:
+            self._child_names[child.name] = child
 
     def get_child_at_pos(self, index: int) -> Optional[BaseItem]:
-        if 0 <= index < len(self.child_items):
-            return self.child_items[index]
+        if 0 <= index < len(self._child_items):
+            return self._child_items[index]
         return None
 
+    def has_child(self, name: str) -> bool:
+        return name in self._child_names
+
     def get_child_by_name(self, name: str) -> BaseItem:
-        for child in self.child_items:
-            if child.name == name:
-                return child
-        raise NameError(f"Can't find a {name} child property for {self.name}")
+        child = self._child_names.get(name)
+        if child is None:
+            raise NameError(f"Can't find a {name} child property for {self.name}")
+        return child
+
+    def get_child_row(self, name: str) -> Optional[int]:
+        """Get row of the first child using a name."""
+        child = self._child_names.get(name)
+        if child is None:
+            return None
+        return self._child_rows[child]
+
+    def get_child_row_by_key(self, key: str) -> Optional[int]:
+        """Get row of the child of an EntityLib key, e.g. a node ref segment."""
+        return self.get_child_row(self.get_child_name(key))
 
     def get_child_index(self, item: BaseItem) -> int:
-        for i, child in enumerate(self.child_items):
-            if child == item:
-                return i
-        raise IndexError(f"Can't find a {item.name} child property for {self.name}")
+        row = self._child_rows.get(item)
+        if row is None:
+            raise IndexError(
+                f"Can't find a {item.name} child property for {self.name}"
+            )
+        return row
+
+    def get_child_status(self, child: BaseItem, flag: int) -> Optional[bool]:
+        """Get a status flag of a child from the status snapshot."""
+        row = self._child_rows.get(child)
+        if row is None:
+            return None
+        return self._status.get(self._child_items, row, flag)
+
+    def refresh_child_status(self, child: BaseItem) -> None:
+        row = self._child_rows.get(child)
+        if row is not None:
+            self._status.refresh(self._child_items, [row])
+
+    def invalidate_children_status(self) -> None:
+        """Mark status of the whole hierarchy as stale, to read it again when needed."""
+        self._status.invalidate()
+        self._override_counts = None
+        for child in self._child_items:
+            child.invalidate_tooltip()
+            child.invalidate_children_status()
+
+    def get_override_counts(self) -> Tuple[int, int]:
+        """Get counts of set and of prefab overridden items under this one.
+
+        Counted from the items once all are built, else from EntityLib up to one
+        (see count_node_overrides()), then kept until a status refresh or a child
+        insert or removal under this item (see overrides_changed()).
+        """
+        if self._override_counts is None and not self._fetched:
+            node = self.lib_property
+            self._override_counts = count_node_overrides(node) if node else (0, 0)
+        elif self._override_counts is None:
+            set_count = override_count = 0
+            for child in self._child_items:
+                child_set_count, child_override_count = child.get_override_counts()
+                set_count += child_set_count + child.is_set
+                override_count += child_override_count + child.has_prefab_overrides
+            self._override_counts = set_count, override_count
+        return self._override_counts
+
+    def overrides_changed(self) -> None:
+        self._override_counts = None
+        super().overrides_changed()
+
+    def clear_child_items(self) -> None:
+        """Remove all child items, they will be built again when needed."""
+        self.child_items = []
+        self._fetched = False
+        self._pending = None
+        self.invalidate_deleted_items()
+        self.overrides_changed()
 
     def reset_children(self) -> None:
-        for item in [i for i in self.child_items]:
-            del item
-        self.child_items = []
+        self.clear_child_items()
         self._get_child_items()
 
     def remove_child_at(self, row: int) -> bool:
@@ -702,8 +1303,13 @@ class ContainerPropertyItem(PropertyItem):
         elif not child:
             child = self.child_items[-1]
 
-        if isinstance(child, DeletedItem) or self._remove_child_item(child):
-            self.child_items.remove(child)
+        if isinstance(child, DeletedItem):
+            self._pop_child(child)
+            return True
+
+        elif self._remove_child_item(child):
+            self._pop_child(child)
+            self._key_erased(child.name)
             return True
 
         raise Exception(f"{child} removal from {self} failed!")
@@ -711,32 +1317,66 @@ class ContainerPropertyItem(PropertyItem):
     def get_possible_child_items(self) -> list:
         return self._get_possible_child_items()
 
-    def _get_child_items(self, child_level: int = 3) -> List[PropertyItem]:
-        """Get child items.
+    def can_add(self) -> bool:
+        """Get if children can be added, until the tree structure changes.
 
-        As we can't load a whole scene at start, for performance reasons,
-        load a only a specific depth.
-        The other properties will be loaded when needed.
+        Previews are painted often, and possible children go through the schema.
         """
-        from PropertyEditor.properties.other import InstanceOfItem
+        generation = self.root._generation
+        if self._can_add is None or self._can_add[0] != generation:
+            self._can_add = generation, bool(self.get_possible_child_items())
+        return self._can_add[1]
+
+    def get_child_keys(self) -> Set[str]:
+        """Get keys of the node and deleted keys, without building child items."""
+        return set(self._get_keys(self.lib_property)) | set(self._get_deleted_keys())
+
+    def has_children(self) -> bool:
+        if self._child_items:
+            return True
+        elif self._fetched:
+            return False
+        return self.lib_property.size > 0 or (
+            self.has_prefab and self.missing_deleted_items()
+        )
+
+    def can_fetch_more(self) -> bool:
+        return not self._fetched
 
+    def create_child_items(self, limit: Optional[int] = None) -> List[BaseItem]:
+        """Create items of the next children, without adding them to child items yet.
+
+        Used by the model to know how many rows will be inserted (see Model.fetchMore()).
+        Wide containers are built by pages of limit items, deleted items come last.
+        """
         if not self.lib_property:
             raise Exception(f"{self} has no lib_property. This should never happen.")
 
-        if (
-            not self.child_items
-            or len(self.child_items) == 1
-            and isinstance(self.child_items[0], InstanceOfItem)
-        ):
-            for index in range(self.lib_property.size):
-                (
-                    field_name,
-                    lib_property,
-                    value,
-                    default_value,
-                ) = self.get_property_child_by_index(self.lib_property, index, False)
+        if self._pending is None:
+            self._pending = self._plan_children()
+
+        items = []
+        for _, create in self._pending:
+            items.append(create())
+            if limit and len(items) >= limit:
+                return items
+
+        self._pending = None
+        return items
 
-                child = self._create_child(
+    def _plan_children(self) -> Iterator[ChildEntry]:
+        """Iterate keys of the children and factories of their items, in row order.
+
+        Children with a node are keyed by name and item class, as in
+        Model.sync_child_rows(), the others by None. Deleted items come last.
+        """
+        from PropertyEditor.properties.other import DeletedItem
+
+        children = enumerate(self.iter_property_children(self.lib_property))
+        for index, (field_name, lib_property, _, default_value) in children:
+            if lib_property is None:
+                yield None, partial(
+                    self._create_child,
                     index,
                     self._root,
                     lib_property,
@@ -744,9 +1384,62 @@ class ContainerPropertyItem(PropertyItem):
                     default_value,
                     parent=self,
                 )
+                continue
+
+            prop_type, field_plan = self._get_child_class(
+                lib_property, field_name, self
+            )
+            key = self.get_child_name(field_name), prop_type
+            yield key, partial(
+                self._create_named_child,
+                prop_type,
+                field_plan,
+                lib_property,
+                field_name,
+                default_value,
+            )
+
+        for key in self._get_deleted_keys():
+            yield None, partial(DeletedItem, key, parent=self)
+
+    def plan_child_items(self) -> List[ChildEntry]:
+        """Plan all the children, as a first fetch would after __init__().
+
+        Items are only created by calling the factories, see Model.sync_child_rows().
+        Only the InstanceOf item is planned if children were never fetched.
+        """
+        from PropertyEditor.properties.other import InstanceOfItem
+
+        entries = []
+        if self.lib_property.instance_of:
+            entries.append((None, partial(InstanceOfItem, self)))
 
-                self.append_child(child)
-            self.add_deleted_items()
+        if self._fetched or self._pending is not None:
+            self._pending = None
+            entries.extend(self._plan_children())
+            self._fetched = True
+        return entries
+
+    def add_fetched_child_items(self, items: List[BaseItem]) -> None:
+        """Add child items created by create_child_items()."""
+        first_row = len(self._child_items)
+        for item in items:
+            self._append_child(item)
+        self._fetched = self._pending is None
+        self.overrides_changed()
+
+        # Read status of all new children in one pass
+        self._status.refresh(self._child_items, range(first_row, len(self._child_items)))
+
+    def _get_child_items(self, child_level: int = 0) -> List[PropertyItem]:
+        """Get child items.
+
+        As we can't load a whole scene at start, for performance reasons,
+        children are only built when needed, usually by the model when a row
+        is expanded. Use child_level to also build the given depth below.
+        """
+        while not self._fetched:
+            self.add_fetched_child_items(self.create_child_items())
 
         self.add_instance_of()
 
@@ -760,6 +1453,7 @@ class ContainerPropertyItem(PropertyItem):
     def add_child(self, property_name: str) -> Optional[BaseItem]:
         prop, field_name, default_value = self._add_child(property_name)
         if prop and field_name:
+            self._key_inserted(field_name)
             child_property = self._create_child(
                 self.child_count(),
                 self._root,
@@ -768,6 +1462,7 @@ class ContainerPropertyItem(PropertyItem):
                 None,
                 parent=self,
             )
+            self._name_child(child_property, field_name)
 
             self.append_child(child_property)
             child_property._get_child_items()
@@ -780,23 +1475,42 @@ class ContainerPropertyItem(PropertyItem):
 
         return [i for i in self.child_items if not isinstance(i, DeletedItem)]
 
-    def get_deleted_items(self) -> List[str]:
-        from PropertyEditor.properties.other import DeletedItem
+    def _get_deleted_keys(self) -> Dict[str, None]:
+        if self._deleted_keys is None:
+            prefab = self.prefab
+            prefab_keys = self._get_keys(prefab) if prefab else []
+            keys = set(self._get_keys(self.lib_property))
+
+            self._prefab_keys = set(prefab_keys)
+            self._deleted_keys = dict.fromkeys(k for k in prefab_keys if k not in keys)
+        return self._deleted_keys
+
+    def _key_inserted(self, key: str) -> None:
+        if self._deleted_keys is not None:
+            self._deleted_keys.pop(key, None)
 
-        if not self.prefab:
-            return []
+    def _key_erased(self, key: str) -> None:
+        if self._deleted_keys is not None and key in self._prefab_keys:
+            self._deleted_keys[key] = None
 
-        deleted_items = self._get_deleted_items()
-        if not deleted_items:
-            return []
+    def invalidate_deleted_items(self) -> None:
+        """Forget deleted keys, to use when keys change without an insert or erase.
 
-        existing_deleted_items = [
-            c.name for c in self.child_items if isinstance(c, DeletedItem)
-        ]
-        return [d for d in deleted_items if d not in existing_deleted_items]
+        Children built under the item are invalidated too, as reverting, pasting or
+        saving a node also changes the keys of the nodes under it.
+        """
+        self._prefab_keys = None
+        self._deleted_keys = None
+        for child in self._child_items:
+            child.invalidate_deleted_items()
+
+    def get_deleted_items(self) -> List[str]:
+        """Get keys removed from the prefab which have no DeletedItem yet."""
+        # A deleted key can only be used by a DeletedItem, as it's not in the node
+        return [k for k in self._get_deleted_keys() if not self.has_child(k)]
 
     def missing_deleted_items(self) -> bool:
-        return bool(self.get_deleted_items())
+        return any(not self.has_child(k) for k in self._get_deleted_keys())
 
     def add_deleted_items(self) -> None:
         from PropertyEditor.properties.other import DeletedItem
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
 import math
-from typing import Any, List, Optional, TYPE_CHECKING
+from functools import partial
+from typing import Any, Iterator, List, Optional, TYPE_CHECKING
 
 from EntityLibPy import Property
 
 from .other import EulerValueItem
-from ._meta import PropertyItem, ContainerPropertyItem
+from ._meta import ChildEntry, PropertyItem, ContainerPropertyItem, Preview
 from ..editors.add_array_child import EditorAddArrayChild
 from ..editors.color import EditorColor
 from ..editors.multi_child import EditorMultiChild
+from ..editors.pool import editor_pool
 
 if TYPE_CHECKING:
     from PySide2 import QtCore, QtWidgets
 
 
+def get_array_values(node: Property) -> List[Any]:
+    """Get values of the items of an array node, without building child items."""
+    return [node.get_array_item(i).value for i in range(node.size)]
+
+
 class ArrayItem(ContainerPropertyItem):
+    __slots__ = ()
+
     @property
     def is_removable(self) -> bool:
         if not self.parent.lib_property.schema.max_items:
@@ -33,61 +42,66 @@ class ArrayItem(ContainerPropertyItem):
 
     def _add_child(self, property_name: str, extra: Any = None):
         node = self.lib_property.push_back()
+        self.structure_changed()
         field_name = str(self.lib_property.size - 1)
         return node, field_name, None
 
     def _remove_child_item(self, child: Optional[PropertyItem] = None) -> bool:
         self.lib_property.pop_back()
+        self.structure_changed()
         return True
 
-    def _get_child_items(self, child_level: int = 3) -> List[PropertyItem]:
-        result = super()._get_child_items(child_level=child_level)
-        self.rename_child_items()
-        return result
-
-    def rename_child_items(self) -> None:
+    def get_child_name(self, field_name: str) -> str:
         if self.name in ["Position", "Orientation", "Scale"] or "Axis" in self.name:
-            if self.child_count() == 4:
+            size = self.lib_property.size
+            if size == 4:
                 value = "XYZW"
-            elif self.child_count() == 3:
+            elif size == 3:
                 value = "XYZ"
             else:
-                return
+                return field_name
 
-            for child in self.child_items:
-                actual_name = child.name
-                if actual_name.isnumeric():
-                    child.name = value[int(actual_name)]
+            if field_name.isnumeric() and int(field_name) < size:
+                return value[int(field_name)]
+        return field_name
+
+    @property
+    def inline_children(self) -> bool:
+        """Whether small fixed size arrays are edited on their own row."""
+        size = self.lib_property.size
+        return 5 > size > 0 and size == self.schema.max_items
 
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
 
-        if 5 > self.child_count() > 0 and self.child_count() == self.schema.max_items:
+        if self.inline_children:
             return EditorMultiChild(self, source_index, parent=parent)
 
-        return EditorAddArrayChild(
+        return editor_pool.acquire(
+            EditorAddArrayChild,
             self,
             source_index,
             parent=parent,
         )
 
+    def get_preview(self) -> Optional[Preview]:
+        if self.inline_children:
+            values = get_array_values(self.lib_property)
+            return "text", ", ".join(str(value) for value in values)
+        return "size", self.lib_property.size
+
 
 class ColorItem(ContainerPropertyItem):
 
-    color = True
+    __slots__ = ()
 
-    def _get_child_items(self, child_level: int = 3) -> List[PropertyItem]:
-        result = super()._get_child_items(child_level=child_level)
-        self.rename_child_items()
-        return result
+    color = True
 
-    def rename_child_items(self) -> None:
-        for child in self.child_items:
-            actual_name = child.name
-            if actual_name.isnumeric():
-                child.name = "RGBA"[int(actual_name)]
-                child.sort_value = actual_name
+    def get_child_name(self, field_name: str) -> str:
+        if field_name.isnumeric() and int(field_name) < 4:
+            return "RGBA"[int(field_name)]
+        return field_name
 
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
@@ -98,8 +112,16 @@ class ColorItem(ContainerPropertyItem):
             parent=parent,
         )
 
+    def get_preview(self) -> Optional[Preview]:
+        values = get_array_values(self.lib_property)
+        if len(values) < 3:
+            return None
+        return "color", tuple(values)
+
 
 class QuatItem(ContainerPropertyItem):
+    __slots__ = ("real_child_items",)
+
     def __init__(
         self,
         root: Optional[PropertyItem],
@@ -113,18 +135,15 @@ class QuatItem(ContainerPropertyItem):
         )
         self.real_child_items = []
 
-    def _get_child_items(self, child_level: int = 2) -> None:
-        if not self.child_items:
-            self.real_child_items = super()._get_child_items(child_level=child_level)
+    def _plan_children(self) -> Iterator[ChildEntry]:
+        # Use Euler values as child items instead of quaternions
+        # Quaternions items are stored into self.real_child_items
+        # They are always built at once, as the four are needed to get Euler values
+        self.real_child_items = [create() for _, create in super()._plan_children()]
 
-            # Reset child items as we want to use Euler values instead of quaternions
-            # Quaternions items are stored into self.real_child_items
-            # And Eulers will be added to child items just after
-            self.child_items = []
-
-            euler = self.quat_to_euler()
-            for i, axis in enumerate("XYZ"):
-                self.child_items.append(EulerValueItem(axis, euler[i], self))
+        euler = self.quat_to_euler()
+        for i, axis in enumerate("XYZ"):
+            yield None, partial(EulerValueItem, axis, euler[i], self)
 
     @property
     def euler(self) -> List[float]:
@@ -132,7 +151,7 @@ class QuatItem(ContainerPropertyItem):
 
     @property
     def quaternion(self) -> List[float]:
-        return [c.lib_property.value for c in self.real_child_items]
+        return get_array_values(self.lib_property)
 
     def quat_to_euler(self) -> List[float]:
         x, y, z, w = self.quaternion
@@ -181,13 +200,14 @@ class QuatItem(ContainerPropertyItem):
             return
 
         self.lib_property.unset()
+        self.structure_changed()
+        self.refresh_status(recursive=True)
 
         # Reset all child properties
         euler = self.quat_to_euler()
         for i, child in enumerate(self.child_items):
             child.update_parent = False
             child.value = euler[i]
-            child.is_set = False
             child.reset_editors()
             child.update_parent = True
 
@@ -204,6 +224,11 @@ class QuatItem(ContainerPropertyItem):
             parent=parent,
         )
 
+    def get_preview(self) -> Optional[Preview]:
+        # Rounded, as Euler values read back from the quaternion aren't exact
+        values = ", ".join(str(round(value, 3)) for value in self.quat_to_euler())
+        return "text", values
+
     def debug_data(self) -> str:
         return f"""
 {self.name} | {self.__class__.__name__}
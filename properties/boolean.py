@@ -1,20 +1,27 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
-from ._meta import PropertyItem
+from ._meta import PropertyItem, Preview
 from ..editors.checkbox import EditorCheckbox
+from ..editors.pool import editor_pool
 
 if TYPE_CHECKING:
     from PySide2 import QtCore, QtWidgets
 
 
 class BooleanItem(PropertyItem):
+    __slots__ = ()
+
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        return EditorCheckbox(
+        return editor_pool.acquire(
+            EditorCheckbox,
             self,
             source_index,
             parent=parent,
         )
+
+    def get_preview(self) -> Optional[Preview]:
+        return "check", bool(self.value)
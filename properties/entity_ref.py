@@ -6,6 +6,7 @@ from EntityLibPy import EntityRef
 
 from ._meta import PropertyItem
 from .string import EditorLineEdit
+from ..editors.pool import editor_pool
 
 if TYPE_CHECKING:
     from PySide2 import QtCore, QtWidgets
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
 
 class EntityRefItem(PropertyItem):
 
+    __slots__ = ()
+
     path = True
 
     @property
@@ -26,7 +29,8 @@ class EntityRefItem(PropertyItem):
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        return EditorLineEdit(
+        return editor_pool.acquire(
+            EditorLineEdit,
             self,
             source_index,
             parent=parent,
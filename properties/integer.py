@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ._meta import PropertyItem
+from ..editors.pool import editor_pool
 from ..editors.spinbox import EditorSpinboxContainer
 
 if TYPE_CHECKING:
@@ -10,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class IntegerItem(PropertyItem):
+    __slots__ = ()
+
     @property
     def sub_color(self) -> bool:
         return (
@@ -19,7 +22,8 @@ class IntegerItem(PropertyItem):
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        return EditorSpinboxContainer(
+        return editor_pool.acquire(
+            EditorSpinboxContainer,
             self,
             source_index,
             parent=parent,
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import List, Optional, Any, TYPE_CHECKING
 
-from ._meta import ContainerPropertyItem, PropertyItem
+from EntityLibPy import Property
+
+from ._meta import ContainerPropertyItem, PropertyItem, Preview
 from ..editors.map import EditorAddMapChild
 
 if TYPE_CHECKING:
@@ -11,20 +13,25 @@ if TYPE_CHECKING:
 
 class MapItem(ContainerPropertyItem):
 
+    __slots__ = ()
+
     removable = True
 
-    def _get_deleted_items(self) -> List[PropertyItem]:
-        prop_items = [i for i, _ in self.lib_property.map_items]
-        return [i for i, _ in self.lib_property.prefab.map_items if i not in prop_items]
+    @staticmethod
+    def _get_keys(node: Property) -> List[str]:
+        return [i for i, _ in node.map_items]
 
     def _add_child(self, property_name: str, extra: Any = None):
         field_name = str(property_name)
         node = self.lib_property.insert_map_item(field_name)
+        self.structure_changed()
 
         return node, field_name, None
 
     def _remove_child_item(self, child: Optional[PropertyItem] = None) -> bool:
-        return self.lib_property.erase_map_item(child.name)
+        result = self.lib_property.erase_map_item(child.name)
+        self.structure_changed()
+        return result
 
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
@@ -34,3 +41,6 @@ class MapItem(ContainerPropertyItem):
             source_index,
             parent=parent,
         )
+
+    def get_preview(self) -> Optional[Preview]:
+        return "size", self.lib_property.size
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .integer import IntegerItem
+from ..editors.pool import editor_pool
 from ..editors.sliders import EditorDoubleSlider
 from ..editors.spinbox import EditorDoubleSpinboxContainer
 
@@ -11,13 +12,16 @@ if TYPE_CHECKING:
 
 
 class NumberItem(IntegerItem):
+    __slots__ = ()
+
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
         if isinstance(self.minimum, float) or isinstance(self.maximum, float):
             return EditorDoubleSlider(self, source_index, parent=parent)
         else:
-            return EditorDoubleSpinboxContainer(
+            return editor_pool.acquire(
+                EditorDoubleSpinboxContainer,
                 self,
                 source_index,
                 parent=parent,
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 
 class ObjectItem(ContainerPropertyItem):
+    __slots__ = ()
+
     @property
     def value(self) -> Any:
         """Get value."""
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from typing import Any, List, Optional, TYPE_CHECKING
 
-from ._meta import ContainerPropertyItem, PropertyItem
+from EntityLibPy import Property
+
+from ._meta import ContainerPropertyItem, PropertyItem, Preview
 from ..editors.object_set import EditorAddObjectToSet
+from ..editors.pool import editor_pool
 
 if TYPE_CHECKING:
     from PySide2 import QtCore, QtWidgets
@@ -11,6 +14,8 @@ if TYPE_CHECKING:
 
 class ObjectSetItem(ContainerPropertyItem):
 
+    __slots__ = ()
+
     removable = True
 
     @property
@@ -22,22 +27,28 @@ class ObjectSetItem(ContainerPropertyItem):
     def value(self, value: Any) -> None:
         return
 
-    def _get_deleted_items(self) -> List[PropertyItem]:
-        prop_items = [i for i in self.lib_property.objectset_keys]
-        return [
-            i for i in self.lib_property.prefab.objectset_keys if i not in prop_items
-        ]
+    @staticmethod
+    def _get_keys(node: Property) -> List[str]:
+        return list(node.objectset_keys)
 
     def _add_child(self, property_name: str, extra: Any = None):
         field_name = str(property_name)
         node = self.lib_property.insert_objectset_item(field_name)
+        self.structure_changed()
 
         return node, field_name, None
 
     def _remove_child_item(self, child: Optional[PropertyItem] = None) -> bool:
-        return self.lib_property.erase_objectset_item(child.name)
+        result = self.lib_property.erase_objectset_item(child.name)
+        self.structure_changed()
+        return result
 
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        return EditorAddObjectToSet(self, source_index, parent=parent)
+        return editor_pool.acquire(
+            EditorAddObjectToSet, self, source_index, parent=parent
+        )
+
+    def get_preview(self) -> Optional[Preview]:
+        return "size", self.lib_property.size
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Optional, Tuple, TYPE_CHECKING
 
 from PropertyEditor.config import Config
+from PropertyEditor.utils import stat_cache
 from PropertyEditor.editors.add_back import AddBackItem
 from PropertyEditor.editors.instance_of import EditorInstanceOf
+from PropertyEditor.editors.pool import editor_pool
 from PropertyEditor.editors.spinbox import EditorDoubleSpinboxContainer
-from PropertyEditor.properties._meta import BaseItem
+from PropertyEditor.properties._meta import BaseItem, Preview
+from PropertyEditor.properties.status import IS_SET
 
 if TYPE_CHECKING:
     from PropertyEditor.properties._meta import PropertyItem
@@ -20,27 +23,32 @@ class InstanceOfItem(BaseItem):
     Usable with a QAbstractItemModel.
     """
 
+    __slots__ = ("_value", "tooltip")
+
+    uses_parent_node = True
+
     def __init__(self, parent: PropertyItem = None):
         """Initialize."""
         super().__init__(parent)
 
         self.name = "InstanceOf"
-        self._lib_property = parent.lib_property
         self._value = self.lib_property.first_instance_of
         self.tooltip = f"Object is an instance of {self.value}"
 
         # Hack to always have to InstanceOf at the end of its hierarchy
         # As it's sorted alphabetically, using multiple "z" characters
         # will always put it at the end
-        self._sort_value = "z" * 12
+        self.sort_value = "z" * 12
 
-    @property
-    def is_set(self) -> bool:
-        """Get is_set."""
-        if self.value:
-            return True
-        else:
-            return False
+    def read_status(self) -> Tuple[bool, bool, bool, bool]:
+        """Read status, the InstanceOf is set when it has a value."""
+        _, is_default, has_prefab, is_local = super().read_status()
+        return bool(self.value), is_default, has_prefab, is_local
+
+    def read_status_flag(self, flag: int) -> bool:
+        if flag == IS_SET:
+            return bool(self.value)
+        return super().read_status_flag(flag)
 
     @property
     def is_path(self):
@@ -56,8 +64,10 @@ class InstanceOfItem(BaseItem):
         """Set value."""
         if self.lib_property.prefab and self.lib_property.prefab.value == value:
             self.unset()
-        elif Path(self.rawdata_path, value).is_file():
+        elif stat_cache.is_file(Path(self.rawdata_path, value)):
             self.lib_property.instance_of = value
+            self.structure_changed()
+            self.invalidate_prefab_histories()
 
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
@@ -78,15 +88,21 @@ class DeletedItem(BaseItem):
     Usable with a QAbstractItemModel.
     """
 
+    __slots__ = ("_value",)
+
+    uses_parent_node = True
+
     def __init__(self, name, parent: PropertyItem = None):
         """Initialize."""
         super().__init__(parent=parent)
 
         self.name = name
-        self.display_name = f"{name} (Deleted)"
-        self._lib_property = parent.lib_property
         self._value = None
 
+    @property
+    def display_name(self) -> str:
+        return f"{self.name} (Deleted)"
+
     def get_name(self) -> Optional[str]:
         return self.display_name
 
@@ -96,22 +112,30 @@ class DeletedItem(BaseItem):
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        return AddBackItem(
+        return editor_pool.acquire(
+            AddBackItem,
             self,
             source_index,
             parent=parent,
         )
 
+    def get_preview(self) -> Optional[Preview]:
+        return "button", "Revert to prefab"
+
 
 class EulerValueItem(BaseItem):
+    __slots__ = ("_value", "_base_value", "update_parent")
+
+    uses_parent_node = True
+
     def __init__(self, name, value, parent: EulerValueItem = None):
         """Initialize."""
         super().__init__(parent)
 
         self.name = name
-        self._lib_property = parent.lib_property
         self._value = value
         self._base_value = value
+        self.update_parent = True
 
     @property
     def value(self) -> float:
@@ -125,7 +149,8 @@ class EulerValueItem(BaseItem):
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        return EditorDoubleSpinboxContainer(
+        return editor_pool.acquire(
+            EditorDoubleSpinboxContainer,
             self,
             source_index,
             parent=parent,
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Type, TYPE_CHECKING
+
+from EntityLibPy import DataKind, Property, Schema
+
+if TYPE_CHECKING:
+    from PropertyEditor.properties._meta import PropertyItem
+
+
+class FieldPlan:
+    """Everything needed to create an object field's item, read from its schema."""
+
+    def __init__(self, name: str, schema: Schema):
+        """Initialize."""
+        user_meta = schema.user_meta or {}
+
+        self.name = name
+        self.data_kind = schema.data_kind
+
+        # None means the class depends on the field's value (see get_item_class())
+        self.item_class: Optional[Type[PropertyItem]] = get_item_class(schema, name)
+
+        self.minimum = get_schema_minimum(schema, user_meta)
+        self.maximum = get_schema_maximum(schema, user_meta)
+        self.enum_values = schema.enum_values
+
+
+class ChildPlan:
+    """Ordered fields of an object schema.
+
+    Computed once per schema and shared by every object using it.
+    """
+
+    def __init__(self, node: Property):
+        """Initialize."""
+        self.fields: List[FieldPlan] = [
+            FieldPlan(name, node.get_object_field(name).schema)
+            for name in node.schema.properties.keys()
+        ]
+        self.field_names: List[str] = [f.name for f in self.fields]
+        self._fields_by_name: Dict[str, FieldPlan] = {f.name: f for f in self.fields}
+
+    def get(self, field_name: str) -> Optional[FieldPlan]:
+        return self._fields_by_name.get(field_name)
+
+
+_child_plans: Dict[str, ChildPlan] = {}
+
+
+def get_child_plan(node: Property) -> Optional[ChildPlan]:
+    """Get the child plan of an object property, creating it if needed."""
+    schema = node.schema
+    if schema.data_kind != DataKind.object:
+        return None
+
+    # Inline schemas have no name, and so can't be shared
+    if not schema.name:
+        return ChildPlan(node)
+
+    plan = _child_plans.get(schema.name)
+    if not plan:
+        plan = _child_plans[schema.name] = ChildPlan(node)
+    return plan
+
+
+def clear_child_plans() -> None:
+    """Forget all plans, to use when schemas are loaded, see PropertyEditorApp."""
+    _child_plans.clear()
+
+
+def get_schema_maximum(schema: Schema, user_meta: dict) -> Optional[int, float]:
+    """Get maximum from schema or schema.user_meta."""
+    if hasattr(schema, "maximum"):
+        return schema.maximum
+    elif "max" in user_meta.get("range", {}):
+        return user_meta["range"]["max"]
+    return None
+
+
+def get_schema_minimum(schema: Schema, user_meta: dict) -> Optional[int, float]:
+    """Get minimum from schema or schema.user_meta."""
+    if hasattr(schema, "minimum"):
+        return schema.minimum
+    elif "min" in user_meta.get("range", {}):
+        return user_meta["range"]["min"]
+    return None
+
+
+def get_item_class(schema: Schema, field_name: str) -> Optional[Type[PropertyItem]]:
+    """Get the item class to use for a property.
+
+    Return None for strings that can only be identified as paths by their value.
+    """
+    data_kind = schema.data_kind
+    user_meta = schema.user_meta or {}
+
+    if data_kind == DataKind.array:
+        from .array import ColorItem, QuatItem, ArrayItem
+
+        if user_meta.get("widget", False) == "color":
+            return ColorItem
+        elif schema.name == "Quat":
+            return QuatItem
+        return ArrayItem
+
+    elif data_kind == DataKind.number:
+        from .number import NumberItem
+
+        return NumberItem
+
+    elif data_kind == DataKind.integer:
+        from .integer import IntegerItem
+
+        return IntegerItem
+
+    elif data_kind == DataKind.boolean:
+        from .boolean import BooleanItem
+
+        return BooleanItem
+
+    elif data_kind == DataKind.string:
+        from .string import PathItem
+
+        if user_meta.get("path", False) or "path" in str(field_name).lower():
+            return PathItem
+        return None
+
+    elif data_kind == DataKind.entityRef:
+        from .entity_ref import EntityRefItem
+
+        return EntityRefItem
+
+    elif data_kind == DataKind.objectSet:
+        from .object_set import ObjectSetItem
+
+        return ObjectSetItem
+
+    elif data_kind == DataKind.unionSet:
+        from .union_set import UnionSetItem
+
+        return UnionSetItem
+
+    elif data_kind == DataKind.map:
+        from .map import MapItem
+
+        return MapItem
+
+    elif data_kind == DataKind.primitiveSet:
+        from .primitive_set import PrimitiveSetItem
+
+        return PrimitiveSetItem
+
+    elif data_kind == DataKind.union:
+        from .union import UnionItem
+
+        return UnionItem
+
+    elif data_kind == DataKind.object:
+        from .object import ObjectItem
+
+        return ObjectItem
+
+    raise NotImplementedError(f"Can't created child with {data_kind}")
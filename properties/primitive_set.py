@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional, TYPE_CHECKING
+from typing import Any, List, Optional, Set, TYPE_CHECKING
 
 from EntityLibPy import DataKind
 
 from ._meta import ContainerPropertyItem, PropertyItem, BaseItem
 from .union_set import UnionSetItem
+from ..editors.pool import editor_pool
 from ..editors.primitive_set import EditorAddPrimitiveSetChild, EditorPrimitiveSetString
 
 if TYPE_CHECKING:
@@ -13,6 +14,10 @@ if TYPE_CHECKING:
 
 
 class PrimitiveSetContentItem(BaseItem):
+    __slots__ = ("_value", "tooltip", "primitive_type")
+
+    uses_parent_node = True
+
     def __init__(
         self,
         parent: PropertyItem,
@@ -24,7 +29,6 @@ class PrimitiveSetContentItem(BaseItem):
 
         self.name = property_name
         self.tooltip = property_name
-        self._lib_property = parent.lib_property
         self._value = value
 
         self.primitive_type = self.lib_property.primset_key_kind
@@ -37,6 +41,7 @@ class PrimitiveSetContentItem(BaseItem):
     def value(self, value):
         self._value = value
         self.lib_property.insert_primset_item(value)
+        self.structure_changed()
 
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
@@ -48,7 +53,8 @@ class PrimitiveSetContentItem(BaseItem):
                 parent=parent,
             )
 
-        return EditorAddPrimitiveSetChild(
+        return editor_pool.acquire(
+            EditorAddPrimitiveSetChild,
             self,
             source_index,
             parent=parent,
@@ -56,6 +62,8 @@ class PrimitiveSetContentItem(BaseItem):
 
 
 class PrimitiveSetItem(ContainerPropertyItem):
+    __slots__ = ()
+
     @property
     def value(self) -> Any:
         """Get value."""
@@ -68,6 +76,9 @@ class PrimitiveSetItem(ContainerPropertyItem):
     def contains(self, value: str):
         return self.lib_property.primset_contains(value)
 
+    def get_child_keys(self) -> Set[str]:
+        return set(self.lib_property.primset_keys)
+
     def _get_possible_child_items(self) -> List[str]:
         return UnionSetItem._get_possible_child_items(self)
 
@@ -83,6 +94,7 @@ class PrimitiveSetItem(ContainerPropertyItem):
     def _add_child(self, property_name: str, extra: Any = None):
         field_name = str(len(self.child_items))
         self.lib_property.insert_primset_item(property_name)
+        self.structure_changed()
         return None, field_name, property_name
 
     def can_remove_item(self, value):
@@ -95,6 +107,7 @@ class PrimitiveSetItem(ContainerPropertyItem):
             return False
 
         self.lib_property.erase_primset_key(child.value)
+        self.structure_changed()
         return True
 
     def _create_child(self, index, root, lib_property, field_name, value, parent=None):
@@ -107,7 +120,8 @@ class PrimitiveSetItem(ContainerPropertyItem):
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        return EditorAddPrimitiveSetChild(
+        return editor_pool.acquire(
+            EditorAddPrimitiveSetChild,
             self,
             source_index,
             parent=parent,
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from PropertyEditor.utils import CacheCounter
+
+if TYPE_CHECKING:
+    from PropertyEditor.properties._meta import BaseItem
+
+
+# Flags indexes, in the order returned by BaseItem.read_status()
+IS_SET = 0
+IS_DEFAULT = 1
+HAS_PREFAB = 2
+IS_LOCAL = 3
+
+# Hits are flags read from a snapshot, misses are rows read from EntityLib,
+# or single flags while snapshots are disabled
+status_cache = CacheCounter("Status snapshot")
+
+
+class StatusSnapshot:
+    """Status flags of a container's child items.
+
+    One byte array per flag, indexed by child row.
+    Rows are read from EntityLib all at once when children are built,
+    then only when an edit, a revert or a paste touches them.
+    """
+
+    # When disabled, items read each flag from EntityLib as they did before
+    # the snapshots, only used to benchmark them
+    enabled = True
+
+    def __init__(self):
+        """Initialize."""
+        self.fresh = bytearray()
+        self.flags: List[bytearray] = [bytearray() for _ in range(4)]
+
+    def __len__(self) -> int:
+        return len(self.fresh)
+
+    def append(self) -> None:
+        """Add a stale row."""
+        self.fresh.append(0)
+        for flags in self.flags:
+            flags.append(0)
+
+    def insert(self, row: int, count: int) -> None:
+        """Insert stale rows."""
+        self.fresh[row:row] = bytearray(count)
+        for flags in self.flags:
+            flags[row:row] = bytearray(count)
+
+    def pop(self, row: int, count: int = 1) -> None:
+        del self.fresh[row : row + count]
+        for flags in self.flags:
+            del flags[row : row + count]
+
+    def invalidate(self, row: Optional[int] = None) -> None:
+        """Mark a row, or all rows, as stale."""
+        if row is None:
+            self.fresh = bytearray(len(self.fresh))
+        else:
+            self.fresh[row] = 0
+
+    def refresh(
+        self, items: Sequence[BaseItem], rows: Optional[Iterable[int]] = None
+    ) -> None:
+        """Read status of some rows, or of all rows, from EntityLib."""
+        if rows is None:
+            rows = range(len(self.fresh))
+
+        for row in rows:
+            status_cache.miss()
+            self._set_row(row, items[row].read_status())
+
+    def _set_row(self, row: int, status: Tuple[bool, bool, bool, bool]) -> None:
+        for flags, value in zip(self.flags, status):
+            flags[row] = value
+        self.fresh[row] = 1
+
+    def get(self, items: Sequence[BaseItem], row: int, flag: int) -> bool:
+        if not self.fresh[row]:
+            self.refresh(items, [row])
+        else:
+            status_cache.hit()
+        return bool(self.flags[flag][row])
@@ -1,43 +1,52 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
-from ._meta import PropertyItem
+from ._meta import PropertyItem, Preview
 from ..editors.path import EditorPath
 from ..editors.line_edit import EditorLineEdit
 from ..editors.list import EditorList
+from ..editors.pool import editor_pool
 
 if TYPE_CHECKING:
     from PySide2 import QtCore, QtWidgets
 
 
 class StringItem(PropertyItem):
+    __slots__ = ()
+
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        if self.schema.enum_values:
-            return EditorList(
+        if self.enum_values:
+            return editor_pool.acquire(
+                EditorList,
                 self,
                 source_index,
-                self.schema.enum_values,
+                self.enum_values,
                 parent=parent,
             )
         elif self.name != "Name" or self.parent.name != self.value:
-            return EditorLineEdit(
+            return editor_pool.acquire(
+                EditorLineEdit,
                 self,
                 source_index,
                 parent=parent,
             )
 
+    def get_preview(self) -> Optional[Preview]:
+        if self.enum_values:
+            return "combo", self.value
+        elif self.name != "Name" or self.parent.name != self.value:
+            return super().get_preview()
+        return None
+
     def allow_paste(self, copy_data) -> bool:
         if super().allow_paste(copy_data):
-            if bool(self.schema.enum_values) != bool(copy_data.enum_values):
+            if bool(self.enum_values) != bool(copy_data.enum_values):
                 return False
 
-            elif (
-                self.schema.enum_values
-                and copy_data.value not in self.schema.enum_values
-            ):
+            elif self.enum_values and copy_data.value not in self.enum_values:
                 return False
             return True
         return False
@@ -45,12 +54,15 @@ class StringItem(PropertyItem):
 
 class PathItem(PropertyItem):
 
+    __slots__ = ()
+
     path = True
 
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        return EditorPath(
+        return editor_pool.acquire(
+            EditorPath,
             self,
             source_index,
             parent=parent,
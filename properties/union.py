@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-from ._meta import ContainerPropertyItem, PropertyItem
+from ._meta import ContainerPropertyItem, PropertyItem, Preview
+from ..editors.pool import editor_pool
 from ..editors.union_type import EditorUnionType
 
 if TYPE_CHECKING:
@@ -10,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class UnionItem(ContainerPropertyItem):
+    __slots__ = ()
+
     def _remove_child_item(self, child: Optional[PropertyItem] = None) -> bool:
         # Union items child removal is managed by its parent editor and the EntityLib
         # Just return True to allow the process to work smoothly
@@ -28,9 +31,13 @@ class UnionItem(ContainerPropertyItem):
     def _get_editor(
         self, source_index: QtCore.QModelIndex, parent: QtWidgets.QWidget = None
     ):
-        return EditorUnionType(
+        return editor_pool.acquire(
+            EditorUnionType,
             self,
             source_index,
             self.lib_property.schema.get_union_types_dict(),
             parent=parent,
         )
+
+    def get_preview(self) -> Optional[Preview]:
+        return "combo", self.lib_property.union_type
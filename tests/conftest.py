@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Tests only use in-memory nodes, see entity_lib, so they run without EntityLib
+try:
+    import EntityLibPy  # noqa: F401
+except ImportError:
+    from . import entity_lib_py
+
+    sys.modules["EntityLibPy"] = entity_lib_py
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    QtWidgets = pytest.importorskip("PySide2.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,174 @@
+"""Small in-memory stand-ins of EntityLib nodes, to test items without data files."""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from EntityLibPy import DataKind
+
+CONTAINER_KINDS = (DataKind.object, DataKind.array, DataKind.map)
+
+
+class Schema:
+    def __init__(
+        self,
+        data_kind: DataKind,
+        name: str = "",
+        fields: Dict[str, Schema] = None,
+        user_meta: dict = None,
+        max_items: int = 0,
+    ):
+        self.data_kind = data_kind
+        self.name = name
+        self.properties = fields or {}
+        self.user_meta = user_meta or {}
+        self.max_items = max_items
+        self.enum_values = None
+        self.description = ""
+
+    @staticmethod
+    def get_default_value() -> Any:
+        return None
+
+
+class EntityLib:
+    rawdata_path = ""
+
+
+class Node:
+    """Node of a property, its prefab is the node it is an instance of."""
+
+    entitylib = EntityLib()
+
+    def __init__(
+        self,
+        schema: Schema,
+        value: Any = None,
+        children: Dict[str, Node] = None,
+        prefab: Optional[Node] = None,
+    ):
+        self.schema = schema
+        self.parent: Optional[Node] = None
+        self.prefab = prefab
+        self.is_set = False
+        self.instance_of = None
+        self.first_instance_of = None
+        self._value = value
+        self._children: Dict[str, Node] = {}
+        for name, child in (children or {}).items():
+            self._add(name, child)
+
+    def _add(self, name: str, child: Node) -> Node:
+        child.parent = self
+        child._name = name
+        self._children[name] = child
+        return child
+
+    def instance(self) -> Node:
+        """Get a copy of the node using it as prefab, as a new instance would."""
+        return Node(
+            self.schema,
+            self._value,
+            {name: child.instance() for name, child in self._children.items()},
+            prefab=self,
+        )
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+        self.is_set = True
+
+    @property
+    def size(self) -> int:
+        return len(self._children)
+
+    @property
+    def has_prefab(self) -> bool:
+        return self.prefab is not None
+
+    @property
+    def get_prefab_history(self) -> list:
+        return []
+
+    @property
+    def is_default(self) -> bool:
+        return not self.is_set and (self.prefab is None or self.prefab.is_default)
+
+    @property
+    def absolute_noderef(self) -> str:
+        names = []
+        node = self
+        while node.parent is not None:
+            names.append(node._name)
+            node = node.parent
+        return "/".join(reversed(names))
+
+    def resolve_noderef(self, node_ref: str) -> Optional[Node]:
+        node = self
+        for name in node_ref.split("/"):
+            node = node._children.get(name)
+            if node is None:
+                return None
+        return node
+
+    def get_object_field(self, name: str) -> Node:
+        return self._children[name]
+
+    def get_array_item(self, index: int) -> Node:
+        return self._children[str(index)]
+
+    @property
+    def map_keys(self) -> List[str]:
+        return list(self._children)
+
+    @property
+    def map_items(self) -> List[tuple]:
+        return list(self._children.items())
+
+    def get_map_item(self, key: str) -> Optional[Node]:
+        return self._children.get(key)
+
+    def erase_map_item(self, key: str) -> bool:
+        self.is_set = True
+        return self._children.pop(key, None) is not None
+
+    def unset(self) -> None:
+        """Get back the prefab's value and children."""
+        if self.prefab is not None:
+            self._value = self.prefab.value
+            self._children = {}
+            for name, child in self.prefab._children.items():
+                self._add(name, child.instance())
+        else:
+            for child in self._children.values():
+                child.unset()
+        self.is_set = False
+
+
+def number(value: float = 0.0) -> Node:
+    return Node(Schema(DataKind.number), value)
+
+
+def integer(value: int = 0) -> Node:
+    return Node(Schema(DataKind.integer), value)
+
+
+def string(value: str = "") -> Node:
+    return Node(Schema(DataKind.string), value)
+
+
+def array(values: List[float], name: str = "", user_meta: dict = None) -> Node:
+    schema = Schema(DataKind.array, name, user_meta=user_meta, max_items=len(values))
+    return Node(schema, children={str(i): number(v) for i, v in enumerate(values)})
+
+
+def map_(children: Dict[str, Node]) -> Node:
+    return Node(Schema(DataKind.map), children=children)
+
+
+def object_(name: str, children: Dict[str, Node]) -> Node:
+    fields = {field: child.schema for field, child in children.items()}
+    return Node(Schema(DataKind.object, name, fields), children=children)
@@ -0,0 +1,52 @@
+"""Stand-in of the EntityLibPy module, used by conftest when it isn't installed.
+
+Only holds the names imported by the package, nodes are built with entity_lib.
+"""
+import enum
+
+
+class DataKind(enum.Enum):
+    null = 0
+    string = 1
+    boolean = 2
+    integer = 3
+    number = 4
+    object = 5
+    array = 6
+    map = 7
+    union = 8
+    objectSet = 9
+    unionSet = 10
+    primitiveSet = 11
+    entityRef = 12
+
+
+class CopyMode(enum.Enum):
+    CopyOverride = 0
+    SinglePrefab = 1
+
+
+class OverrideValueSource(enum.Enum):
+    Override = 0
+    OverrideOrPrefab = 1
+    Any = 2
+
+
+class Property:
+    pass
+
+
+class Schema:
+    pass
+
+
+class EntityLib:
+    pass
+
+
+class EntityRef:
+    pass
+
+
+class Prop_PrefabInfo:
+    pass
@@ -0,0 +1,83 @@
+import pytest
+
+pytest.importorskip("PySide2")
+
+from EntityLibPy import DataKind  # noqa: E402
+from PySide2 import QtCore  # noqa: E402
+
+from PropertyEditor.config import Config  # noqa: E402
+from PropertyEditor.editors.multi_child import EditorMultiChild  # noqa: E402
+from PropertyEditor.model.delegate import Delegate  # noqa: E402
+from PropertyEditor.model.model import Model  # noqa: E402
+from PropertyEditor.properties._meta import ContainerPropertyItem  # noqa: E402
+
+from .entity_lib import Node, Schema, object_, string  # noqa: E402
+
+
+class App:
+    config = Config()
+
+    def set_current_tab_edited(self) -> None:
+        return
+
+
+def make_model():
+    tags = Node(
+        Schema(DataKind.array, "Tags", max_items=3),
+        children={str(i): string(value) for i, value in enumerate("abc")},
+    )
+    node = object_("EditorsRoot", {"Tags": tags}).instance()
+    root = ContainerPropertyItem(None, node, "Property", "Value")
+    root.get_child_items()
+    return Model(App(), root)
+
+
+def editor_index(model, index):
+    return model.index(index.row(), 1, index.parent())
+
+
+def delete_later_now():
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+
+@pytest.fixture
+def editors(qapp):
+    model = make_model()
+    tags_index = editor_index(model, model.fetch_path("Tags"))
+    tags = model.get_item(tags_index)
+    multi = tags.create_editor(tags_index)
+    child = tags.child_items[0]
+    child_editor = child.create_editor(model.index(0, 1, tags_index))
+    return model, tags_index, multi, child, child_editor
+
+
+def test_child_row_editor_linked_with_parent_editor(editors):
+    _, _, multi, _, child_editor = editors
+
+    assert isinstance(multi, EditorMultiChild)
+    assert multi.child_editors[0] in child_editor.related
+    assert child_editor in multi.child_editors[0].related
+
+
+def test_edit_child_after_parent_editor_evicted(editors):
+    _, tags_index, multi, child, child_editor = editors
+
+    Delegate().destroyEditor(multi, tags_index)
+    delete_later_now()
+
+    assert child_editor.related == []
+    child_editor.set_editor_value("z")
+    child_editor.set_model_value()
+    assert child.value == "z"
+
+
+def test_child_editor_linked_again_from_pool(editors):
+    model, tags_index, multi, child, child_editor = editors
+    child_index = model.index(0, 1, tags_index)
+
+    Delegate().destroyEditor(child_editor, child_index)
+    assert multi.child_editors[0].related == []
+
+    new_editor = child.create_editor(child_index)
+    assert new_editor is child_editor
+    assert new_editor.related == [multi.child_editors[0]]
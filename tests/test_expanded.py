@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PySide2 import QtCore  # noqa: E402
+
+from PropertyEditor.config import Config  # noqa: E402
+from PropertyEditor.utils import PathTrie  # noqa: E402
+from PropertyEditor.widgets.treeview import TreeView  # noqa: E402
+
+
+class App:
+    def __init__(self, max_files):
+        self.config = Config()
+        self.config.expanded_max_files = max_files
+
+
+class View:
+    """Stand-in of a TreeView, only holding the expanded rows of a file."""
+
+    _prune_expanded_states = TreeView._prune_expanded_states
+    save_expanded_state = TreeView.save_expanded_state
+    restore_expanded_state = TreeView.restore_expanded_state
+
+    def __init__(self, file, expanded=(), max_files=100):
+        self.app = App(max_files)
+        self.file = file
+        self.expanded = PathTrie(expanded)
+        self.restored = None
+        self.expanded_restored = False
+
+    def _get_expanded_key(self):
+        return f"{self.app.config.expanded_key}/{self.file}"
+
+    def get_expanded(self):
+        return self.expanded
+
+    def set_expanded(self, expanded):
+        self.restored = expanded
+
+
+@pytest.fixture
+def settings(qapp, tmp_path, monkeypatch):
+    QtCore.QSettings.setPath(
+        QtCore.QSettings.IniFormat, QtCore.QSettings.UserScope, str(tmp_path)
+    )
+    QtCore.QSettings.setDefaultFormat(QtCore.QSettings.IniFormat)
+    QtCore.QCoreApplication.setOrganizationName("PropertyEditorTests")
+    QtCore.QCoreApplication.setApplicationName("PropertyEditorTests")
+    QtCore.QSettings().clear()
+    return QtCore.QSettings()
+
+
+def test_restores_names_holding_slashes(settings):
+    expanded = [("Values",), ("Values", "a/b"), ("Values", "a/b", "c")]
+    View("d/first.entity", expanded).save_expanded_state()
+
+    view = View("d/first.entity")
+    assert view.restore_expanded_state()
+    assert sorted(view.restored) == sorted(expanded)
+    assert view.restored.contains_ancestor(["Values", "a/b", "c", "d"])
+    assert not view.restored.contains_descendant(["Values", "a"])
+
+
+def test_ignores_missing_and_old_states(settings):
+    settings.setValue("expanded/d/old.entity", ["Values", "Values/a"])
+    settings.sync()
+
+    assert not View("d/old.entity").restore_expanded_state()
+    assert not View("d/missing.entity").restore_expanded_state()
+
+
+def test_removes_oldest_files(settings):
+    settings.setValue("expanded/d/old.entity", ["Values"])
+    for i, saved in enumerate([30.0, 10.0, 20.0]):
+        state = {"saved": saved, "paths": [["Values"]]}
+        settings.setValue(f"expanded/d/{i}.entity", json.dumps(state))
+    settings.sync()
+
+    View("d/new.entity", ["Values"], max_files=3).save_expanded_state()
+
+    settings.beginGroup("expanded")
+    assert sorted(settings.allKeys()) == ["d/0.entity", "d/2.entity", "d/new.entity"]
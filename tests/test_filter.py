@@ -0,0 +1,148 @@
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PropertyEditor.config import Config  # noqa: E402
+from PropertyEditor.model.filter import FilterEngine  # noqa: E402
+from PropertyEditor.model.model import Model  # noqa: E402
+from PropertyEditor.model.proxy import Proxy  # noqa: E402
+from PropertyEditor.properties._meta import ContainerPropertyItem  # noqa: E402
+from PropertyEditor.utils import PathTrie  # noqa: E402
+
+from .entity_lib import integer, map_, object_  # noqa: E402
+
+KEYS = "abcdef"
+
+
+class App:
+    def __init__(self):
+        self.config = Config()
+        self.config.fetch_page_size = 2
+
+
+def make_model():
+    prefab = object_(
+        "FilterRoot",
+        {
+            "Values": map_({key: integer(i) for i, key in enumerate(KEYS)}),
+            "Other": integer(0),
+        },
+    )
+    node = prefab.instance()
+    node.get_object_field("Values").get_map_item("b").value = 10
+    root = ContainerPropertyItem(None, node, "Property", "Value")
+    root.get_child_items()
+    return Model(App(), root)
+
+
+def hidden_names(changes):
+    return {
+        parent.child_items[row].name: hidden for parent, row, hidden in changes
+    }
+
+
+@pytest.fixture
+def model(qapp):
+    return make_model()
+
+
+@pytest.fixture
+def engine(model):
+    """FilterEngine fed by the model's row signals, as TreeView does."""
+    engine = FilterEngine()
+    engine.changes = []
+
+    def rows_inserted(parent, first, last):
+        item = model.get_item(parent) or model.loaded_item
+        engine.changes.extend(engine.rows_inserted(item, first, last))
+
+    model.rowsInserted.connect(rows_inserted)
+    return engine
+
+
+def test_override_filter_hides_then_shows_rows(model, engine):
+    model.fetch_all(model.fetch_path("Values"))
+    root = model.loaded_item
+
+    changes = engine.set_override_filter(root, "LocalOverrides")
+    assert hidden_names(changes) == {
+        "Other": True,
+        **{key: True for key in KEYS if key != "b"},
+    }
+
+    changes = engine.set_override_filter(root, "All")
+    assert hidden_names(changes) == {
+        "Other": False,
+        **{key: False for key in KEYS if key != "b"},
+    }
+    assert not engine.active
+
+
+def test_search_change_only_reports_changed_rows(model, engine):
+    model.fetch_all(model.fetch_path("Values"))
+    root = model.loaded_item
+    engine.set_search(root, "c", PathTrie(["Values/c"]))
+
+    changes = engine.set_search(root, "d", PathTrie(["Values/d"]))
+
+    assert hidden_names(changes) == {"c": True, "d": False}
+
+
+def test_rows_fetched_later_are_filtered(model, engine):
+    values_index = model.fetch_path("Values/a").parent()
+    values = model.get_item(values_index)
+    assert values.child_count() == 2
+
+    engine.set_search(model.loaded_item, "e", PathTrie(["Values/e"]))
+    model.fetch_all(values_index)
+
+    assert hidden_names(engine.changes) == {"c": True, "d": True, "f": True}
+    assert bytes(engine._visible[values]) == b"\x00\x00\x00\x00\x01\x00"
+
+
+def test_rows_fetched_without_filter_are_not_tracked(model, engine):
+    values_index = model.fetch_path("Values/a").parent()
+    model.fetch_all(values_index)
+
+    assert engine.changes == []
+    assert not engine._visible
+
+
+def make_proxy(model):
+    proxy = Proxy(None)
+    proxy.setSourceModel(model)
+    return proxy
+
+
+def proxy_names(proxy, source_index):
+    index = proxy.mapFromSource(source_index)
+    return {
+        proxy.sourceModel().get_item(proxy.mapToSource(proxy.index(row, 0, index))).name
+        for row in range(proxy.rowCount(index))
+    }
+
+
+def test_proxy_search(model):
+    values_index = model.fetch_path("Values")
+    model.fetch_all(values_index)
+    proxy = make_proxy(model)
+
+    proxy.set_search_results("e", ["Values/e"], PathTrie(["Values/e"]))
+    assert proxy_names(proxy, values_index) == {"e"}
+    assert model.get_item(values_index) in proxy.filtered
+
+    proxy.set_search_results("", [], PathTrie())
+    assert proxy_names(proxy, values_index) == set(KEYS)
+
+
+def test_proxy_override_filter(model):
+    values_index = model.fetch_path("Values")
+    model.fetch_all(values_index)
+    proxy = make_proxy(model)
+
+    proxy.select_overrides_updated("LocalOverrides")
+    assert proxy_names(proxy, model.root_index()) == {"Values"}
+    assert proxy_names(proxy, values_index) == {"b"}
+
+    proxy.select_overrides_updated("All")
+    assert proxy_names(proxy, values_index) == set(KEYS)
@@ -0,0 +1,137 @@
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PropertyEditor.properties._meta import (  # noqa: E402
+    ContainerPropertyItem,
+    PropertyItem,
+)
+
+from .entity_lib import Node, array, integer, map_, object_  # noqa: E402
+
+KEYS = [f"key{i}" for i in range(20)]
+
+
+def make_root(**children):
+    node = object_("ItemsRoot", children).instance()
+    root = ContainerPropertyItem(None, node, "Property", "Value")
+    root.get_child_items()
+    return root
+
+
+def test_children_match_indexed_lookups():
+    node = map_({key: integer(i) for i, key in enumerate(KEYS)})
+    children = list(PropertyItem.iter_property_children(node))
+
+    assert children == [
+        PropertyItem.get_property_child_by_index(node, index, False)
+        for index in range(node.size)
+    ]
+
+    node = array([1.0, 2.0, 3.0])
+    children = list(PropertyItem.iter_property_children(node))
+    assert [(name, child) for name, child, _, _ in children] == [
+        ("0", node.get_array_item(0)),
+        ("1", node.get_array_item(1)),
+        ("2", node.get_array_item(2)),
+    ]
+
+
+def test_keyed_children_read_keys_once(monkeypatch):
+    root = make_root(Values=map_({key: integer(i) for i, key in enumerate(KEYS)}))
+    values = root.get_child_by_name("Values")
+
+    reads = []
+    map_keys = Node.map_keys
+
+    def count_reads(node):
+        reads.append(node)
+        return map_keys.fget(node)
+
+    monkeypatch.setattr(Node, "map_keys", property(count_reads))
+    values.get_child_items()
+
+    assert [child.name for child in values.child_items] == KEYS
+    assert len(reads) == 1
+
+
+def test_nodes_resolved_again_after_structure_changes(monkeypatch):
+    root = make_root(Values=map_({key: integer(i) for i, key in enumerate(KEYS)}))
+    values = root.get_child_by_name("Values")
+    values.get_child_items()
+    child = values.get_child_by_name("key3")
+
+    resolved = []
+    resolve_noderef = Node.resolve_noderef
+
+    def count_resolves(node, node_ref):
+        resolved.append(node_ref)
+        return resolve_noderef(node, node_ref)
+
+    monkeypatch.setattr(Node, "resolve_noderef", count_resolves)
+    node = child.lib_property
+    assert child.lib_property is node
+    assert resolved == []
+
+    values.lib_property.erase_map_item("key3")
+    child.structure_changed()
+    assert child.lib_property is None
+    assert child.lib_property is None
+    assert resolved == ["Values/key3"]
+
+
+def assert_indexes(container):
+    for row, child in enumerate(container.child_items):
+        assert container.get_child_index(child) == row
+        assert container.get_child_row(child.name) == row
+        assert container.get_child_by_name(child.name) is child
+
+
+def test_child_indexes_follow_inserts_removals_and_renames():
+    root = make_root(Values=map_({key: integer(i) for i, key in enumerate(KEYS)}))
+    values = root.get_child_by_name("Values")
+    values.get_child_items()
+    assert_indexes(values)
+
+    removed = values.pop_child_items(2, 4)
+    assert [child.name for child in removed] == ["key2", "key3", "key4"]
+    assert not values.has_child("key3")
+    assert_indexes(values)
+
+    values.insert_child_items(0, removed)
+    assert_indexes(values)
+
+    first, second = values.child_items[:2]
+    second.name = first.name
+    assert values.get_child_by_name(first.name) is first
+    first.name = "renamed"
+    assert values.get_child_by_name(second.name) is second
+    assert values.get_child_row("renamed") == 0
+
+
+def test_deleted_keys_kept_up_to_date(monkeypatch):
+    root = make_root(Values=map_({key: integer(i) for i, key in enumerate(KEYS)}))
+    values = root.get_child_by_name("Values")
+    values.lib_property.erase_map_item("key3")
+    values.get_child_items()
+
+    assert [child.name for child in values.child_items[-1:]] == ["key3"]
+    assert not values.missing_deleted_items()
+
+    reads = []
+    map_items = Node.map_items
+
+    def count_reads(node):
+        reads.append(node)
+        return map_items.fget(node)
+
+    monkeypatch.setattr(Node, "map_items", property(count_reads))
+    assert values.remove_child_item(values.get_child_by_name("key5"))
+
+    assert values.get_deleted_items() == ["key5"]
+    assert values.missing_deleted_items()
+    assert not reads
+
+    values.invalidate_deleted_items()
+    assert values.get_deleted_items() == ["key5"]
+    assert len(reads) == 2
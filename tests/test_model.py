@@ -0,0 +1,51 @@
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PropertyEditor.config import Config  # noqa: E402
+from PropertyEditor.model.filter import FilterEngine  # noqa: E402
+from PropertyEditor.model.model import Model  # noqa: E402
+from PropertyEditor.properties._meta import ContainerPropertyItem  # noqa: E402
+from PropertyEditor.utils import PathTrie  # noqa: E402
+
+from .entity_lib import array, object_  # noqa: E402
+
+
+class App:
+    config = Config()
+
+
+@pytest.fixture
+def model(qapp):
+    node = object_(
+        "ModelRoot",
+        {
+            "Position": array([1.0, 2.0, 3.0], "Position"),
+            "Color": array([1.0, 0.5, 0.0], user_meta={"widget": "color"}),
+        },
+    ).instance()
+    root = ContainerPropertyItem(None, node, "Property", "Value")
+    root.get_child_items()
+    return Model(App(), root)
+
+
+def test_fetch_path_of_renamed_children(model):
+    assert model.get_item(model.fetch_path("Position/1")).name == "Y"
+    assert model.get_item(model.fetch_path("Color/2")).name == "B"
+
+
+def test_fetch_path_stops_at_deepest_found(model):
+    assert model.get_item(model.fetch_path("Position/7")).name == "Position"
+
+
+def test_filter_matches_renamed_children(model):
+    position = model.get_item(model.fetch_path("Position/1")).parent
+    engine = FilterEngine()
+
+    changes = engine.set_search(model.loaded_item, "2", PathTrie(["Position/1"]))
+
+    hidden = {(parent.name, parent.child_items[row].name) for parent, row, _ in changes}
+    assert ("Property", "Color") in hidden
+    assert {("Position", "X"), ("Position", "Z")} <= hidden
+    assert position in engine.filtered
+    assert position.get_child_by_name("Y") in engine.filtered
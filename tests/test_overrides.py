@@ -0,0 +1,77 @@
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PropertyEditor.properties import _meta  # noqa: E402
+from PropertyEditor.properties._meta import ContainerPropertyItem  # noqa: E402
+
+from .entity_lib import integer, map_, object_  # noqa: E402
+
+
+def make_root():
+    prefab = object_(
+        "OverridesRoot",
+        {
+            "Sub": object_(
+                "OverridesSub", {"Inner": map_({"foo": integer(1), "bar": integer(2)})}
+            )
+        },
+    )
+    node = prefab.instance()
+    inner = node.get_object_field("Sub").get_object_field("Inner")
+    inner.get_map_item("foo").value = 3
+    root = ContainerPropertyItem(None, node, "Property", "Value")
+    root.get_child_items()
+    return root, inner
+
+
+def test_counts_of_unfetched_container():
+    root, _ = make_root()
+
+    assert not root.get_child_by_name("Sub").child_items
+    assert root.get_override_counts() == (1, 1)
+
+
+def test_counts_refreshed_up_to_root():
+    root, inner = make_root()
+    assert root.get_override_counts() == (1, 1)
+
+    sub = root.get_child_by_name("Sub")
+    sub.get_child_items(child_level=1)
+    bar = sub.get_child_by_name("Inner").get_child_by_name("bar")
+    inner.get_map_item("bar").value = 4
+    bar.refresh_status()
+
+    assert root.get_override_counts() == (2, 2)
+
+
+def test_walk_counts_up_to_one():
+    node = map_({str(i): integer(i) for i in range(20)}).instance()
+    assert _meta.count_node_overrides(node) == (0, 0)
+
+    node.get_map_item("3").value = 1
+    node.get_map_item("7").value = 1
+    assert _meta.count_node_overrides(node) == (1, 1)
+
+
+def test_walk_past_limit_keeps_row(monkeypatch):
+    monkeypatch.setattr(_meta, "MAX_WALKED_NODES", 5)
+    node = map_({str(i): map_({"a": integer(i)}) for i in range(20)}).instance()
+
+    assert _meta.count_node_overrides(node) == (1, 1)
+
+
+def test_fetched_batch_marks_parents_once(monkeypatch):
+    root, _ = make_root()
+    inner = root.get_child_by_name("Sub")
+    calls = []
+    overrides_changed = ContainerPropertyItem.overrides_changed
+
+    def count_calls(item):
+        calls.append(item)
+        overrides_changed(item)
+
+    monkeypatch.setattr(ContainerPropertyItem, "overrides_changed", count_calls)
+    inner.add_fetched_child_items(inner.create_child_items())
+
+    assert calls == [inner]
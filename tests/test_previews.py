@@ -0,0 +1,73 @@
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PropertyEditor.properties._meta import ContainerPropertyItem  # noqa: E402
+from PropertyEditor.properties.array import (  # noqa: E402
+    ArrayItem,
+    ColorItem,
+    QuatItem,
+)
+
+from .entity_lib import array, object_  # noqa: E402
+
+
+@pytest.fixture
+def root():
+    node = object_(
+        "PreviewsRoot",
+        {
+            "Position": array([1.0, 2.0, 3.0], "Position"),
+            "Rotation": array([0.0, 0.0, 0.7071068, 0.7071068], "Quat"),
+            "Color": array([1.0, 0.5, 0.0], user_meta={"widget": "color"}),
+        },
+    ).instance()
+    item = ContainerPropertyItem(None, node, "Property", "Value")
+    item.get_child_items()
+    return item
+
+
+def test_array_preview_of_unfetched_row(root):
+    position = root.get_child_by_name("Position")
+
+    assert isinstance(position, ArrayItem)
+    assert position.get_preview() == ("text", "1.0, 2.0, 3.0")
+    assert not position.child_items
+
+
+def test_quat_preview_of_unfetched_row(root):
+    rotation = root.get_child_by_name("Rotation")
+
+    assert isinstance(rotation, QuatItem)
+    assert rotation.get_preview() == ("text", "0.0, 0.0, 90.0")
+    assert not rotation.child_items
+
+
+def test_color_preview_of_unfetched_row(root):
+    color = root.get_child_by_name("Color")
+
+    assert isinstance(color, ColorItem)
+    assert color.get_preview() == ("color", (1.0, 0.5, 0.0))
+    assert not color.child_items
+
+
+class SetItem(ContainerPropertyItem):
+    __slots__ = ("calls",)
+
+    def _get_possible_child_items(self):
+        self.calls += 1
+        return ["Missing"]
+
+
+def test_container_preview_computed_once_per_structure():
+    node = object_("PreviewsSet", {"Values": array([1.0])}).instance()
+    item = SetItem(None, node, "Property", "Value")
+    item.calls = 0
+
+    assert item.get_preview() == ("size", 1)
+    assert item.get_preview() == ("size", 1)
+    assert item.calls == 1
+
+    item.structure_changed()
+    item.get_preview()
+    assert item.calls == 2
@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PropertyEditor.config import Config  # noqa: E402
+from PropertyEditor.model.model import Model  # noqa: E402
+from PropertyEditor.properties._meta import ContainerPropertyItem  # noqa: E402
+from PropertyEditor.properties.other import DeletedItem  # noqa: E402
+
+from .entity_lib import integer, map_, object_  # noqa: E402
+
+
+class App:
+    config = Config()
+
+
+def make_model():
+    prefab = object_(
+        "RevertRoot",
+        {"A": object_("RevertA", {"C": map_({"foo": integer(1), "bar": integer(2)})})},
+    )
+    node = prefab.instance()
+    node.get_object_field("A").get_object_field("C").erase_map_item("foo")
+    root = ContainerPropertyItem(None, node, "Property", "Value")
+    root.get_child_items(child_level=2)
+    return Model(App(), root)
+
+
+def test_revert_restores_nested_erased_key(qapp):
+    model = make_model()
+    a_index = model.fetch_path("A")
+    a_item = model.get_item(a_index)
+    c_item = a_item.get_child_by_name("C")
+    assert any(isinstance(child, DeletedItem) for child in c_item.child_items)
+
+    a_item.revert_to_prefab()
+    model.sync_child_rows(a_index)
+
+    assert a_item.get_child_by_name("C") is c_item
+    assert sorted(child.name for child in c_item.child_items) == ["bar", "foo"]
+    assert not any(isinstance(child, DeletedItem) for child in c_item.child_items)
+
+
+def test_sync_only_creates_inserted_items(qapp):
+    model = make_model()
+    c_index = model.fetch_path("A/C")
+    c_item = model.get_item(c_index)
+    bar = c_item.get_child_by_name("bar")
+
+    c_item.lib_property.unset()
+    c_item.structure_changed()
+    c_item.invalidate_deleted_items()
+    model.sync_child_rows(c_index)
+
+    assert c_item.get_child_by_name("bar") is bar
+    assert c_item.get_child_by_name("foo") is not None
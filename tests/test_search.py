@@ -0,0 +1,76 @@
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PySide2 import QtCore  # noqa: E402
+
+from PropertyEditor.model.search import Search  # noqa: E402
+
+
+class Node:
+    def __init__(self, node_ref):
+        self.absolute_noderef = node_ref
+
+
+class LibProperty:
+    def search_child(self, pattern):
+        return [Node(f"Values/{pattern}{i}") for i in range(25)]
+
+
+class Model:
+    def __init__(self):
+        self.loaded_item = type("Item", (), {"lib_property": LibProperty()})()
+        self.fetched = []
+
+    def fetch_path(self, path):
+        self.fetched.append(path)
+
+
+class TreeView(QtCore.QObject):
+    def __init__(self):
+        super().__init__()
+        self.source_model = Model()
+        self.results = []
+
+    def set_search_results(self, pattern, node_refs, matches):
+        self.results.append((pattern, node_refs))
+
+
+def run_chunks(search):
+    while search.chunk_timer.isActive():
+        search.run_chunk()
+
+
+def test_fetches_capped_matches_by_chunks(qapp):
+    tree_view = TreeView()
+    search = Search(tree_view, 0, 10, fetch_chunk_size=4, fetch_limit=10)
+    search.text_changed("x")
+    search.search_now()
+
+    fetched = []
+    while search.chunk_timer.isActive():
+        search.run_chunk()
+        fetched.append(len(tree_view.source_model.fetched))
+
+    assert max(b - a for a, b in zip(fetched, fetched[1:])) <= 4
+    assert tree_view.source_model.fetched == [f"Values/x{i}" for i in range(10)]
+    assert [(p, len(refs)) for p, refs in tree_view.results] == [("x", 25)]
+
+
+def test_new_query_cancels_fetches(qapp):
+    tree_view = TreeView()
+    search = Search(tree_view, 0, 10, fetch_chunk_size=4, fetch_limit=10)
+    search.text_changed("x")
+    search.search_now()
+    for _ in range(5):
+        search.run_chunk()
+    assert tree_view.source_model.fetched
+
+    search.text_changed("y")
+    search.search_now()
+    run_chunks(search)
+
+    fetched = tree_view.source_model.fetched
+    assert len([path for path in fetched if "/x" in path]) < 10
+    assert len([path for path in fetched if "/y" in path]) == 10
+    assert [p for p, _ in tree_view.results] == ["y"]
@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PropertyEditor.config import Config  # noqa: E402
+from PropertyEditor.model.model import Model  # noqa: E402
+from PropertyEditor.model.proxy import SortProxy  # noqa: E402
+from PropertyEditor.properties._meta import ContainerPropertyItem  # noqa: E402
+
+from .entity_lib import array, integer, map_, object_  # noqa: E402
+
+
+class App:
+    config = Config()
+
+
+def sorted_names(model, source_index):
+    proxy = SortProxy()
+    proxy.setSourceModel(model)
+    proxy.sort(0)
+    index = proxy.mapFromSource(source_index)
+    return [
+        model.get_item(proxy.mapToSource(proxy.index(row, 0, index))).name
+        for row in range(proxy.rowCount(index))
+    ]
+
+
+def test_rows_sorted_by_natural_keys(qapp):
+    keys = ["Item10", "b", "Item2", "10", "9"]
+    node = object_(
+        "SortValuesRoot", {"Values": map_({key: integer() for key in keys})}
+    ).instance()
+    root = ContainerPropertyItem(None, node, "Property", "Value")
+    root.get_child_items()
+    model = Model(App(), root)
+    values_index = model.fetch_path("Values")
+    model.fetch_all(values_index)
+
+    assert sorted_names(model, values_index) == ["9", "10", "Item2", "Item10", "b"]
+
+
+def test_renamed_children_sorted_by_index(qapp):
+    node = object_(
+        "SortArrayRoot", {"Orientation": array([0.0, 0.0, 0.0, 1.0], "Orientation")}
+    ).instance()
+    root = ContainerPropertyItem(None, node, "Property", "Value")
+    root.get_child_items()
+    model = Model(App(), root)
+    index = model.fetch_path("Orientation")
+    model.fetch_all(index)
+
+    assert sorted_names(model, index) == ["X", "Y", "Z", "W"]
@@ -0,0 +1,80 @@
+import pytest
+
+pytest.importorskip("PySide2")
+
+from PropertyEditor.config import Config  # noqa: E402
+from PropertyEditor.model.model import Model  # noqa: E402
+from PropertyEditor.model.resources import RoleResources  # noqa: E402
+from PropertyEditor.properties._meta import ContainerPropertyItem  # noqa: E402
+from PropertyEditor.utils import PathTrie  # noqa: E402
+from PropertyEditor.widgets.treeview import TreeView  # noqa: E402
+
+from .entity_lib import integer, map_, object_  # noqa: E402
+
+
+class App:
+    config = Config()
+    resources = RoleResources()
+
+
+@pytest.fixture
+def tree_view(qapp):
+    node = object_(
+        "TreeViewRoot",
+        {
+            "Values": map_(
+                {
+                    "a/b": map_({"x": map_({"y": integer(1)})}),
+                    "c": map_({"z": integer(2)}),
+                }
+            ),
+            "Other": integer(0),
+        },
+    ).instance()
+    root = ContainerPropertyItem(None, node, "Property", "Value")
+    root.get_child_items()
+    return TreeView(Model(App(), root))
+
+
+def row(tree_view, *names):
+    model = tree_view.model()
+    index = model.mapFromSource(tree_view.source_model.root_index())
+    for name in names:
+        rows = (model.index(i, 0, index) for i in range(model.rowCount(index)))
+        index = next(i for i in rows if tree_view.get_item(i).name == name)
+    return index
+
+
+def test_expand_subtree_up_to_depth(tree_view):
+    signals = []
+    tree_view.expanded.connect(signals.append)
+
+    tree_view.expand_subtree(row(tree_view, "Values"), depth=1)
+
+    assert sorted(tree_view.get_expanded()) == [
+        ("Values",),
+        ("Values", "a/b"),
+        ("Values", "c"),
+    ]
+    assert not signals
+
+
+def test_expand_all_levels(tree_view):
+    tree_view.expand_subtree(row(tree_view, "Values"))
+
+    assert ("Values", "a/b", "x") in list(tree_view.get_expanded())
+    assert tree_view.column_widths.is_shown(
+        tree_view.get_item(row(tree_view, "Values", "a/b", "x"))
+    )
+
+
+def test_set_expanded_restores_names_holding_slashes(tree_view):
+    tree_view.expand_subtree(row(tree_view, "Values"))
+    expanded = tree_view.get_expanded()
+    tree_view.collapseAll()
+    assert not len(tree_view.get_expanded())
+
+    tree_view.set_expanded(PathTrie(expanded))
+
+    assert sorted(tree_view.get_expanded()) == sorted(expanded)
+    assert tree_view.isExpanded(row(tree_view, "Values", "a/b"))
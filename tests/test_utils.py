@@ -0,0 +1,91 @@
+import os
+
+from PropertyEditor.utils import PathTrie, StatCache, natural_sort_key
+
+
+def test_siblings_answered_by_one_listing(tmp_path, monkeypatch):
+    for name in ("a.entity", "b.entity"):
+        (tmp_path / name).write_text("{}")
+    (tmp_path / "sub").mkdir()
+
+    listed = []
+    scandir = os.scandir
+
+    def count_listings(path):
+        listed.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", count_listings)
+    cache = StatCache()
+
+    assert cache.is_file(tmp_path / "a.entity")
+    assert cache.is_file(tmp_path / "b.entity")
+    assert not cache.is_file(tmp_path / "c.entity")
+    assert not cache.is_file(tmp_path / "sub")
+    assert cache.is_dir(tmp_path / "sub")
+    assert len(listed) == 1
+    assert (cache.counter.hits, cache.counter.misses) == (4, 1)
+
+
+def test_listings_expire_and_are_invalidated(tmp_path):
+    cache = StatCache(ttl=60.0)
+    path = tmp_path / "new.entity"
+    assert not cache.is_file(path)
+
+    path.write_text("{}")
+    assert not cache.is_file(path)
+
+    cache.invalidate(path)
+    assert cache.is_file(path)
+
+    path.unlink()
+    cache.ttl = 0.0
+    assert not cache.is_file(path)
+
+
+def test_missing_directory(tmp_path):
+    cache = StatCache()
+
+    assert not cache.is_file(tmp_path / "missing" / "a.entity")
+    assert not cache.is_dir(tmp_path / "missing" / "sub")
+
+
+def test_path_trie_matches_whole_names():
+    matches = PathTrie(["Components/Foo/Position/0", "Components/Bar"])
+
+    assert matches.contains_descendant("Components/Foo")
+    assert matches.contains_descendant("Components/Foo/Position/0")
+    assert not matches.contains_descendant("Components/Foo2")
+    assert not matches.contains_descendant("Components/Fo")
+
+    assert matches.contains_ancestor("Components/Bar/Value")
+    assert not matches.contains_ancestor("Components/Foo")
+    assert not matches.contains_ancestor("Components/Bar2")
+
+
+def test_path_trie_iterates_parents_first():
+    paths = PathTrie(["A/B/C", "A", "A/B", "D", "A"])
+
+    assert len(paths) == 4
+    order = list(paths)
+    assert sorted(order) == [("A",), ("A", "B"), ("A", "B", "C"), ("D",)]
+    assert order.index(("A",)) < order.index(("A", "B")) < order.index(("A", "B", "C"))
+
+
+def test_empty_path_trie_matches_nothing():
+    assert not PathTrie().contains_descendant("A")
+    assert not PathTrie().contains_ancestor("A")
+
+
+def test_natural_sort_of_mixed_names():
+    names = ["Item10", "b", "Item2", "10", "9", "Item2b", "a"]
+
+    assert sorted(names, key=natural_sort_key) == [
+        "9",
+        "10",
+        "Item2",
+        "Item2b",
+        "Item10",
+        "a",
+        "b",
+    ]
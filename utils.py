@@ -1,4 +1,24 @@
+import os
+import re
 import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+
+_DIGITS = re.compile(r"([0-9]+)")
+
+
+def natural_sort_key(value: Any) -> Tuple[Tuple[int, Union[int, str]], ...]:
+    """Get a key sorting numbers in a string by value, so "Item2" is before "Item10".
+
+    Each part is (0, number) or (1, text), so a number is never compared to a text.
+    """
+    if value is None:
+        return ()
+    return tuple(
+        (0, int(part)) if i % 2 else (1, part)
+        for i, part in enumerate(_DIGITS.split(str(value)))
+        if part
+    )
 
 
 def timer(func):
@@ -9,3 +29,152 @@ def timer(func):
         return result
 
     return internal
+
+
+class CacheCounter:
+    """Count hits and misses of a cache."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+
+    def hit(self) -> None:
+        self.hits += 1
+
+    def miss(self) -> None:
+        self.misses += 1
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"{self.name}: {self.hits} hits | {self.misses} misses"
+
+
+class StatCache:
+    """Cache of files existence, shared by the whole application.
+
+    Checking a path lists its whole directory at once with os.scandir(),
+    so its siblings are answered without touching the disk again.
+    Listings expire after ttl seconds, to see files created by other tools.
+    """
+
+    def __init__(self, ttl: float = 10.0):
+        self.ttl = ttl
+        self.counter = CacheCounter("Stat cache")
+
+        # Directory -> (listing time, {entry name: is a directory})
+        # None as entries means the directory doesn't exist
+        self._directories: Dict[str, Tuple[float, Optional[Dict[str, bool]]]] = {}
+
+    @staticmethod
+    def _normalize(path: Union[str, os.PathLike]) -> str:
+        return os.path.normcase(os.path.abspath(os.fspath(path)))
+
+    def _get_entries(self, directory: str) -> Optional[Dict[str, bool]]:
+        listing = self._directories.get(directory)
+        if listing and time.monotonic() - listing[0] < self.ttl:
+            self.counter.hit()
+            return listing[1]
+
+        self.counter.miss()
+        try:
+            with os.scandir(directory) as entries:
+                result = {os.path.normcase(e.name): e.is_dir() for e in entries}
+        except OSError:
+            result = None
+
+        self._directories[directory] = (time.monotonic(), result)
+        return result
+
+    def _get_entry(self, path: Union[str, os.PathLike]) -> Optional[bool]:
+        directory, name = os.path.split(self._normalize(path))
+        entries = self._get_entries(directory)
+        if entries is None:
+            return None
+        return entries.get(name)
+
+    def is_file(self, path: Union[str, os.PathLike]) -> bool:
+        return self._get_entry(path) is False
+
+    def is_dir(self, path: Union[str, os.PathLike]) -> bool:
+        return self._get_entry(path) is True
+
+    def invalidate(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """Forget the listing of a path's directory, or all listings."""
+        if path is None:
+            self._directories.clear()
+        else:
+            self._directories.pop(os.path.dirname(self._normalize(path)), None)
+
+
+stat_cache = StatCache()
+
+
+class PathTrie:
+    """Set of paths, answering ancestor queries in O(depth).
+
+    Paths are "/" separated strings, like node refs, or sequences of names
+    which can hold "/", like map keys.
+    """
+
+    # Key marking the end of a path in a trie node, can't be a path name
+    _END = None
+
+    def __init__(self, paths: Iterable[Union[str, Sequence[str]]] = ()):
+        self._root: dict = {}
+        self._count = 0
+        for path in paths:
+            self.add(path)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Tuple[str, ...]]:
+        """Iterate held paths as tuples of names, parents before their children."""
+        nodes = [((), self._root)]
+        while nodes:
+            path, node = nodes.pop()
+            if self._END in node:
+                yield path
+            for name, child in node.items():
+                if name is not self._END:
+                    nodes.append((path + (name,), child))
+
+    @staticmethod
+    def _split(path: Union[str, Sequence[str]]) -> Sequence[str]:
+        if isinstance(path, str):
+            return [name for name in path.split("/") if name]
+        return path
+
+    def add(self, path: Union[str, Sequence[str]]) -> None:
+        node = self._root
+        for name in self._split(path):
+            node = node.setdefault(name, {})
+        if self._END not in node:
+            node[self._END] = True
+            self._count += 1
+
+    def contains_descendant(self, path: Union[str, Sequence[str]]) -> bool:
+        """Does the trie hold the path, or one of its descendants."""
+        node = self._root
+        for name in self._split(path):
+            node = node.get(name)
+            if node is None:
+                return False
+        return bool(self._count)
+
+    def contains_ancestor(self, path: Union[str, Sequence[str]]) -> bool:
+        """Does the trie hold the path, or one of its ancestors."""
+        node = self._root
+        if self._END in node:
+            return True
+        for name in self._split(path):
+            node = node.get(name)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
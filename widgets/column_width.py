@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple, TYPE_CHECKING
+
+from PySide2.QtGui import QFont, QFontMetrics
+
+if TYPE_CHECKING:
+    from PropertyEditor.properties._meta import BaseItem
+
+
+class ColumnWidths:
+    """Width of the names shown in column 0, updated row by row.
+
+    Names are measured once when their rows are shown, and counted by depth,
+    so the widest one is known without measuring every visible row again
+    as QTreeView.resizeColumnToContents() does.
+    Names are measured with the bold font, the widest one a row can use.
+    """
+
+    def __init__(self, indentation: int):
+        """Initialize."""
+        self.indentation = indentation
+        self.font_metrics: Optional[QFontMetrics] = None
+
+        # Shown parent -> (depth of its children, {child: name width})
+        self._shown: Dict[BaseItem, Tuple[int, Dict[BaseItem, int]]] = {}
+
+        # Depth -> count of each name width at that depth
+        self._depths: Dict[int, Counter] = {}
+
+        # Cached column width, None when it needs to be computed again
+        self._width: Optional[int] = None
+
+    def set_font(self, font: QFont) -> None:
+        self.font_metrics = QFontMetrics(font)
+        self.clear()
+
+    def is_shown(self, parent: BaseItem) -> bool:
+        return parent in self._shown
+
+    def add_rows(self, parent: BaseItem, depth: int, items: Iterable[BaseItem]) -> None:
+        """Measure rows shown under a parent."""
+        widths = self._shown.setdefault(parent, (depth, {}))[1]
+        counter = self._depths.setdefault(depth, Counter())
+        for item in items:
+            if item in widths:
+                continue
+
+            width = self.font_metrics.horizontalAdvance(item.get_name() or "")
+            widths[item] = width
+            counter[width] += 1
+
+            if self._width is not None:
+                self._width = max(self._width, self.indentation * (depth + 1) + width)
+
+    def remove_rows(self, parent: BaseItem, items: Iterable[BaseItem]) -> None:
+        """Forget rows removed or hidden under a parent."""
+        shown = self._shown.get(parent)
+        if not shown:
+            return
+
+        depth, widths = shown
+        counter = self._depths[depth]
+        for item in items:
+            width = widths.pop(item, None)
+            if width is None:
+                continue
+
+            counter[width] -= 1
+            if not counter[width]:
+                del counter[width]
+                # The widest name may be gone
+                self._width = None
+
+    def hide(self, parent: BaseItem) -> None:
+        """Forget all the rows under a collapsed parent."""
+        shown = self._shown.get(parent)
+        if shown:
+            self.remove_rows(parent, list(shown[1]))
+            del self._shown[parent]
+
+    def get_width(self) -> int:
+        """Get the width of the widest name, with its indentation."""
+        if self._width is None:
+            self._width = max(
+                (
+                    self.indentation * (depth + 1) + max(counter)
+                    for depth, counter in self._depths.items()
+                    if counter
+                ),
+                default=0,
+            )
+        return self._width
+
+    def clear(self) -> None:
+        self._shown.clear()
+        self._depths.clear()
+        self._width = None
@@ -3,6 +3,7 @@ from pathlib import Path
 from PySide2 import QtCore, QtWidgets
 
 from PropertyEditor.model.model import Model
+from PropertyEditor.model.search import Search
 from PropertyEditor.widgets.treeview import TreeView
 
 DEFAULT_DIR_KEY = "default_dir"
@@ -107,9 +108,16 @@ class Tab(QtWidgets.QWidget):
                 self.overrides_selector.currentText()
             )
         )
-        self.search_bar.returnPressed.connect(
-            lambda: self.tree_view.set_search_filter(self.search_bar.text())
+        config = model.app.config
+        self.search = Search(
+            self.tree_view,
+            config.search_delay,
+            config.search_chunk_size,
+            config.search_fetch_chunk_size,
+            config.search_fetch_limit,
         )
+        self.search_bar.textChanged.connect(self.search.text_changed)
+        self.search_bar.returnPressed.connect(self.search.search_now)
         self.current_dir = QtCore.QDir()
 
     # def open_property_at_path(self, property_path: str) -> None:
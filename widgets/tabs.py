@@ -28,8 +28,12 @@ class Tabs(QtWidgets.QTabWidget):
         self.removeTab(self.currentIndex())
 
     def removeTab(self, index: int) -> None:
-        if not self.widget(index).valid_remove():
+        widget = self.widget(index)
+        if not widget.valid_remove():
             return
+
+        widget.search.cancel()
+        widget.tree_view.save_expanded_state()
         super().removeTab(index)
 
     def clear(self) -> None:
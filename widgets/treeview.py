@@ -1,18 +1,28 @@
 from __future__ import annotations
 
 import contextlib
+import json
 import os
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
 
 from PySide2 import QtCore, QtGui, QtWidgets
 
 from PropertyEditor.model.delegate import Delegate
+from PropertyEditor.model.filter import FilterEngine, VisibilityChange
 from PropertyEditor.model.model import Model
-from PropertyEditor.model.proxy import Proxy
+from PropertyEditor.model.proxy import Proxy, SortProxy
+from PropertyEditor.utils import PathTrie, stat_cache
+from PropertyEditor.widgets.column_width import ColumnWidths
 
 if TYPE_CHECKING:
     from PropertyEditor.app import PropertyEditorApp
+    from PropertyEditor.properties._meta import BaseItem
+
+# Decoration and margins around the names of column 0, and some padding
+NAME_PADDING = 30
 
 
 class TreeView(QtWidgets.QTreeView):
@@ -20,11 +30,44 @@ class TreeView(QtWidgets.QTreeView):
         """Initialize."""
         QtWidgets.QTreeView.__init__(self, parent=parent)
 
-        self.proxy_model = Proxy(self)
-        self.setModel(self.proxy_model)
-        self.proxy_model.setSourceModel(model)
+        # Persistent indexes of the editors opened around the viewport
+        # in "persistent" editor mode, by item, see update_editor_window()
+        self.window_editors: Dict[BaseItem, QtCore.QPersistentModelIndex] = {}
+        self.editor_window_timer = QtCore.QTimer(self)
+        self.editor_window_timer.setSingleShot(True)
+        self.editor_window_timer.timeout.connect(self.update_editor_window)
 
-        self.setItemDelegate(Delegate())
+        # Names of the shown rows, measured once to fit column 0, see adjust_columns()
+        self.column_widths = ColumnWidths(self.indentation())
+
+        # Rows saved for the loaded file were expanded, see restore_expanded_state()
+        self.expanded_restored = False
+
+        # Rows filtered by the model's FilterEngine only need to be sorted
+        if model.app.config.filter_engine == "model":
+            self.proxy_model = SortProxy(self)
+        else:
+            self.proxy_model = Proxy(self)
+        # Set first, as setting the view's model already changes the current index
+        self.proxy_model.setSourceModel(model)
+        self.setModel(self.proxy_model)
+        self.column_widths.set_font(self.app.resources.get_font(bold=True))
+        self.show_column_rows()
+
+        # Connected after the proxy, to hide rows once the proxy maps them
+        if self.filter_engine:
+            model.rowsInserted.connect(self.source_rows_inserted)
+            model.rowsAboutToBeRemoved.connect(self.source_rows_about_to_be_removed)
+            model.rowsRemoved.connect(self.source_rows_removed)
+            model.modelReset.connect(self.filter_engine.reset)
+
+        # Persistent indexes of the editors created on hover or focus
+        # in "paint" editor mode, by item and least recently used first
+        self.live_editors = OrderedDict()
+
+        delegate = Delegate()
+        delegate.paint_only = self.paint_only
+        self.setItemDelegate(delegate)
         self.set_index_editable()
         self.adjust_columns()
         self.proxy_model.sort(0)
@@ -43,8 +86,22 @@ class TreeView(QtWidgets.QTreeView):
 
         self.last_column_width = None
 
+        # Measured before set_index_editable() adjusts the columns
+        self.expanded.connect(self.show_column_rows)
+        self.collapsed.connect(self.hide_column_rows)
         self.expanded.connect(self.set_index_editable)
-        self.collapsed.connect(self.set_not_editable)
+        self.collapsed.connect(self.set_index_editable)
+        self.verticalScrollBar().valueChanged.connect(self.fetch_visible_rows)
+        self.verticalScrollBar().valueChanged.connect(self.schedule_editor_window)
+        self.proxy_model.layoutChanged.connect(self.schedule_editor_window)
+        self.proxy_model.modelReset.connect(self.schedule_editor_window)
+        self.proxy_model.modelReset.connect(self.column_widths_reset)
+
+        if self.paint_only:
+            self.setMouseTracking(True)
+            self.entered.connect(self.open_live_editor)
+
+        self.restore_expanded_state()
 
     @property
     def source_model(self) -> Model:
@@ -54,63 +111,275 @@ class TreeView(QtWidgets.QTreeView):
     def app(self) -> PropertyEditorApp:
         return self.source_model.app
 
+    @property
+    def filter_engine(self) -> Optional[FilterEngine]:
+        """Get the model's filter engine, or None when the proxy filters rows."""
+        if self.app.config.filter_engine == "model":
+            return self.source_model.filter_engine
+        return None
+
+    @property
+    def paint_only(self) -> bool:
+        """Get if editors are painted by the Delegate until hovered or focused."""
+        return self.app.config.editor_mode == "paint"
+
+    def schedule_editor_window(self, *args) -> None:
+        """Update the editors around the viewport once pending events are processed.
+
+        Many expands, scrolls or inserted rows in a row only update them once.
+        """
+        if not self.paint_only:
+            self.editor_window_timer.start()
+
+    def update_editor_window(self) -> None:
+        """Open editors of the rows in the viewport and a margin, close the others.
+
+        Closed editors go back to the EditorPool, see Delegate.destroyEditor().
+        """
+        margin = self.app.config.editor_window_margin
+        index = self.indexAt(QtCore.QPoint(0, 0))
+        if not index.isValid():
+            index = self.model().index(0, 0)
+        for _ in range(margin):
+            above = self.indexAbove(index)
+            if not above.isValid():
+                break
+            index = above
+
+        window = {}
+        height = self.viewport().height()
+        rows_below = 0
+        while index.isValid() and rows_below <= margin:
+            if self.visualRect(index).top() > height:
+                rows_below += 1
+            item = self.get_source_item(self.get_source_index(index))
+            window[item] = self.proxy_model.ensure_column_1(index)
+            index = self.indexBelow(index)
+
+        for item, old_index in self.window_editors.items():
+            if item not in window and old_index.isValid():
+                self.closePersistentEditor(QtCore.QModelIndex(old_index))
+
+        for index in window.values():
+            if not self.isPersistentEditorOpen(index):
+                self.openPersistentEditor(index)
+
+        self.window_editors = {
+            item: QtCore.QPersistentModelIndex(index) for item, index in window.items()
+        }
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self.schedule_editor_window()
+
+    def open_live_editor(self, index: QtCore.QModelIndex) -> None:
+        """Create the editor of a hovered or current row.
+
+        Only Config.max_live_editors are kept, the least recently used are closed
+        and painted by the Delegate again.
+        """
+        index = self.proxy_model.ensure_column_1(index)
+        if not index.isValid():
+            return
+
+        item = self.get_source_item(self.get_source_index(index))
+        self.live_editors.pop(item, None)
+        self.live_editors[item] = QtCore.QPersistentModelIndex(index)
+        if not self.isPersistentEditorOpen(index):
+            self.openPersistentEditor(index)
+
+        # The current row keeps its editor while being edited
+        current = self.proxy_model.ensure_column_1(self.currentIndex())
+        for old_item, old_index in list(self.live_editors.items()):
+            if len(self.live_editors) <= self.app.config.max_live_editors:
+                break
+            elif old_index == current:
+                continue
+
+            del self.live_editors[old_item]
+            if old_index.isValid():
+                self.closePersistentEditor(QtCore.QModelIndex(old_index))
+
+    def currentChanged(
+        self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex
+    ) -> None:
+        super().currentChanged(current, previous)
+        if self.paint_only and current.isValid():
+            self.open_live_editor(current)
+
+    def get_source_item(self, source_index: QtCore.QModelIndex) -> BaseItem:
+        return self.source_model.get_item(source_index) or self.source_model.loaded_item
+
+    def source_rows_inserted(
+        self, parent: QtCore.QModelIndex, first: int, last: int
+    ) -> None:
+        self.apply_visibility(
+            self.filter_engine.rows_inserted(self.get_source_item(parent), first, last)
+        )
+
+    def source_rows_about_to_be_removed(
+        self, parent: QtCore.QModelIndex, first: int, last: int
+    ) -> None:
+        self.filter_engine.rows_about_to_be_removed(
+            self.get_source_item(parent), first, last
+        )
+
+    def source_rows_removed(
+        self, parent: QtCore.QModelIndex, first: int, last: int
+    ) -> None:
+        self.apply_visibility(
+            self.filter_engine.rows_removed(self.get_source_item(parent), first, last)
+        )
+
+    def apply_visibility(self, changes: List[VisibilityChange]) -> None:
+        """Hide or show rows filtered by the filter engine."""
+        for parent, row, hidden in changes:
+            parent_index = self.source_model.index_from_item(parent)
+            index = self.model().mapFromSource(
+                self.source_model.index(row, 0, parent_index)
+            )
+            self.setRowHidden(index.row(), index.parent(), hidden)
+
+        # Rows shown again in the viewport need their editor
+        if changes:
+            self.schedule_editor_window()
+
     def get_window(self):
         widget = self.parent()
         while widget.parent():
             widget = widget.parent()
         return widget
 
+    def rowsAboutToBeRemoved(
+        self, parent: QtCore.QModelIndex, first: int, last: int
+    ) -> None:
+        model = self.model()
+        rows = [model.index(row, 0, parent) for row in range(first, last + 1)]
+        for index in rows:
+            self.hide_column_rows(index)
+        self.column_widths.remove_rows(
+            self.get_item(parent), [self.get_item(index) for index in rows]
+        )
+
+        super().rowsAboutToBeRemoved(parent, first, last)
+
     def rowsRemoved(self, parent: QtCore.QModelIndex, first: int, last: int) -> None:
         super().rowsRemoved(parent, first, last)
 
+        # Rows below move up in the viewport
+        self.schedule_editor_window()
+
+    def rowsInserted(self, parent: QtCore.QModelIndex, first: int, last: int) -> None:
+        super().rowsInserted(parent, first, last)
+
+        # Rows of collapsed items are measured when expanded
+        parent_item = self.get_item(parent)
+        if self.column_widths.is_shown(parent_item):
+            model = self.model()
+            items = [
+                self.get_item(model.index(row, 0, parent))
+                for row in range(first, last + 1)
+            ]
+            self.column_widths.add_rows(parent_item, self.get_depth(parent), items)
+            self.adjust_columns()
+
+        # Rows of collapsed items get their editors when expanded
+        if parent.isValid() and not self.isExpanded(parent):
+            return
+
+        # Rows added by fetching a new page, see fetch_visible_rows()
+        self.schedule_editor_window()
+
+    def fetch_visible_rows(self, *args) -> None:
+        """Build the next child items of an expanded row when its last row is visible.
+
+        QTreeView only does it when scrolling to the very bottom of the view.
+        """
+        model = self.model()
+        index = self.indexAt(QtCore.QPoint(0, self.viewport().height() - 1))
+        while index.isValid():
+            parent = index.parent()
+            if index.row() != model.rowCount(parent) - 1:
+                break
+            elif model.canFetchMore(parent):
+                model.fetchMore(parent)
+                break
+            index = parent
+
     def adjust_columns(self) -> None:
-        """Adjust column 0 to minimum size."""
+        """Fit column 0 to the widest shown name, only resized when it changes."""
+        width = max(150, self.column_widths.get_width() + NAME_PADDING)
+        if width != self.columnWidth(0):
+            self.setColumnWidth(0, width)
+
+    @staticmethod
+    def get_depth(index: QtCore.QModelIndex) -> int:
+        """Get depth of the children of an index, 0 for the root's children."""
+        depth = 0
+        while index.isValid():
+            index = index.parent()
+            depth += 1
+        return depth
+
+    def get_item(self, index: QtCore.QModelIndex) -> BaseItem:
+        """Get the item of a view index, the root item for the root index."""
+        return self.get_source_item(self.get_source_index(index))
+
+    def show_column_rows(self, index: Optional[QtCore.QModelIndex] = None) -> None:
+        """Measure names of the rows shown by expanding an index, see ColumnWidths.
+
+        Rows of its children still expanded are shown again too.
+        """
+        model = self.model()
+        parents = [index if index is not None else QtCore.QModelIndex()]
+        while parents:
+            parent = parents.pop()
+            rows = [model.index(i, 0, parent) for i in range(model.rowCount(parent))]
+
+            # Children of a shown parent can have been expanded without signals,
+            # see expand_subtree()
+            parent_item = self.get_item(parent)
+            if not self.column_widths.is_shown(parent_item):
+                items = [self.get_item(row) for row in rows]
+                self.column_widths.add_rows(parent_item, self.get_depth(parent), items)
+            parents.extend(row for row in rows if self.isExpanded(row))
+
+        self.adjust_columns()
 
-        self.resizeColumnToContents(0)
+    def hide_column_rows(self, index: QtCore.QModelIndex) -> None:
+        """Forget names of the rows hidden by collapsing or removing an index."""
+        model = self.model()
+        parents = [index]
+        while parents:
+            parent = parents.pop()
+            parent_item = self.get_item(parent)
+            if not self.column_widths.is_shown(parent_item):
+                continue
+
+            self.column_widths.hide(parent_item)
+            for row in range(model.rowCount(parent)):
+                child = model.index(row, 0, parent)
+                if self.isExpanded(child):
+                    parents.append(child)
 
-        # Add a padding to the first column by increasing its size
-        self.setColumnWidth(0, 15 + self.columnWidth(0))
+        self.adjust_columns()
 
-        width = self.columnWidth(0)
-        if width < 150:
-            self.setColumnWidth(0, 150)
+    def column_widths_reset(self) -> None:
+        self.column_widths.clear()
+        self.show_column_rows()
 
     def get_source_index(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex:
         """Get source index."""
         return self.model().mapToSource(index)
 
-    def set_index_editable(
-        self, index: QtCore.QModelIndex = None, edit: bool = True
-    ) -> None:
+    def set_index_editable(self, *args) -> None:
+        """Update editors once rows were expanded, collapsed, reverted or filtered.
 
-        if not index:
-            index = QtCore.QModelIndex()
-        else:
-            index = self.model().ensure_proxy_index(index)
-
-        # parent_index.column() can be -1 or 0 in this method
-        # When it's 0 we want to ensure that the persistent editor is opened
-        # for that we need to get related column 1 index
-        # When it's -1 that means we work with the root model item that have no editor
-        index_col_1 = self.proxy_model.ensure_column_1(index)
-        if not self.isPersistentEditorOpen(index_col_1):
-            self.openPersistentEditor(index_col_1)
-
-        # Here the index needs to have a column() == 0
-        # otherwise rowCount() returns 0 for whatever reason...
-        for row in range(self.model().rowCount(index)):
-            child_index = self.model().index(row, 1, index)
-            if edit:
-                self.openPersistentEditor(child_index)
-            else:
-                self.closePersistentEditor(child_index)
+        Only the rows around the viewport get one, see update_editor_window().
+        """
+        self.schedule_editor_window()
         self.adjust_columns()
 
-    def set_not_editable(self, index: QtCore.QModelIndex = None) -> None:
-        """Set an index as not editable."""
-        if self.isPersistentEditorOpen(index):
-            self.set_index_editable(index, edit=False)
-
     def update_row(self, parent_index: QtCore.QModelIndex, row: int) -> None:
         source_index = self.source_model.index(row, 0, parent_index)
         proxy_index = self.model().mapFromSource(source_index)
@@ -119,12 +388,8 @@ class TreeView(QtWidgets.QTreeView):
         self.expand(proxy_index.parent())
         self.expand(proxy_index)
 
-        # Then open persistent editor from column 1 as we want the editor in... column 1
-        proxy_index = proxy_index.model().index(
-            proxy_index.row(), 1, proxy_index.parent()
-        )
-
-        self.openPersistentEditor(proxy_index)
+        # Then open the editors around the viewport, the row's included
+        self.schedule_editor_window()
 
     def expand_current_cell(self) -> None:
         index = self.currentIndex()
@@ -135,16 +400,76 @@ class TreeView(QtWidgets.QTreeView):
         self.expand(index)
 
     def expand_cell_and_children(self) -> None:
-        self.expandRecursively(self.currentIndex(), depth=3)
+        self.expand_subtree(self.currentIndex(), depth=3)
 
-        # Need to expand two times to make it work
-        # Otherwise only the first child element is expanded
-        self.expandRecursively(self.currentIndex(), depth=3)
-        self.adjust_columns()
+    def expand_cell_and_all_children(self) -> None:
+        self.expand_subtree(self.currentIndex())
+
+    @contextlib.contextmanager
+    def updates_suspended(self):
+        """Suspend painting and signals like expanded(), to apply many changes."""
+        self.setUpdatesEnabled(False)
+        blocked = self.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.blockSignals(blocked)
+            self.setUpdatesEnabled(True)
+
+    def expand_subtree(
+        self, index: QtCore.QModelIndex, depth: Optional[int] = None
+    ) -> None:
+        """Expand an index and its children up to depth levels, or all of them.
+
+        Child items are built first in one pass, which can be canceled.
+        Then all the indexes are expanded at once, without the expanded() signal,
+        and columns and editors are updated once.
+        """
+        model = self.model()
+        index = index.sibling(index.row(), 0) if index.isValid() else index
+
+        progress = QtWidgets.QProgressDialog("Expanding...", "Cancel", 0, 0, self)
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(500)
+
+        to_expand = []
+        parents = [(index, 0)]
+        while parents and not progress.wasCanceled():
+            parent, level = parents.pop()
+            self.source_model.ensure_fetched(self.get_source_index(parent))
+            row_count = model.rowCount(parent)
+            if not row_count:
+                continue
+
+            to_expand.append(parent)
+            if depth is None or level < depth:
+                parents.extend(
+                    (model.index(row, 0, parent), level + 1) for row in range(row_count)
+                )
+
+            # Updating the dialog processes events, so not for every index
+            if len(to_expand) % 100 == 0:
+                progress.setMaximum(len(to_expand) + len(parents))
+                progress.setValue(len(to_expand))
+
+        canceled = progress.wasCanceled()
+        progress.close()
+        progress.deleteLater()
+        if canceled:
+            return
+
+        # Parents come first, expanded before their children
+        with self.updates_suspended():
+            for parent in to_expand:
+                self.expand(parent)
 
-    def expand_filtered_and_parents(self, filtered: List[QtCore.QModelIndex]) -> None:
+        self.show_column_rows(index)
+        self.set_index_editable()
+
+    def expand_filtered_and_parents(self, filtered: Set[BaseItem]) -> None:
         if filtered:
-            for index in filtered:
+            for item in filtered:
+                index = self.source_model.index_from_item(item)
                 proxy_index = self.model().mapFromSource(index)
 
                 parents = []
@@ -155,12 +480,9 @@ class TreeView(QtWidgets.QTreeView):
 
                 for proxy_index in reversed(parents):
                     self.expand(proxy_index)
-        # Force all expanded items and their children to be editable
-        # otherwise when text filter is removed, some items are not.
+        # Rows shown again when the text filter is removed need their editor
         else:
-            for index in self.proxy_model.iter_indexes():
-                if self.isExpanded(index):
-                    self.set_index_editable(index)
+            self.schedule_editor_window()
 
     @contextlib.contextmanager
     def filter_update_context(self):
@@ -207,6 +529,10 @@ class TreeView(QtWidgets.QTreeView):
             expand_all.triggered.connect(self.expand_cell_and_children)
             menu.addAction(expand_all)
 
+            expand_all_levels = QtWidgets.QAction("Expand all levels")
+            expand_all_levels.triggered.connect(self.expand_cell_and_all_children)
+            menu.addAction(expand_all_levels)
+
             collapse = QtWidgets.QAction("Collapse")
             collapse.triggered.connect(self.collapse_cell)
             menu.addAction(collapse)
@@ -240,12 +566,11 @@ class TreeView(QtWidgets.QTreeView):
                 menu.addAction(unset)
 
             prefab_history = item.get_prefab_history()
-            prefab_history.reverse()
 
             open_prefab = QtWidgets.QMenu("Open prefab", menu)
             save_to_prefab = QtWidgets.QMenu("Save to prefab", menu)
 
-            for prefab in prefab_history[1:]:
+            for prefab in prefab_history[-2::-1]:
                 prefab_icon = QtGui.QIcon(
                     self.app._get_decoration_color_for_prefab(prefab)
                 )
@@ -330,7 +655,7 @@ class TreeView(QtWidgets.QTreeView):
 
     def open_folder(self, value: str) -> None:
         path = Path(str(self.app.rawdata_path), value)
-        if path.is_file():
+        if stat_cache.is_file(path):
             path = path.parent
         os.startfile(path.as_posix())
 
@@ -377,39 +702,109 @@ class TreeView(QtWidgets.QTreeView):
         source_index = self.model().mapToSource(self.currentIndex())
         return self.source_model.get_item(source_index)
 
-    def get_expanded(self):
-        expanded = []
-        for index in self.model().persistentIndexList():
-            if self.isExpanded(index):
-                source_index = self.model().mapToSource(index)
-                prop = self.source_model.get_item(source_index)
-                expanded.append(prop.lib_property.absolute_noderef)
-
-        # As persistentIndexList is not sorted by hierarchy
-        # applying a sort on our expanded list ensure it
-        expanded.sort()
+    def get_expanded(self) -> PathTrie:
+        """Get paths of names of the expanded rows, walking only expanded rows.
 
+        Paths are tuples of names, as names like map keys can hold "/".
+        """
+        expanded = PathTrie()
+        model = self.model()
+        parents = [(QtCore.QModelIndex(), ())]
+        while parents:
+            parent, path = parents.pop()
+            for row in range(model.rowCount(parent)):
+                index = model.index(row, 0, parent)
+                if self.isExpanded(index):
+                    index_path = path + (self.get_item(index).name,)
+                    expanded.add(index_path)
+                    parents.append((index, index_path))
         return expanded
 
-    def set_expanded(self, expanded_data: list):
-        root_index = self.source_model.root_index()
-        for item in expanded_data:
-            current_index = root_index
-            for prop_part in item.split("/"):
-
-                # Reset index when expanded item has no parent
-                current_level = len(item.split("/"))
-                if current_level == 1:
-                    current_index = root_index
-
-                for i in range(self.source_model.rowCount(current_index)):
-                    index = self.source_model.index(i, 0, current_index)
-                    prop = self.source_model.get_item(index)
-                    if prop.name == prop_part:
-                        current_index = index
-                        model_index = self.model().mapFromSource(index)
-                        self.expand(model_index)
-                        break
+    def set_expanded(self, expanded: PathTrie) -> None:
+        """Expand rows from their paths of names, in one walk from the root.
+
+        Each row is found by name in its parent (see Model.fetch_child_row()),
+        whose index is kept for its children, then all rows are expanded at once.
+        """
+        source_model = self.source_model
+        indexes = {(): source_model.root_index()}
+        to_expand = []
+        for names in expanded:
+            parent_index = indexes.get(names[:-1])
+            if parent_index is None:
+                continue
+
+            row = source_model.fetch_child_row(parent_index, names[-1])
+            if row is None:
+                continue
+            indexes[names] = source_model.index(row, 0, parent_index)
+            to_expand.append(indexes[names])
+
+        # Mapped once all rows are built, as the proxy sorts them
+        with self.updates_suspended():
+            for index in to_expand:
+                self.expand(self.model().mapFromSource(index))
+
+        self.show_column_rows()
+        self.set_index_editable()
+
+    def _get_expanded_key(self) -> Optional[str]:
+        loaded_file = self.source_model.loaded_file
+        if not loaded_file:
+            return None
+        return f"{self.app.config.expanded_key}/{Path(loaded_file).as_posix()}"
+
+    def save_expanded_state(self) -> None:
+        """Save expanded rows of the loaded file, restored when it's opened again.
+
+        Saved as JSON with lists of names, as QSettings can't keep nested lists
+        on all platforms. Only the last Config.expanded_max_files files are kept.
+        """
+        key = self._get_expanded_key()
+        if not key:
+            return
+
+        paths = [list(names) for names in self.get_expanded()]
+        settings = QtCore.QSettings()
+        settings.setValue(key, json.dumps({"saved": time.time(), "paths": paths}))
+        self._prune_expanded_states(settings)
+
+    def _prune_expanded_states(self, settings: QtCore.QSettings) -> None:
+        """Remove expanded rows of the oldest files, above Config.expanded_max_files."""
+        settings.beginGroup(self.app.config.expanded_key)
+        try:
+            keys = settings.allKeys()
+            if len(keys) <= self.app.config.expanded_max_files:
+                return
+
+            saved = {}
+            for key in keys:
+                try:
+                    saved[key] = json.loads(settings.value(key))["saved"]
+                except (TypeError, ValueError, KeyError):
+                    # Saved by a previous version, removed first
+                    saved[key] = 0.0
+
+            oldest = sorted(keys, key=saved.get)
+            for key in oldest[: len(keys) - self.app.config.expanded_max_files]:
+                settings.remove(key)
+        finally:
+            settings.endGroup()
+
+    def restore_expanded_state(self) -> bool:
+        """Expand rows saved for the loaded file, and get if there were some."""
+        key = self._get_expanded_key()
+        if not key:
+            return False
+
+        try:
+            paths = json.loads(QtCore.QSettings().value(key))["paths"]
+        except (TypeError, ValueError, KeyError):
+            paths = []
+        if paths:
+            self.set_expanded(PathTrie(paths))
+        self.expanded_restored = bool(paths)
+        return self.expanded_restored
 
     @contextlib.contextmanager
     def keep_expanded(self) -> None:
@@ -437,31 +832,24 @@ class TreeView(QtWidgets.QTreeView):
 
         model = self.model()
         source_model = model.sourceModel()
-        root_property = source_model.loaded_item
 
         # Scroll from root property to awaited one
         # expanding each property in the property's path
-        current_prop = root_property
         source_index = source_model.index(-1, 0)
         for i, prop in enumerate(property_path.split("/")):
 
-            child_prop = current_prop.get_child_by_name(prop)
-            if not child_prop:
+            # Child items are created until the property is found
+            row = source_model.fetch_child_row(source_index, prop)
+            if row is None:
                 break
 
-            # Ensure child items have been created
-            child_prop._get_child_items(child_level=1)
-
             # Get model index of the child property
-            row = current_prop.get_child_index(child_prop)
             source_index = source_model.index(row, 0, source_index)
             index = model.mapFromSource(source_index)
 
             self.expand(index)
             self.scrollTo(index, hint=QtWidgets.QAbstractItemView.PositionAtTop)
 
-            current_prop = child_prop
-
     def mousePressEvent(self, event: QtGui.QMouseEvent, *args) -> None:
         if event.modifiers() == QtCore.Qt.AltModifier:
             index = self.indexAt(event.pos())
@@ -473,10 +861,27 @@ class TreeView(QtWidgets.QTreeView):
         else:
             super().mousePressEvent(event)
 
-    def set_search_filter(self, filter_: str) -> None:
-        with self.filter_update_context():
-            self.proxy_model.search_filter_updated(filter_)
+    def set_search_results(
+        self, filter_: str, node_refs: List[str], matches: PathTrie
+    ) -> None:
+        """Filter rows with the results of a search, see model.search.Search."""
+        if not self.filter_engine:
+            with self.filter_update_context():
+                self.proxy_model.set_search_results(filter_, node_refs, matches)
+            return
+
+        root = self.source_model.loaded_item
+        self.apply_visibility(self.filter_engine.set_search(root, filter_, matches))
+        if self.filter_engine.filtered:
+            self.expand_filtered_and_parents(self.filter_engine.filtered)
+        self.adjust_columns()
 
     def select_overrides_updated(self, override: str) -> None:
-        with self.filter_update_context():
-            self.proxy_model.select_overrides_updated(override)
+        if not self.filter_engine:
+            with self.filter_update_context():
+                self.proxy_model.select_overrides_updated(override)
+            return
+
+        root = self.source_model.loaded_item
+        self.apply_visibility(self.filter_engine.set_override_filter(root, override))
+        self.adjust_columns()
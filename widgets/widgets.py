@@ -49,7 +49,8 @@ class PropSize(QtWidgets.QLineEdit):
         self.setFixedWidth(40)
 
     def update(self):
-        self.setText(str(self.parent().item.not_deleted_child_count()))
+        # Child items may not all be built yet, see Model.fetchMore()
+        self.setText(str(self.parent().item.lib_property.size))
 
     def get(self):
         return int(self.text())
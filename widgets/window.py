@@ -9,7 +9,7 @@ from PySide2.QtGui import QIcon
 
 from EntityLibPy import CopyMode, OverrideValueSource
 
-from PySide2 import QtCore, QtWidgets
+from PySide2 import QtCore, QtGui, QtWidgets
 
 from PropertyEditor.model.model import Model
 from PropertyEditor.widgets.tabs import Tabs
@@ -104,6 +104,12 @@ class EditorWindow(QtWidgets.QMainWindow):
         """Clear all tabs."""
         self.tabs.clear()
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        """Save expanded rows of all tabs, as closing each of them would."""
+        for index in range(self.tabs.count()):
+            self.tabs.widget(index).tree_view.save_expanded_state()
+        super().closeEvent(event)
+
     @contextlib.contextmanager
     def keep_expanded_between_tabs(self):
 
@@ -114,8 +120,9 @@ class EditorWindow(QtWidgets.QMainWindow):
 
         yield
 
+        # A new tab already expanded the rows saved for its file
         current_tab = self.tabs.currentWidget()
-        if current_tab and expanded:
+        if current_tab and expanded and not current_tab.tree_view.expanded_restored:
             current_tab.tree_view.set_expanded(expanded)
 
     def add_tab_with_expand(self, model: Model) -> None:
@@ -271,3 +278,6 @@ class CopyData:
             copy_mode=CopyMode.CopyOverride,
             override_value_source=source_value,
         )
+        destination.structure_changed()
+        destination.invalidate_deleted_items()
+        destination.invalidate_prefab_histories()